@@ -30,8 +30,8 @@ def upgrade() -> None:
                     username VARCHAR(32) UNIQUE NOT NULL,
                     email VARCHAR(255) UNIQUE NOT NULL,
                     password TEXT NOT NULL,
-                    created_at TIMESTAMPTZ DEFAULT NOW()
-                    updated_at TIMESTAMPTZ DEFAULT NOW()
+                    created_at TIMESTAMPTZ DEFAULT NOW(),
+                    updated_at TIMESTAMPTZ DEFAULT NOW(),
                     deleted_at TIMESTAMPTZ DEFAULT NULL
                 );
 
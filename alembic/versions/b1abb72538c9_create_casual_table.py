@@ -27,7 +27,7 @@ def upgrade() -> None:
             player1_id UUID REFERENCES players(id),
             player2_id UUID REFERENCES players(id),
             winner_id UUID REFERENCES players(id),
-            played_at TIMESTAMPTZ,
+            played_at TIMESTAMPTZ
         );
 
         CREATE INDEX IF NOT EXISTS
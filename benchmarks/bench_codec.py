@@ -0,0 +1,85 @@
+"""Measures the per-message CPU cost of the WebSocket JSON codec.
+
+Compares the previous path (StandardResponse.to_dict() and the standard
+library json module, as done by WebSocket.send_json) with src.infrastructure.codec
+on a typical shot response and an incoming shoot action.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_codec
+"""
+
+import json
+import timeit
+import uuid
+from typing import Any, Callable
+
+from src.api.v1.schemas.place_ships import StandardResponse
+from src.infrastructure import codec
+
+ITERATIONS = 50_000
+
+
+def _shot_response() -> StandardResponse:
+    return StandardResponse(
+        status="hit",
+        message="You hit a ship!",
+        action="shoot_result",
+        data={
+            "game_id": uuid.uuid4(),
+            "position": "H8",
+            "ship": "destroyer",
+            "sunk": False,
+            "current_turn": uuid.uuid4(),
+            "hits": {"destroyer": ["H7", "H8"], "submarine": ["C3"]},
+        },
+    )
+
+
+def _shoot_action() -> str:
+    return json.dumps({
+        "action": "shoot",
+        "game_id": str(uuid.uuid4()),
+        "player_id": str(uuid.uuid4()),
+        "position": "H8",
+    })
+
+
+def _time(func: Callable[[], Any]) -> float:
+    """Returns the mean cost of one call in microseconds."""
+    best = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+    return best / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    """Prints the cost of each operation with both JSON implementations."""
+    response = _shot_response()
+    action = _shoot_action()
+
+    cases = [
+        (
+            "encode StandardResponse",
+            lambda: json.dumps(
+                response.to_dict(), default=str, separators=(",", ":")
+            ),
+            lambda: codec.dumps_str(response),
+        ),
+        (
+            "decode shoot action",
+            lambda: json.loads(action),
+            lambda: codec.loads(action),
+        ),
+    ]
+
+    print(f"codec backend: {codec.BACKEND}")
+    for name, baseline, candidate in cases:
+        before = _time(baseline)
+        after = _time(candidate)
+        print(
+            f"{name:<24} stdlib {before:6.2f} us  codec {after:6.2f} us  "
+            f"saved {before - after:6.2f} us/msg ({1 - after / before:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
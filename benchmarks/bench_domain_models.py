@@ -0,0 +1,214 @@
+"""Measures what the slotted domain dataclasses save over pydantic models.
+
+The baseline is the pydantic form `GameSession`, `PlayerBoard` and `Player`
+had before they became slotted dataclasses, reproduced below. For each
+operation the game path repeats per message, it reports the CPU time and the
+memory allocated per call (traced with tracemalloc), plus the size of a
+retained two player session:
+
+- building a player from an id, as the handlers did to look up an opponent;
+- building a new session, as matchmaking does;
+- loading a stored session (the binary layout decoded into the model);
+- copying a snapshot before replaying events on it;
+- one turn: load the session, flip the turn, encode it back.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_domain_models
+"""
+
+import gc
+import timeit
+import tracemalloc
+import uuid
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.domain.player import Player
+from src.infrastructure.persistence.session_codec import (
+    _HEADER,
+    STATUS_CODES,
+    _decode_board,
+    decode_session,
+    encode_session,
+)
+
+ITERATIONS = 20_000
+ALLOCATION_CALLS = 1_000
+
+
+class PydanticPlayerBoard(BaseModel):
+    """The pydantic PlayerBoard replaced by the dataclass."""
+
+    board: dict[str, list[str]] = Field(default_factory=dict)
+
+
+class PydanticGameSession(BaseModel):
+    """The pydantic GameSession replaced by the dataclass."""
+
+    game_id: uuid.UUID
+    start_datetime: int = 0
+    end_datetime: int = 0
+    players: dict[uuid.UUID, PydanticPlayerBoard]
+    current_turn: uuid.UUID | None = None
+    status: GameStatus = GameStatus.WAITING
+
+
+class PydanticPlayer(BaseModel):
+    """The pydantic Player replaced by the dataclass."""
+
+    id: Optional[uuid.UUID] = None
+    username: Optional[str] = None
+    email: Optional[str] = None
+    password: Optional[str] = Field(default=None, exclude=True)
+
+    model_config = {"extra": "forbid"}
+
+
+def _pydantic_decode(data: bytes) -> PydanticGameSession:
+    """Decodes the binary layout the way session_codec did for pydantic."""
+    _, status, player_count, flags, game_id, start, end, turn = _HEADER.unpack_from(
+        data
+    )
+    players: dict[bytes, dict[str, dict[str, list[str]]]] = {}
+    offset = _HEADER.size
+    for _ in range(player_count):
+        player_id = data[offset:offset + 16]
+        board, offset = _decode_board(data, offset + 16)
+        players[player_id] = {"board": board}
+    return PydanticGameSession.model_validate({
+        "game_id": game_id,
+        "start_datetime": start,
+        "end_datetime": end,
+        "players": players,
+        "current_turn": turn if flags & 0x01 else None,
+        "status": STATUS_CODES[status],
+    })
+
+
+def _time(func: Callable[[], Any]) -> float:
+    """Returns the mean cost of one call in microseconds."""
+    best = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+    return best / ITERATIONS * 1_000_000
+
+
+def _allocated(func: Callable[[], Any]) -> float:
+    """Returns the peak bytes allocated by one call, temporaries included."""
+    func()
+    gc.collect()
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(ALLOCATION_CALLS):
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - start
+    finally:
+        tracemalloc.stop()
+    return total / ALLOCATION_CALLS
+
+
+def _retained(func: Callable[[], Any]) -> float:
+    """Returns the bytes still held by each of many results kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = [func() for _ in range(ALLOCATION_CALLS)]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current / ALLOCATION_CALLS
+
+
+def _report(
+    name: str, baseline: Callable[[], Any], candidate: Callable[[], Any]
+) -> None:
+    """Prints the time and allocations of one operation in both forms."""
+    before, after = _time(baseline), _time(candidate)
+    before_bytes, after_bytes = _allocated(baseline), _allocated(candidate)
+    print(
+        f"{name:<16} {before:7.2f} us {before_bytes:6.0f} B  "
+        f"{after:7.2f} us {after_bytes:6.0f} B  "
+        f"cpu {1 - after / before:4.0%}  "
+        f"alloc {1 - after_bytes / before_bytes:4.0%}"
+    )
+
+
+def main() -> None:
+    """Prints the cost of each operation for both forms of the models."""
+    first, second = uuid.uuid4(), uuid.uuid4()
+    boards = {first: PlayerBoard({"destroyer": ["O14", "O15"]}), second: PlayerBoard()}
+    game = GameSession(
+        game_id=uuid.uuid4(),
+        players=boards,
+        current_turn=first,
+        status=GameStatus.IN_PROGRESS,
+    )
+    stored = encode_session(game)
+    baseline_game = _pydantic_decode(stored)
+    assert decode_session(stored) == game
+
+    def pydantic_turn() -> None:
+        session = _pydantic_decode(stored)
+        session.current_turn = second
+        encode_session(session)  # type: ignore[arg-type]
+
+    def dataclass_turn() -> None:
+        session = decode_session(stored)
+        session.current_turn = second
+        encode_session(session)
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "player from id",
+            lambda: PydanticPlayer(id=first),
+            lambda: Player(id=first),
+        ),
+        (
+            "new session",
+            lambda: PydanticGameSession(
+                game_id=game.game_id,
+                players={
+                    first: PydanticPlayerBoard(),
+                    second: PydanticPlayerBoard(),
+                },
+                status=GameStatus.PLACE_SHIP,
+            ),
+            lambda: GameSession(
+                game_id=game.game_id,
+                players={first: PlayerBoard(), second: PlayerBoard()},
+                status=GameStatus.PLACE_SHIP,
+            ),
+        ),
+        (
+            "load session",
+            lambda: _pydantic_decode(stored),
+            lambda: decode_session(stored),
+        ),
+        (
+            "copy snapshot",
+            lambda: baseline_game.model_copy(deep=True),
+            game.copy,
+        ),
+        ("one turn", pydantic_turn, dataclass_turn),
+    ]
+
+    print(f"{'':<16} {'pydantic':>19} {'dataclass':>19}")
+    for name, baseline, candidate in cases:
+        _report(name, baseline, candidate)
+
+    before_bytes = _retained(lambda: _pydantic_decode(stored))
+    after_bytes = _retained(lambda: decode_session(stored))
+    print(
+        f"{'held session':<16} {before_bytes:17.0f} B  {after_bytes:17.0f} B  "
+        f"{'':9}  mem   {1 - after_bytes / before_bytes:4.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measures the size and CPU cost of storing a GameSession in Redis.
+
+Compares the JSON encoding (to_serializable_dict() through the codec, read back
+with codec.loads and a validating from_serialized_dict) with the binary layout
+of session_codec on an in-progress two player session, as it is stored at
+`game:{id}`. It also reports the payload a turn flip writes: the whole string
+in the string layouts, only the `turn` field in the hash layout.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_session_codec
+"""
+
+import timeit
+import uuid
+from typing import Any, Callable
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.infrastructure import codec
+from src.infrastructure.persistence.session_codec import (
+    decode_session,
+    encode_session,
+    session_field_values,
+)
+
+ITERATIONS = 20_000
+
+
+def _session() -> GameSession:
+    first, second = uuid.uuid4(), uuid.uuid4()
+    return GameSession(
+        game_id=uuid.uuid4(),
+        players={first: PlayerBoard(), second: PlayerBoard()},
+        current_turn=first,
+        status=GameStatus.IN_PROGRESS,
+    )
+
+
+def _time(func: Callable[[], Any]) -> float:
+    """Returns the mean cost of one call in microseconds."""
+    best = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+    return best / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    """Prints the stored size and the cost of each session encoding."""
+    game = _session()
+    as_json = codec.dumps_str(game.to_serializable_dict())
+    as_binary = encode_session(game)
+    assert decode_session(as_binary) == game
+
+    print(f"codec backend: {codec.BACKEND}")
+    print(
+        f"{'stored size':<16} json {len(as_json):6d} B   "
+        f"binary {len(as_binary):6d} B  ({1 - len(as_binary) / len(as_json):.0%})"
+    )
+    flip = session_field_values(game, ["current_turn"])
+    flip_bytes = sum(len(field) + len(str(value)) for field, value in flip.items())
+    print(
+        f"{'turn flip write':<16} json {len(as_json):6d} B   "
+        f"binary {len(as_binary):6d} B   hash {flip_bytes:4d} B"
+    )
+    cases = [
+        (
+            "encode session",
+            lambda: codec.dumps_str(game.to_serializable_dict()),
+            lambda: encode_session(game),
+        ),
+        (
+            "decode session",
+            lambda: GameSession.from_serialized_dict(codec.loads(as_json)),
+            lambda: decode_session(as_binary),
+        ),
+    ]
+    for name, baseline, candidate in cases:
+        before = _time(baseline)
+        after = _time(candidate)
+        print(
+            f"{name:<16} json {before:6.2f} us  binary {after:6.2f} us  "
+            f"saved {before - after:6.2f} us/op ({1 - after / before:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""Load test that plays many concurrent games through the /ws/connect endpoint.
+
+Every simulated client is an independent bot: it registers, joins the
+matchmaking queue, places a fixed fleet and then alternates `shoot` and
+`pass_turn` whenever it holds the turn, until one side sinks the other. The
+report lists games/sec, messages/sec and p50/p95/p99 latency per action.
+
+With --vs-bot every client asks for a server-side bot opponent instead, and
+aims with the same probability-density model the bots use, so one client per
+game also measures the cost of running the bots.
+
+By default the clients talk to the real WebSocket handler in-process through
+ASGI, backed by the Redis configured in the settings (or by fakeredis with
+--fakeredis). With --url they connect to a running server instead, which
+needs the `websockets` package.
+
+Run from the repository root:
+
+    python -m benchmarks.load_test --games 500 --concurrency 200 --fakeredis
+    python -m benchmarks.load_test --games 500 --vs-bot --fakeredis
+    python -m benchmarks.load_test --games 2000 --url ws://localhost:8000/ws/connect
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, MutableMapping, Protocol
+
+import redis.asyncio as aioredis
+from fastapi import FastAPI
+
+from src.api import websocket_handler
+from src.config import settings
+from src.domain.board import BOARD_SIZE, CELL_NAMES, LETTERS
+from src.domain.targeting import TargetingModel
+from src.infrastructure import codec
+from src.infrastructure.redis_client import create_redis_client
+
+# The configured fleet, one ship every other row (A, C, E, ...); every client
+# places the same layout.
+FLEET: dict[str, list[str]] = {
+    ship_id: [f"{LETTERS[2 * row]}{number}" for number in range(1, length + 1)]
+    for row, (ship_id, length) in enumerate(settings.fleet.ships.items())
+}
+
+FLEET_CELLS = [cell for cells in FLEET.values() for cell in cells]
+
+Message = dict[str, Any]
+ASGIEvent = MutableMapping[str, Any]
+
+
+class Transport(Protocol):
+    """Minimal text WebSocket used by the simulated clients."""
+
+    async def connect(self) -> None:
+        """Opens the connection."""
+
+    async def send(self, text: str) -> None:
+        """Sends one text frame."""
+
+    async def receive(self) -> str | None:
+        """Returns the next text frame, or None once the connection closed."""
+
+    async def close(self) -> None:
+        """Closes the connection."""
+
+
+class ASGIWebSocket:
+    """Drives an ASGI WebSocket endpoint in-process, without a network."""
+
+    def __init__(self, app: FastAPI, path: str = "/ws/connect") -> None:
+        self.app = app
+        self.path = path
+        self._to_app: asyncio.Queue[ASGIEvent] = asyncio.Queue()
+        self._from_app: asyncio.Queue[ASGIEvent] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def connect(self) -> None:
+        """Starts the endpoint on a new connection and waits for the accept."""
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": self.path,
+            "raw_path": self.path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+            "subprotocols": [],
+            "state": {},
+        }
+        self._task = asyncio.create_task(
+            self.app(scope, self._to_app.get, self._from_app.put)
+        )
+        await self._to_app.put({"type": "websocket.connect"})
+        accepted = await self._from_app.get()
+        if accepted["type"] != "websocket.accept":
+            raise RuntimeError(f"Connection refused: {accepted}")
+
+    async def send(self, text: str) -> None:
+        """Delivers a text frame to the endpoint."""
+        await self._to_app.put({"type": "websocket.receive", "text": text})
+
+    async def receive(self) -> str | None:
+        """Returns the next frame the endpoint sent, or None if it closed."""
+        event = await self._from_app.get()
+        if event["type"] != "websocket.send":
+            return None
+        text = event.get("text")
+        return text if text is not None else event["bytes"].decode()
+
+    async def close(self) -> None:
+        """Disconnects and waits for the endpoint to return."""
+        await self._to_app.put({"type": "websocket.disconnect", "code": 1000})
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class NetworkWebSocket:
+    """Connects to a running server with the `websockets` package."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._ws: Any = None
+
+    async def connect(self) -> None:
+        """Connects to the server."""
+        import websockets  # pylint: disable=import-outside-toplevel
+
+        self._ws = await websockets.connect(self.url)
+
+    async def send(self, text: str) -> None:
+        """Sends a text frame to the server."""
+        await self._ws.send(text)
+
+    async def receive(self) -> str | None:
+        """Returns the next frame from the server, or None if it closed."""
+        try:
+            data = await self._ws.recv()
+        except Exception:
+            return None
+        return data if isinstance(data, str) else data.decode()
+
+    async def close(self) -> None:
+        """Closes the connection to the server."""
+        await self._ws.close()
+
+
+@dataclass
+class Stats:
+    """Measurements shared by every simulated client."""
+
+    latencies: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    sent: int = 0
+    received: int = 0
+    games: int = 0
+    failures: int = 0
+
+
+class SimulatedPlayer:
+    """One bot player holding its own WebSocket connection."""
+
+    def __init__(self, transport: Transport, stats: Stats, timeout: float) -> None:
+        self.player_id = str(uuid.uuid4())
+        self.transport = transport
+        self.stats = stats
+        self.timeout = timeout
+        self._inbox: list[Message] = []
+        self._arrived = asyncio.Event()
+        self._reader: asyncio.Task[None] | None = None
+
+    async def _read_loop(self) -> None:
+        while True:
+            text = await self.transport.receive()
+            if text is None:
+                return
+            self.stats.received += 1
+            self._inbox.append(codec.loads(text))
+            self._arrived.set()
+
+    async def _send(self, payload: Message) -> None:
+        self.stats.sent += 1
+        await self.transport.send(codec.dumps_str(payload))
+
+    async def expect(self, match: Callable[[Message], bool]) -> Message:
+        """Waits for, and consumes, the first message accepted by `match`."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            for index, message in enumerate(self._inbox):
+                if match(message):
+                    return self._inbox.pop(index)
+            self._arrived.clear()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Player {self.player_id} timed out")
+            await asyncio.wait_for(self._arrived.wait(), remaining)
+
+    async def request(
+        self, action: str, payload: Message, match: Callable[[Message], bool]
+    ) -> Message:
+        """Sends an action and records the time until its response arrives."""
+        started = time.perf_counter()
+        await self._send({"action": action, "player_id": self.player_id, **payload})
+        response = await self.expect(match)
+        self.stats.latencies[action].append(time.perf_counter() - started)
+        return response
+
+    async def play(self, targets: list[str] | TargetingModel) -> None:
+        """Plays one full game, from registration to game over."""
+        await self.transport.connect()
+        self._reader = asyncio.create_task(self._read_loop())
+        try:
+            await self._play(targets)
+        finally:
+            await self.transport.close()
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+    async def _play(self, targets: list[str] | TargetingModel) -> None:
+        await self._send({"player_id": self.player_id})
+
+        def is_match(message: Message) -> bool:
+            return message.get("action") == "res_find_game_session"
+
+        model = targets if isinstance(targets, TargetingModel) else None
+        shots = iter(targets if isinstance(targets, list) else [])
+        found = await self.request(
+            "find_game_session", {"opponent": "bot"} if model else {}, is_match
+        )
+        if found["status"] == "waiting":
+            found = await self.expect(
+                lambda m: is_match(m) and m.get("status") == "ready"
+            )
+        game_id = found["data"]["game_id"]
+
+        ships = [{"type": name, "positions": cells} for name, cells in FLEET.items()]
+        placed = await self.request(
+            "place_ships",
+            {"game_id": game_id, "ships": ships},
+            lambda m: m.get("action") == "place_ship_response",
+        )
+        if placed["status"] != "battle_start":
+            placed = await self.expect(
+                lambda m: m.get("action") == "place_ship_response"
+                and m.get("status") == "battle_start"
+            )
+        my_turn = placed["data"]["firstTurn"] == self.player_id
+
+        while True:
+            if my_turn:
+                target = model.next_target() if model else next(shots)
+                shot = await self.request(
+                    "shoot",
+                    {"game_id": game_id, "target": target},
+                    lambda m: m.get("action") == "shoot_result",
+                )
+                if model and shot["data"]:
+                    model.record(
+                        target,
+                        shot["data"].get("result") == "hit",
+                        shot["data"].get("ship_id"),
+                        bool(shot["data"].get("sunk")),
+                    )
+                if shot["data"] and shot["data"].get("game_over"):
+                    self.stats.games += 1
+                    return
+                await self.request(
+                    "pass_turn",
+                    {"game_id": game_id},
+                    lambda m: m.get("action") == "confirm_pass_turn"
+                    and "previous_turn" not in m["data"],
+                )
+                my_turn = False
+                continue
+
+            event = await self.expect(
+                lambda m: m.get("action") == "game_ended"
+                or (
+                    m.get("action") == "confirm_pass_turn"
+                    and "previous_turn" in m["data"]
+                )
+            )
+            if event["action"] == "game_ended":
+                if model:
+                    # A bot opponent has no client of its own to count its win.
+                    self.stats.games += 1
+                return
+            my_turn = True
+
+
+def build_targets(rng: random.Random, misses_per_hit: int) -> list[str]:
+    """Returns a shot sequence mixing every fleet cell with some misses."""
+    taken = set(FLEET_CELLS)
+    water = [cell for cell in CELL_NAMES if cell not in taken]
+    misses = rng.sample(water, misses_per_hit * len(FLEET_CELLS))
+    targets = FLEET_CELLS + misses
+    rng.shuffle(targets)
+    return targets
+
+
+def fake_redis_client() -> aioredis.Redis:
+    """Returns an in-memory fakeredis client to run the server on."""
+    import fakeredis  # pylint: disable=import-outside-toplevel
+
+    client: aioredis.Redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return client
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(stats: Stats, elapsed: float) -> None:
+    """Prints the throughput and latency summary."""
+    messages = stats.sent + stats.received
+    print(f"games completed  {stats.games} ({stats.failures} failed players)")
+    print(f"elapsed          {elapsed:.2f} s")
+    print(f"games/sec        {stats.games / elapsed:.1f}")
+    print(f"messages/sec     {messages / elapsed:.0f} ({stats.sent} sent, "
+          f"{stats.received} received)")
+    print(f"{'action':<20}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for action, samples in sorted(stats.latencies.items()):
+        print(
+            f"{action:<20}{len(samples):>8}"
+            f"{percentile(samples, 0.50) * 1000:>10.2f}"
+            f"{percentile(samples, 0.95) * 1000:>10.2f}"
+            f"{percentile(samples, 0.99) * 1000:>10.2f}"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Plays the games described by the arguments and prints the report."""
+    settings.bots.think_seconds = args.bot_think
+    redis_client = (
+        fake_redis_client()
+        if args.fakeredis
+        else create_redis_client(settings.redis)
+    )
+    services = websocket_handler.build_game_services(redis_client)
+
+    app = FastAPI()
+    app.include_router(websocket_handler.router)
+    app.state.game_services = services
+    await services.conn_manager.start()
+    scheduler = services.deadline_scheduler
+    if scheduler is not None and not args.url:
+        await scheduler.start()
+
+    def transport() -> Transport:
+        if args.url:
+            return NetworkWebSocket(args.url)
+        return ASGIWebSocket(app)
+
+    rng = random.Random(args.seed)
+    stats = Stats()
+    slots = asyncio.Semaphore(args.concurrency)
+
+    async def player() -> None:
+        async with slots:
+            bot = SimulatedPlayer(transport(), stats, args.timeout)
+            targets: list[str] | TargetingModel
+            if args.vs_bot:
+                targets = TargetingModel(
+                    settings.fleet.ships, random.Random(rng.random())
+                )
+            else:
+                targets = build_targets(rng, args.misses_per_hit)
+            try:
+                await bot.play(targets)
+            except Exception as e:
+                stats.failures += 1
+                logging.getLogger(__name__).warning("Player failed: %r", e)
+
+    started = time.perf_counter()
+    players = args.games if args.vs_bot else args.games * 2
+    await asyncio.gather(*(player() for _ in range(players)))
+    elapsed = time.perf_counter() - started
+
+    await services.game_service.bots.stop()
+    if scheduler is not None and not args.url:
+        await scheduler.stop()
+    await services.conn_manager.stop()
+    await redis_client.aclose()
+    report(stats, elapsed)
+
+
+def main() -> None:
+    """Parses the command line and runs the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument(
+        "--concurrency", type=int, default=200,
+        help="maximum number of connected players (rounded up to an even number)",
+    )
+    parser.add_argument("--misses-per-hit", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--url", help="ws:// URL of a running server")
+    parser.add_argument(
+        "--vs-bot", action="store_true",
+        help="play every game against a server-side bot",
+    )
+    parser.add_argument(
+        "--bot-think", type=float, default=0.0,
+        help="pause of the in-process bots before each shot, in seconds",
+    )
+    parser.add_argument(
+        "--fakeredis", action="store_true",
+        help="run the in-process server against fakeredis instead of Redis",
+    )
+    args = parser.parse_args()
+    args.concurrency += args.concurrency % 2
+    if (args.misses_per_hit + 1) * len(FLEET_CELLS) > BOARD_SIZE * BOARD_SIZE:
+        parser.error("--misses-per-hit leaves no water to shoot at")
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Exposes the application metrics for Prometheus to scrape."""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from src.api.websocket_handler import GameServices
+from src.infrastructure.metrics import (
+    ACTIVE_BOTS,
+    ACTIVE_GAMES,
+    CONNECTED_PLAYERS,
+    DB_POOL_CONNECTIONS,
+    PASSWORD_POOL_IN_FLIGHT,
+    PASSWORD_POOL_QUEUE_DEPTH,
+    PENDING_DEADLINES,
+    QUEUE_LENGTH,
+    REGISTRY,
+    SESSION_CACHE_EVENTS,
+    SPECTATORS,
+)
+from src.infrastructure.password_pool import password_pool
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request) -> PlainTextResponse:
+    """Refreshes the scrape-time gauges and renders every metric."""
+    services: GameServices | None = getattr(
+        request.app.state, "game_services", None
+    )
+    if services is not None:
+        conn_manager = services.conn_manager
+        CONNECTED_PLAYERS.set(len(conn_manager.connected_players))
+        ACTIVE_GAMES.set(len(set(conn_manager.player_game_map.values())))
+        SPECTATORS.set(conn_manager.spectator_count())
+        ACTIVE_BOTS.set(services.game_service.bots.active)
+        QUEUE_LENGTH.set(await services.game_repo.queue_length("game:queue"))
+        if services.deadline_scheduler is not None:
+            PENDING_DEADLINES.set(len(services.deadline_scheduler))
+        session_cache = services.game_repo.session_cache
+        if session_cache is not None:
+            stats = session_cache.stats
+            SESSION_CACHE_EVENTS.set_total(stats.hits, event="hit")
+            SESSION_CACHE_EVENTS.set_total(stats.misses, event="miss")
+            SESSION_CACHE_EVENTS.set_total(stats.evictions, event="eviction")
+            SESSION_CACHE_EVENTS.set_total(stats.expirations, event="expiration")
+    PASSWORD_POOL_IN_FLIGHT.set(password_pool.in_flight)
+    PASSWORD_POOL_QUEUE_DEPTH.set(password_pool.queue_depth)
+
+    pool = getattr(request.app.state, "db_pool", None)
+    if pool is not None:
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        DB_POOL_CONNECTIONS.set(idle, state="idle")
+        DB_POOL_CONNECTIONS.set(size - idle, state="in_use")
+        DB_POOL_CONNECTIONS.set(pool.get_max_size(), state="max")
+
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException, status, Request, Depends
 
 from src.api.v1.schemas.auth_schema import LoginRequest, TokenResponse
 from src.infrastructure.security import create_access_token
+from src.infrastructure.password_pool import PasswordPoolBusyError
 from src.infrastructure.persistence.player_repo_impl import (
     PostgresPlayerRegistrationRepository,
 )
@@ -40,7 +41,18 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not service.verify_password(request_data.password, player.password):
+    try:
+        verified = await service.verify_password(
+            request_data.password, player.password, request_data.username
+        )
+    except PasswordPoolBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": str(settings.password_hash.retry_after_seconds)},
+        ) from e
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect password",
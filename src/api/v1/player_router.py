@@ -16,6 +16,8 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 from src.application.repositories.player_repository import PlayerRegistrationRepository
 from src.application.services.player import PlayerRegistrationService
+from src.config import settings
+from src.infrastructure.password_pool import PasswordPoolBusyError
 from src.infrastructure.persistence.player_repo_impl import (
     PostgresPlayerRegistrationRepository,
 )
@@ -92,6 +94,7 @@ def get_player_registration_service(request: Request) -> PlayerRegistrationServi
             "(e.g., duplicate username)"
         },
         500: {"description": "Internal server error"},
+        503: {"description": "Password hashing pool saturated, retry later"},
     },
 )
 async def register_player(
@@ -140,9 +143,18 @@ async def register_player(
 
         raise HTTPException(status_code=400, detail="Player already exists.") from ue
 
+    except PasswordPoolBusyError as pe:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many registrations in progress, please retry.",
+            headers={"Retry-After": str(settings.password_hash.retry_after_seconds)},
+        ) from pe
+
     except Exception as e:
         # Unexpected errors
-        logger.error(f"Unexpected error during player registration: {e}", exc_info=True)
+        logger.error(
+            "Unexpected error during player registration: %s", e, exc_info=True
+        )
         raise HTTPException(
             status_code=500,
             detail="An internal error occurred. Please try again later.",
@@ -1,11 +1,11 @@
 """Data validation schemas for game-related actions like starting or shooting."""
 
 import uuid
-import re
-from typing import List
+from typing import List, Literal
 
 from pydantic import BaseModel, field_validator, Field
 from src.api.v1.schemas.validators import ensure_uuid
+from src.domain.board import CELL_INDEX
 
 
 class StartGameRequest(BaseModel):
@@ -26,26 +26,46 @@ class ShootRequest(BaseModel):
         ensure_uuid
     )
 
+    @field_validator("target")
+    @classmethod
+    def validate_target(cls, target: str) -> str:
+        """Reject targets that are not on the board."""
+        if not is_valid_coordinate(target):
+            raise ValueError(f"Invalid target coordinate: {target}")
+        return target
+
 
 class FindGameRequest(BaseModel):
-    """Schema for a player's request to find a game session."""
+    """Schema for a player's request to find a game session.
+
+    Attributes:
+        player_id: The ID of the player looking for a game.
+        opponent: 'player' to wait for a human, 'bot' to play a bot now.
+    """
 
     player_id: uuid.UUID
+    opponent: Literal["player", "bot"] = "player"
     _validate_uuids = field_validator("player_id", mode="before")(ensure_uuid)
 
 
-BOARD_SIZE = 15
-LETTERS = [chr(i) for i in range(ord("A"), ord("O") + 1)]
+class WatchGameRequest(BaseModel):
+    """Schema for a request to watch a game as a spectator.
+
+    Attributes:
+        game_id: The game to watch.
+    """
+
+    game_id: uuid.UUID
+    _validate_uuids = field_validator("game_id", mode="before")(ensure_uuid)
+
 
-# TODO validate if all ships are coming.
 # TODO get the player_id from the connection manager
 # TODO get the game_id from the connection manager
 
 
 def is_valid_coordinate(coord: str) -> bool:
     """Check if the coordinate is valid (e.g., 'A1', 'B2', etc.)."""
-    match = re.fullmatch(r"([A-O])([1-9])|1[0-5]", coord)
-    return bool(match)
+    return coord in CELL_INDEX
 
 
 class ShipPlacement(BaseModel):
@@ -56,13 +76,15 @@ class ShipPlacement(BaseModel):
         ships: A list of ships, where each ship is a list of its coordinates.
     """
 
-    player_id: int = Field()
+    player_id: uuid.UUID
     ships: List[List[str]] = Field(
         ..., description="List of ships with their coordinates"
     )
 
-    @classmethod
+    _validate_uuids = field_validator("player_id", mode="before")(ensure_uuid)
+
     @field_validator("ships")
+    @classmethod
     def validate_ship_coordinates(cls, ships: List[List[str]]) -> List[List[str]]:
         """Validate all ships' coordinates."""
         for ship in ships:
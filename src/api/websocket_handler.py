@@ -1,36 +1,115 @@
 """Responsable to handle all action"""
 
-import json
 import logging
 import uuid
+from dataclasses import dataclass
 
+import redis.asyncio as aioredis
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from src.config import settings
+from src.infrastructure import codec
+from src.infrastructure.deadline_scheduler import DeadlineScheduler
 from src.infrastructure.manager.connection_manager import ConnectionManager
+from src.infrastructure.manager.redis_connection_manager import RedisConnectionManager
+from src.infrastructure.redis_keys import RedisKeys
 from src.domain.player import Player
 from src.application.services.game import GameService
-from src.infrastructure.persistence.game_repo_impl import GameRedisRepository
+from src.infrastructure.persistence.game_repo_impl import (
+    GameRedisRepository,
+    SESSION_INVALIDATION_CHANNEL,
+)
 from src.api.v1.schemas.place_ships import StandardResponse
 from src.application.services.player_websocket import PlayerWebSocketService
 
 router = APIRouter()
-conn_manager = ConnectionManager()
-game_repo = GameRedisRepository()
-game_service = GameService(game_repo, conn_manager)
-player_websocket_service = PlayerWebSocketService(game_repo, game_service, conn_manager)
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class GameServices:
+    """The game services of one application, built on its Redis clients.
+
+    Built by the application lifespan and kept on `app.state.game_services`,
+    where the WebSocket endpoint and the metrics route read it.
+    """
+
+    game_repo: GameRedisRepository
+    conn_manager: ConnectionManager
+    deadline_scheduler: DeadlineScheduler | None
+    game_service: GameService
+    player_websocket_service: PlayerWebSocketService
+
+
+def build_game_services(
+    redis_client: aioredis.Redis, pubsub_client: aioredis.Redis | None = None
+) -> GameServices:
+    """Wires the repository, managers and services from the settings.
+
+    Args:
+        redis_client: The shared client, owned by the caller.
+        pubsub_client: The client pub/sub runs on when it is not the shared
+            one, as on a Redis Cluster.
+
+    Returns:
+        The services; the caller starts and stops the connection manager and
+        the deadline scheduler.
+    """
+    redis_keys = RedisKeys(settings.redis.use_hash_tags)
+    game_repo = GameRedisRepository(redis_client, redis_keys)
+    conn_manager: ConnectionManager
+    if settings.node.distributed:
+        game_repo.enable_invalidation_broadcast(settings.node.node_id, pubsub_client)
+        conn_manager = RedisConnectionManager(
+            redis_client,
+            settings.node.node_id,
+            presence_ttl_seconds=settings.node.presence_ttl_seconds,
+            heartbeat_seconds=settings.node.heartbeat_seconds,
+            channel_handlers={
+                SESSION_INVALIDATION_CHANNEL: game_repo.handle_invalidation
+            },
+            pubsub_client=pubsub_client,
+        )
+    else:
+        conn_manager = ConnectionManager()
+    deadline_scheduler: DeadlineScheduler | None = None
+    if settings.timers.enabled:
+        deadline_scheduler = DeadlineScheduler(
+            redis_client,
+            keys=redis_keys,
+            tick_seconds=settings.timers.tick_seconds,
+            sweep_seconds=settings.timers.sweep_seconds,
+        )
+    game_service = GameService(game_repo, conn_manager, deadline_scheduler)
+    return GameServices(
+        game_repo=game_repo,
+        conn_manager=conn_manager,
+        deadline_scheduler=deadline_scheduler,
+        game_service=game_service,
+        player_websocket_service=PlayerWebSocketService(
+            game_repo, game_service, conn_manager
+        ),
+    )
+
+
 async def _message_loop(
+    services: GameServices,
     websocket: WebSocket,
-    player: Player
+    player: Player,
+    player_id: uuid.UUID,
 ) -> None:
-    """The main loop for processing subsequent messages."""
+    """The main loop for processing subsequent messages.
+
+    Responses are queued on the player's connection like every other frame,
+    so a response never overtakes a notification already queued for them.
+    """
+    game_service = services.game_service
+    conn_manager = services.conn_manager
     while True:
         data = await websocket.receive_text()
-        payload = json.loads(data)
+        payload = codec.loads(data)
         action = payload.get("action")
-        logger.debug(f"PAYLOAD {payload}")
+        logger.debug("PAYLOAD %s", payload)
         handler_response: StandardResponse = await game_service.handle_action(
             action, payload, player
         )
@@ -38,21 +117,26 @@ async def _message_loop(
         if action in ["place_ships", "shoot"] and payload.get("game_id"):
             try:
                 game_id = uuid.UUID(payload["game_id"])
-                if player and player.id:
-                    conn_manager.add_player_to_game(player.id, game_id)
+                conn_manager.add_player_to_game(player_id, game_id)
             except ValueError:
-                logger.warning(f"Invalid game_id in {action}: {payload.get('game_id')}")
+                logger.warning(
+                    "Invalid game_id in %s: %s", action, payload.get("game_id")
+                )
 
-        await websocket.send_json(handler_response.to_dict())
+        await conn_manager.send_to_player(
+            player_id, codec.dumps_str(handler_response)
+        )
 
 
-async def notify_opponent_disconnection(disconnected_player_id: uuid.UUID) -> None:
+async def notify_opponent_disconnection(
+    services: GameServices, disconnected_player_id: uuid.UUID
+) -> None:
     """Notify the opponent that their player has disconnected."""
+    game_repo = services.game_repo
+    conn_manager = services.conn_manager
     try:
         # Find active game for the disconnected player
-        game_id_str = await game_repo.redis_client.get(
-            f"player:{disconnected_player_id}:active_game"
-        )
+        game_id_str = await game_repo.get_active_game(disconnected_player_id)
         if not game_id_str:
             return
 
@@ -68,7 +152,7 @@ async def notify_opponent_disconnection(disconnected_player_id: uuid.UUID) -> No
                 opponent_id = pid
                 break
 
-        if opponent_id and conn_manager.is_player_connected(opponent_id):
+        if opponent_id and await conn_manager.is_player_connected(opponent_id):
             disconnect_msg = StandardResponse(
                 status="opponent_disconnected",
                 message="Your opponent has disconnected.",
@@ -77,63 +161,69 @@ async def notify_opponent_disconnection(disconnected_player_id: uuid.UUID) -> No
                     "disconnected_player": str(disconnected_player_id),
                     "game_id": str(game_id),
                     "can_reconnect": True,
-                    "reconnect_timeout_seconds": 300
+                    "reconnect_timeout_seconds":
+                        settings.timers.disconnect_forfeit_seconds,
                 }
             )
             await conn_manager.send_to_player(opponent_id, disconnect_msg.to_dict())
             logger.info(
-                f"Sent disconnection notification to opponent"
-                f" {opponent_id} for player {disconnected_player_id}"
+                "Sent disconnection notification to opponent %s for player %s",
+                opponent_id,
+                disconnected_player_id,
             )
 
-            # TODO move to game_repo_impl and GameService that is the layer responsabel
-            # to talk with repo.
-            await game_repo.redis_client.setex(
-                f"game:{game_id}:disconnection_timeout",
-                300,  # 5 minutes
-                str(disconnected_player_id)
+            await services.game_service.deadlines.schedule_disconnect_forfeit(
+                game_id, disconnected_player_id
             )
-            logger.debug(f"Set disconnection timeout for game {game_id}")
+            logger.debug("Set disconnection timeout for game %s", game_id)
 
     except Exception as e:
-        logger.error(f"Error notifying opponent of disconnection: {e}")
+        logger.error("Error notifying opponent of disconnection: %s", e)
 
 
 @router.websocket("/ws/connect")
 async def websocket_connection(websocket: WebSocket) -> None:
     """Handles the WebSocket connection for a player."""
+    services: GameServices = websocket.app.state.game_services
     trace_id = str(uuid.uuid4())
-    logger.info(f"[{trace_id}] New connection established")
+    logger.info("[%s] New connection established", trace_id)
     await websocket.accept()
 
     player_id = None
     player = None
 
     try:
-        player_id, player = await player_websocket_service.register_player_connection(
-            websocket,
-            trace_id
+        player_id, player = (
+            await services.player_websocket_service.register_player_connection(
+                websocket, trace_id
+            )
         )
         if not player_id or not player:
             await websocket.close()
             return
 
-        await _message_loop(websocket, player)
+        await _message_loop(services, websocket, player, player_id)
 
     except WebSocketDisconnect as e:
-        logger.info(f"[{trace_id}] Player {player_id} disconnected: {e}")
+        logger.info("[%s] Player %s disconnected: %s", trace_id, player_id, e)
         if player_id:
-            await notify_opponent_disconnection(player_id)
+            await notify_opponent_disconnection(services, player_id)
 
     except Exception as exc:
-        logger.error(f"[{trace_id}] ERROR for player {player_id}: {exc}")
-        if websocket.client_state.name == "CONNECTED":
-            await websocket.send_json({"status": "error", "message": str(exc)})
+        logger.error("[%s] ERROR for player %s: %s", trace_id, player_id, exc)
+        error = codec.dumps_str({"status": "error", "message": str(exc)})
+        if player_id:
+            # Behind the frames already queued, which must go out before the
+            # connection is removed below.
+            await services.conn_manager.send_to_player(player_id, error)
+            await services.conn_manager.flush_player(player_id)
+        elif websocket.client_state.name == "CONNECTED":
+            await websocket.send_text(error)
         if player_id:
-            await notify_opponent_disconnection(player_id)
+            await notify_opponent_disconnection(services, player_id)
 
     finally:
         if player_id:
             queue_key = "game:queue"
-            await game_repo.pop_from_queue(queue_key, player_id)
-            conn_manager.remove_player(player_id)
+            await services.game_repo.pop_from_queue(queue_key, player_id)
+            await services.conn_manager.remove_player(player_id)
@@ -2,21 +2,32 @@
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Mapping, Sequence
 
 from src.domain.game import GameSession, GameInfo
-from src.domain.player import Player
-from src.api.v1.schemas.place_ships import ShipDetails
+from src.domain.game_events import GameEvent
+from src.domain.shot import ShotResult
 
 
-class GameRepository(ABC):
+class GameRepository(ABC):  # pylint: disable=too-many-public-methods
     """Abstract base class defining the contract for game data storage."""
 
     @abstractmethod
     async def save_player_board(
-        self, game_id: str, player: Player, ships: List[ShipDetails]
+        self,
+        game_id: str,
+        player_id: uuid.UUID,
+        ships: Mapping[str, Sequence[int]],
     ) -> None:
-        """Saves a player's board (ship placements) to the repository."""
+        """Saves a player's board (ship placements) to the repository.
+
+        Args:
+            game_id: The game the board belongs to.
+            player_id: The player who placed the ships.
+            ships: Ship id mapped to the cell indexes it occupies, as returned
+                by `validate_placement`.
+        """
         pass
 
     @abstractmethod
@@ -42,7 +53,7 @@ class GameRepository(ABC):
 
     @abstractmethod
     async def get_opponent_id(
-        self, game_id: uuid.UUID, player: Player
+        self, game_id: uuid.UUID, player_id: uuid.UUID
     ) -> uuid.UUID | None:
         """Finds the opponent's ID for a given game and player."""
         pass
@@ -54,6 +65,11 @@ class GameRepository(ABC):
         """Retrieves the recorded hits against a player's board."""
         pass
 
+    @abstractmethod
+    async def count_player_hits(self, game_id: uuid.UUID, player: uuid.UUID) -> int:
+        """Counts the distinct cells hit on a player's board."""
+        pass
+
     @abstractmethod
     async def save_hit(
         self, game_id: uuid.UUID, player: uuid.UUID, ship_id: str, position: str
@@ -61,14 +77,79 @@ class GameRepository(ABC):
         """Records a hit on a specific position of a player's board."""
         pass
 
+    @abstractmethod
+    async def resolve_shot(
+        self, game_id: uuid.UUID, player_id: uuid.UUID, target: str
+    ) -> ShotResult:
+        """Resolves a shot atomically.
+
+        Checks the turn, looks up the target on the opponent board, records the
+        hit, evaluates sunk/all-sunk and updates the game state as one operation.
+
+        Args:
+            game_id (uuid.UUID): The game where the shot happens.
+            player_id (uuid.UUID): The player who is shooting.
+            target (str): The target cell (e.g. "B4"), already validated.
+
+        Returns:
+            ShotResult: The outcome of the shot.
+        """
+        pass
+
     @abstractmethod
     async def push_to_queue(self, queue_name: str, player: uuid.UUID) -> None:
         """Adds a player to a matchmaking queue."""
         pass
 
     @abstractmethod
-    async def pop_from_queue(self, queue_name: str, player: uuid.UUID) -> None:
-        """Removes a player from a matchmaking queue."""
+    async def pop_from_queue(self, queue_name: str, player: uuid.UUID) -> bool:
+        """Removes a player from a matchmaking queue.
+
+        Returns:
+            bool: True if the player was waiting in the queue.
+        """
+        pass
+
+    @abstractmethod
+    async def queue_length(self, queue_name: str) -> int:
+        """Returns the number of players waiting in the queue.
+
+        Args:
+            queue_name (str): The matchmaking queue
+        """
+        pass
+
+    @abstractmethod
+    async def match_from_queue(
+        self, queue_name: str, player_id: uuid.UUID
+    ) -> uuid.UUID | None:
+        """Atomically claims the oldest waiting opponent from the queue.
+
+        When nobody else is waiting the player is enqueued instead, so two
+        callers can never claim the same opponent nor both end up waiting.
+
+        Args:
+            queue_name (str): The matchmaking queue
+            player_id (uuid.UUID): The player looking for a game
+
+        Returns:
+            uuid.UUID | None: The claimed opponent, or None if the player is
+                now waiting in the queue.
+        """
+        pass
+
+    @abstractmethod
+    async def create_match(self, queue_name: str, game: GameSession) -> None:
+        """Stores a newly paired game in a single atomic write.
+
+        Removes both players from the queue, saves the game session and marks
+        it as the active game of each player, so a failure never leaves the
+        players half-matched.
+
+        Args:
+            queue_name (str): The matchmaking queue
+            game (GameSession): The new game, holding both players
+        """
         pass
 
     @abstractmethod
@@ -80,11 +161,73 @@ class GameRepository(ABC):
     async def save_game_to_redis(
         self,
         game: GameSession,
+        event: GameEvent | None = None,
     ) -> None:
         """Saves the game state to Redis.
 
         Note: This might be a legacy or specific implementation detail.
         Consider consolidating with save_game_session.
+
+        Args:
+            game (GameSession): The game to save
+            event (GameEvent | None): The event that produced this state,
+                appended to the game's event log in the same atomic write
+        """
+        pass
+
+    @abstractmethod
+    async def update_game_session(
+        self,
+        game: GameSession,
+        attributes: Iterable[str],
+        event: GameEvent | None = None,
+    ) -> None:
+        """Saves only the attributes of a session that changed in memory.
+
+        Args:
+            game (GameSession): The game, already holding the new values
+            attributes (Iterable[str]): Names of the changed attributes, among
+                status, current_turn, start_datetime and end_datetime; none
+                just keeps the session alive
+            event (GameEvent | None): The event that produced the change,
+                appended to the game's event log in the same atomic write
+        """
+        pass
+
+    @abstractmethod
+    async def get_game_events(self, game_id: uuid.UUID) -> list[GameEvent]:
+        """Returns the game's event log, oldest event first.
+
+        Args:
+            game_id (uuid.UUID): The game
+        """
+        pass
+
+    @abstractmethod
+    async def rebuild_game_session(self, game_id: uuid.UUID) -> GameSession | None:
+        """Rebuilds the game session from its latest snapshot and event log.
+
+        Args:
+            game_id (uuid.UUID): The game
+
+        Returns:
+            GameSession | None: The rebuilt session, or None if the game has
+                no event log.
+        """
+        pass
+
+    @abstractmethod
+    async def archive_finished_game(
+        self, game: GameSession, winner_id: uuid.UUID
+    ) -> None:
+        """Queues a finished game to be written to long-term storage.
+
+        The write itself happens in the background, so this returns without
+        waiting on the database.
+
+        Args:
+            game (GameSession): The finished game
+            winner_id (uuid.UUID): The player who won
         """
         pass
 
@@ -153,3 +296,17 @@ class GameRepository(ABC):
             str: The game id as a string
         """
         pass
+
+    @asynccontextmanager
+    async def game_lock(  # pylint: disable=unused-argument
+        self, game_id: uuid.UUID
+    ) -> AsyncIterator[None]:
+        """Serializes actions on the same game.
+
+        Repositories without any notion of locking can keep this default,
+        which does not block.
+
+        Args:
+            game_id (uuid.UUID): The game to lock
+        """
+        yield
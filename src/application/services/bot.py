@@ -0,0 +1,209 @@
+"""Server-side bot opponents.
+
+A bot is an ordinary player whose connection is a `BotConnection`: the frames
+the server sends it land in an inbox instead of a socket, and it answers
+through `GameService.handle_action` exactly like the WebSocket handler does
+for a human. Bots cost one task and one small targeting model each, so a
+worker can run hundreds of them.
+"""
+
+import asyncio
+import logging
+import random
+import uuid
+from typing import TYPE_CHECKING, Any, Mapping
+
+from src.application.repositories.connection_protocol import ConnectionProtocol
+from src.config import settings
+from src.domain.player import Player
+from src.domain.targeting import TargetingModel, random_fleet
+from src.infrastructure import codec
+from src.infrastructure.connection.player_connection import PlayerConnection
+
+if TYPE_CHECKING:
+    from src.application.services.game import GameService
+
+logger = logging.getLogger(__name__)
+
+Message = dict[str, Any]
+
+
+class BotConnection(ConnectionProtocol):
+    """Delivers the messages sent to a bot into its inbox."""
+
+    def __init__(self) -> None:
+        self.inbox: asyncio.Queue[Message | None] = asyncio.Queue()
+
+    async def send_message(self, message: str) -> None:
+        self.inbox.put_nowait(codec.loads(message))
+
+    async def close_connection(self) -> None:
+        self.inbox.put_nowait(None)
+
+
+class BotPlayer:
+    """Plays one game against a human through the regular game actions.
+
+    Attributes:
+        player_id: The bot's player id.
+        player: The bot's player identity.
+        connection: Where the server's messages for the bot arrive.
+        game_id: The game the bot plays.
+    """
+
+    def __init__(
+        self,
+        game_service: "GameService",
+        game_id: uuid.UUID,
+        fleet: Mapping[str, int] | None = None,
+        think_seconds: float = 0.0,
+        idle_timeout_seconds: float = 900.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initializes the bot.
+
+        Args:
+            game_service: Service the bot sends its actions to.
+            game_id: The game to play.
+            fleet: Ships to place, and to expect on the opponent board;
+                defaults to the configured fleet.
+            think_seconds: Pause before each shot, so humans can follow.
+            idle_timeout_seconds: How long to wait for the opponent before
+                leaving the game.
+            rng: Random source for the placement and the targeting.
+        """
+        self.game_service = game_service
+        self.game_id = game_id
+        self.fleet = dict(settings.fleet.ships if fleet is None else fleet)
+        self.think_seconds = think_seconds
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.rng = rng or random.Random()
+        self.player_id = uuid.uuid4()
+        self.player = Player(id=self.player_id, username="bot")
+        self.connection = BotConnection()
+        self.targeting = TargetingModel(self.fleet, self.rng)
+
+    async def _act(self, action: str, **payload: Any) -> Message:
+        response = await self.game_service.handle_action(
+            action,
+            {"game_id": str(self.game_id), "player_id": str(self.player_id), **payload},
+            self.player,
+        )
+        return response.to_dict()
+
+    async def play(self) -> None:
+        """Places the fleet and plays until the game ends or goes idle."""
+        ships = [
+            {"type": ship_id, "positions": cells}
+            for ship_id, cells in random_fleet(self.fleet, self.rng).items()
+        ]
+        placed = await self._act("place_ships", ships=ships)
+        # The battle start is both the answer to the last placement and a
+        # message to each player, so only the first one is acted on.
+        started = placed.get("status") == "battle_start"
+        my_turn = started and self._is_first_turn(placed)
+
+        while True:
+            if my_turn:
+                if await self._take_turn():
+                    return
+                my_turn = False
+                continue
+
+            try:
+                message = await asyncio.wait_for(
+                    self.connection.inbox.get(), self.idle_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.info("Bot %s left idle game %s", self.player_id, self.game_id)
+                return
+            if message is None or message.get("action") == "game_ended":
+                return
+            if (
+                not started
+                and message.get("action") == "place_ship_response"
+                and message.get("status") == "battle_start"
+            ):
+                started = True
+                my_turn = self._is_first_turn(message)
+            elif (
+                message.get("action") == "confirm_pass_turn"
+                and message.get("status") == "ok"
+                and isinstance(message.get("data"), dict)
+                and message["data"].get("currentTurn") == str(self.player_id)
+            ):
+                my_turn = True
+
+    def _is_first_turn(self, message: Message) -> bool:
+        return bool(message["data"].get("firstTurn") == str(self.player_id))
+
+    async def _take_turn(self) -> bool:
+        """Fires one shot and passes the turn.
+
+        Returns:
+            True if the game is over.
+        """
+        if self.think_seconds:
+            await asyncio.sleep(self.think_seconds)
+        target = self.targeting.next_target()
+        shot = await self._act("shoot", target=target)
+        data = shot.get("data")
+        if shot.get("status") == "error" or not isinstance(data, dict):
+            logger.debug("Bot %s shot rejected: %s", self.player_id, shot)
+            return False
+
+        hit = data.get("result") == "hit"
+        self.targeting.record(
+            target, hit, data.get("ship_id"), bool(data.get("sunk"))
+        )
+        if data.get("game_over"):
+            return True
+        await self._act("pass_turn")
+        return False
+
+
+class BotOpponents:
+    """Creates the bots of a worker and runs each one until its game ends."""
+
+    def __init__(self, game_service: "GameService") -> None:
+        self.game_service = game_service
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def active(self) -> int:
+        """Number of bot players currently in a game on this worker."""
+        return len(self._tasks)
+
+    def create(self, game_id: uuid.UUID) -> BotPlayer:
+        """Returns a bot, configured from the settings, for the game."""
+        return BotPlayer(
+            self.game_service,
+            game_id,
+            think_seconds=settings.bots.think_seconds,
+            idle_timeout_seconds=settings.bots.idle_timeout_seconds,
+        )
+
+    async def launch(self, bot: BotPlayer) -> None:
+        """Connects the bot to its game and starts playing in the background."""
+        conn_manager = self.game_service.conn_manager
+        await conn_manager.add_player(PlayerConnection(bot.player, bot.connection))
+        conn_manager.add_player_to_game(bot.player_id, bot.game_id)
+        task = asyncio.create_task(self._run(bot))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        """Cancels the bots still playing and waits for them to disconnect."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, bot: BotPlayer) -> None:
+        """Plays the bot's game, then disconnects it."""
+        try:
+            await bot.play()
+        except Exception as e:
+            logger.error("Bot %s failed in game %s: %s", bot.player_id, bot.game_id, e)
+        finally:
+            await self.game_service.conn_manager.remove_player(bot.player_id)
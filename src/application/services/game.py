@@ -10,14 +10,26 @@ from dataclasses import dataclass
 from pydantic import ValidationError
 
 from src.domain.game import GameSession, PlayerBoard, GameStatus
+from src.domain.game_events import GameEvent
+from src.domain.placement import PlacementError, validate_placement
 from src.domain.player import Player
+from src.domain.shot import ShotOutcome, ShotResult
 from src.application.repositories.game_repository import GameRepository
+from src.infrastructure.deadline_scheduler import DeadlineScheduler
 from src.infrastructure.manager.connection_manager import ConnectionManager
+from src.infrastructure.logger import lazy
+from src.infrastructure.metrics import (
+    GAMES_FINISHED,
+    GAMES_STARTED,
+    SHOTS,
+    track_action,
+)
 from src.api.v1.schemas.game_actions import (
     FindGameRequest,
     ShootRequest,
     StartGameRequest,
     PassTurn,
+    WatchGameRequest,
 )
 from src.api.v1.schemas.place_ships import (
     ShipPlacementRequest,
@@ -28,22 +40,34 @@ from src.api.v1.schemas.player_info import PlayerInfoRequest
 from src.application.ship import parse_ships
 from src.application.builders.response import ResponseBuilder
 from src.domain.game_validator import GameValidator
+from src.application.services.bot import BotOpponents
+from src.application.services.game_deadlines import (
+    BOT_MATCH_DEADLINE,
+    FORFEIT_DEADLINE,
+    QUEUE_DEADLINE,
+    TURN_DEADLINE,
+    GameDeadlines,
+)
 from src.application.services.notification_service import (
     NotificationService,
     NotificationData,
 )
+from src.application.services.spectator import SpectatorService
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+QUEUE_KEY = "game:queue"
+
 
 @dataclass
 class ProcessHitData:
     """Data class for arguments passed to _process_hit."""
-    game: GameSession
     request: ShootRequest
-    opponent_id: uuid.UUID
-    ship_id: str
-    positions: list
+    opponent_id: uuid.UUID | None
+    ship_id: str | None
+    is_sunk: bool
+    current_turn: uuid.UUID | None
 
 
 class GameService:
@@ -52,13 +76,24 @@ class GameService:
     def __init__(
         self,
         repository: GameRepository,
-        conn_manager: ConnectionManager
+        conn_manager: ConnectionManager,
+        scheduler: DeadlineScheduler | None = None,
     ) -> None:
-        """Initializes the GameService."""
+        """Initializes the GameService.
+
+        Args:
+            repository: Storage of the game state.
+            conn_manager: Delivers messages to the players.
+            scheduler: Runs the turn timeouts, disconnect forfeits and queue
+                expiry; without it those deadlines are not enforced.
+        """
         self.repository = repository
         self.conn_manager = conn_manager
         self.notification_service = NotificationService(conn_manager)
         self.validator = GameValidator()
+        self.spectators = SpectatorService(repository, conn_manager)
+        self.deadlines = GameDeadlines(self, scheduler)
+        self.bots = BotOpponents(self)
 
         self._action_handlers = {
             "place_ships": self._handle_place_ships,
@@ -67,6 +102,8 @@ class GameService:
             "shoot": self._handle_shoot,
             "find_game_session": self._handle_find_game_session,
             "pass_turn": self._handle_pass_turn,
+            "watch_game": self._handle_watch_game,
+            "stop_watching": self._handle_stop_watching,
         }
 
     async def handle_action(
@@ -75,7 +112,8 @@ class GameService:
         """Routes incoming player actions to the appropriate handler method."""
         handler = self._action_handlers.get(action)
         if handler:
-            return await handler(action, payload, player)
+            with track_action(action):
+                return await handler(action, payload, player)
 
         return ResponseBuilder.error(f"Unknown action: {action}", f"error_{action}")
 
@@ -89,7 +127,7 @@ class GameService:
                 ships=parse_ships(payload["ships"]),
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -97,7 +135,8 @@ class GameService:
                 data="",
             )
 
-        return await self.place_ships(req_place_ship, player)
+        async with self.repository.game_lock(uuid.UUID(req_place_ship.game_id)):
+            return await self.place_ships(req_place_ship, player)
 
     async def _handle_start_game(
         self, action: str, payload: dict[Any, Any], _player: Player
@@ -108,7 +147,7 @@ class GameService:
                 players=payload["players"],
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -126,7 +165,7 @@ class GameService:
                 player_id=payload["player_id"],
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -138,7 +177,7 @@ class GameService:
     async def _handle_shoot(
         self, action: str, payload: dict[Any, Any], _player: Player
     ) -> StandardResponse:
-        logger.debug(f"ACTION SHOOT {payload}")
+        logger.debug("ACTION SHOOT %s", payload)
         try:
             req_shoot = ShootRequest(
                 game_id=payload["game_id"],
@@ -146,14 +185,15 @@ class GameService:
                 target=payload["target"],
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
                 action="shoot_result",
                 data="",
             )
-        return await self.shoot(req_shoot)
+        async with self.repository.game_lock(req_shoot.game_id):
+            return await self.shoot(req_shoot)
 
     async def _handle_find_game_session(
         self, action: str, payload: dict[Any, Any], _player: Player
@@ -161,9 +201,10 @@ class GameService:
         try:
             req_find_game_session = FindGameRequest(
                 player_id=uuid.UUID(payload["player_id"]),
+                opponent=payload.get("opponent", "player"),
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -183,29 +224,62 @@ class GameService:
                 game_id=uuid.UUID(payload["game_id"])
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
                 action="error_confirm_pass_turn",
                 data="",
             )
-        return await self.pass_turn(req_pass_turn)
+        async with self.repository.game_lock(req_pass_turn.game_id):
+            return await self.pass_turn(req_pass_turn)
+
+    async def _handle_watch_game(
+        self, action: str, payload: dict[Any, Any], player: Player
+    ) -> StandardResponse:
+        try:
+            req_watch_game = WatchGameRequest(game_id=payload["game_id"])
+        except (KeyError, ValidationError) as e:
+            logger.error("%s validation error: %s", action, e)
+            return ResponseBuilder.error(
+                f"Invalid request payload: {e}", "error_watch_game"
+            )
+        return await self.spectators.watch_game(req_watch_game, player)
+
+    async def _handle_stop_watching(
+        self, _action: str, _payload: dict[Any, Any], player: Player
+    ) -> StandardResponse:
+        return await self.spectators.stop_watching(player)
 
     async def place_ships(
         self, request: ShipPlacementRequest, player: Player
     ) -> StandardResponse:
         """Handles the logic for a player to place their ships on the board."""
         game_id: str = request.game_id
-        game_id_uuid: uuid.UUID = uuid.UUID(game_id)
         try:
-            await self.repository.save_player_board(game_id, player, request.ships)
+            layout = validate_placement(
+                ((ship.type, ship.positions) for ship in request.ships),
+                settings.fleet.ships,
+            )
+        except PlacementError as e:
+            return StandardResponse(
+                status="error",
+                message=str(e),
+                action="place_ship_response",
+                data="",
+            )
+        try:
+            await self.repository.save_player_board(
+                game_id, uuid.UUID(request.player_id), layout
+            )
         except Exception as ex:
-            logger.debug(f"EXCEPTION ON PLACE SHIPS SAVING PLAYER BOARD {ex}")
+            logger.debug("EXCEPTION ON PLACE SHIPS SAVING PLAYER BOARD %s", ex)
 
         logger.debug("AFTER SAVE PLAYER BOARD")
-        game_session = await self.repository.load_game_session(game_id=game_id_uuid)
-        logger.debug(f"LOAD GAME SESSION {game_session}")
+        game_session = await self.repository.load_game_session(
+            game_id=uuid.UUID(game_id)
+        )
+        logger.debug("LOAD GAME SESSION %s", game_session)
 
         if not game_session:
             return StandardResponse(
@@ -225,7 +299,7 @@ class GameService:
                 data="",
             )
         player1_id, player2_id = player_ids[0], player_ids[1]
-        logger.debug(f"PLAYERS {player1_id} AND THE {player2_id}")
+        logger.debug("PLAYERS %s AND THE %s", player1_id, player2_id)
         ready = await self.are_both_player_ready(
             game_id,
             str(player1_id),
@@ -233,14 +307,19 @@ class GameService:
         )
 
         if ready:
-            logger.debug(f"INSIDE READY TRUE {ready}")
+            logger.debug("INSIDE READY TRUE %s", ready)
             first_turn = random.choice(
                     [player1_id, player2_id]
             )
 
             game_session.current_turn = first_turn
             game_session.status = GameStatus.IN_PROGRESS
-            await self.repository.save_game_to_redis(game_session)
+            await self.repository.update_game_session(
+                game_session,
+                ("current_turn", "status"),
+                GameEvent.started(first_turn),
+            )
+            await self.deadlines.schedule_turn_timeout(game_session.game_id, first_turn)
 
             battle_msg = StandardResponse(
                 status="battle_start",
@@ -253,8 +332,7 @@ class GameService:
                 },
             )
             logger.debug(
-                f"BATTLE MSG SENT TO THE FRONT END"
-                f"{battle_msg} and {battle_msg.to_dict()}"
+                "BATTLE MSG SENT TO THE FRONT END %s", lazy(battle_msg.to_dict)
             )
             try:
                 await self.conn_manager.send_to_player(
@@ -266,9 +344,9 @@ class GameService:
                     battle_msg.to_dict()
                 )
             except Exception as ep:
-                logger.debug(f"ERROR SENDING MESSAGE TO PLAYERS {ep}")
+                logger.debug("ERROR SENDING MESSAGE TO PLAYERS %s", ep)
 
-            logger.debug(f"BATLLE MSG {battle_msg}")
+            logger.debug("BATLLE MSG %s", battle_msg)
             return StandardResponse(
                 status="battle_start",
                 message="Ships placed. Battle starting!",
@@ -299,7 +377,7 @@ class GameService:
             try:
                 player_id_int = uuid.UUID(player_id_str)
             except ValueError as e:
-                logger.error(f"Valuer error on start_game validation error: {e}")
+                logger.error("Valuer error on start_game validation error: %s", e)
                 return StandardResponse(
                     status="error",
                     message=f"Invalid player ID: {player_id_str}",
@@ -321,7 +399,7 @@ class GameService:
                     for ship_type, positions in raw_ships_dict.items()
                 ]
             except Exception as e:
-                logger.error(f"Error structuring ship data: {e}")
+                logger.error("Error structuring ship data: %s", e)
                 return StandardResponse(
                     status="error",
                     message="Internal error structuring ship data.",
@@ -331,13 +409,16 @@ class GameService:
 
             try:
                 ships: List[ShipDetails] = parse_ships(raw_ship_list)
+                layout = validate_placement(
+                    ((ship.type, ship.positions) for ship in ships),
+                    settings.fleet.ships,
+                )
             except ValueError as e:
                 return StandardResponse(
                     status="error", message=str(e), action="resp_start_game", data=""
                 )
 
-            player = Player(id=player_id_int)
-            await self.repository.save_player_board(game_id, player, ships)
+            await self.repository.save_player_board(game_id, player_id_int, layout)
 
         return StandardResponse(
             status="OK",
@@ -356,103 +437,106 @@ class GameService:
                 data="",
             )
 
-        player = Player(id=request.player_id)
-        if player.id is None:
-            return StandardResponse(
-                status="error",
-                message="Player not found",
-                action="resp_get_game_info",
-                data="",
-            )
         rtn_player_info = StandardResponse(
             status="OK",
             message=f"player: {request.player_id} info for game: {request.game_id}",
             action="resp_get_game_info",
-            data=await self.repository.get_player_board(request.game_id, player.id),
+            data=await self.repository.get_player_board(
+                request.game_id, request.player_id
+            ),
         )
         return rtn_player_info
 
     async def shoot(self, request: ShootRequest) -> StandardResponse:
-        """Handles a player's attempt to shoot at an opponent's board."""
-        logger.debug(f"INSIDE THE SHOOT FUNCTION {request}")
+        """Handles a player's attempt to shoot at an opponent's board.
 
-        game = await self.repository.load_game_session(request.game_id)
+        The turn check, hit lookup, hit recording and sunk evaluation are all
+        resolved by the repository in a single atomic call.
+        """
+        logger.debug("INSIDE THE SHOOT FUNCTION %s", request)
+
+        result = await self.repository.resolve_shot(
+            request.game_id,
+            request.player_id,
+            request.target
+        )
 
-        if game is None:
+        if result.is_error:
+            return self._shot_error(request, result)
+
+        await self.spectators.notify(request.game_id, "spectate_shot", {
+            "shooter": str(request.player_id),
+            "cell": request.target,
+            "result": "miss" if result.outcome == ShotOutcome.MISS else "hit",
+            "sunk": result.sunk,
+            # Only a sunk ship is named, a plain hit does not give it away.
+            "ship_id": result.ship_id if result.sunk else None,
+            "game_over": result.outcome == ShotOutcome.GAME_OVER,
+        })
+
+        if result.outcome == ShotOutcome.MISS:
+            SHOTS.inc(result="miss")
+            return await self._process_miss(request, result)
+
+        SHOTS.inc(result="hit")
+
+        hit_data = ProcessHitData(
+            request=request,
+            opponent_id=result.opponent_id,
+            ship_id=result.ship_id,
+            is_sunk=result.sunk,
+            current_turn=result.current_turn,
+        )
+        if result.outcome == ShotOutcome.GAME_OVER:
+            GAMES_FINISHED.inc()
+            return await self._process_game_over(hit_data)
+
+        return await self._process_hit(hit_data)
+
+    def _shot_error(
+        self,
+        request: ShootRequest,
+        result: ShotResult
+    ) -> StandardResponse:
+        """Builds the error response for a rejected shot."""
+        if result.outcome == ShotOutcome.GAME_NOT_FOUND:
             return ResponseBuilder.error("Game not found", "resp_shoot")
 
-        validation_error = self.validator.validate_shoot(game, str(request.player_id))
-        if validation_error:
-            return validation_error
+        if result.outcome == ShotOutcome.GAME_NOT_ACTIVE:
+            return ResponseBuilder.error("Game is not active", "shoot_result")
 
-        # Get opponent info
-        opponent_id = await self.repository.get_opponent_id(
-            request.game_id,
-            Player(id=request.player_id)
-        )
-        if opponent_id is None:
-            logger.info(f"No opponent found for game_id: {request.game_id}")
+        if result.outcome == ShotOutcome.NOT_YOUR_TURN:
+            return ResponseBuilder.error("It's not your turn", "shoot_result")
+
+        if result.outcome == ShotOutcome.NO_OPPONENT:
+            logger.info("No opponent found for game_id: %s", request.game_id)
             return ResponseBuilder.error("No opponent found", "shoot_result")
 
-        opponent_board = await self.repository.get_player_board(
-            request.game_id,
-            opponent_id
-        )
-        if not opponent_board:
+        if result.outcome == ShotOutcome.ALREADY_HIT:
             return ResponseBuilder.error(
-                f"Opponent {opponent_id} board not found "
-                f"for game {request.game_id}",
-                "shoot_result"
-            )
-
-        # Process the shot
-        for ship_id, positions in opponent_board.items():
-            if request.target in positions:
-                # Create the dataclass instance
-                hit_data = ProcessHitData(
-                    game=game,
-                    request=request,
-                    opponent_id=opponent_id,
-                    ship_id=ship_id,
-                    positions=positions
-                )
-                return await self._process_hit(hit_data)
+                f"Cell {request.target} was already hit", "shoot_result"
+            )
 
-        # It's a miss
-        return await self._process_miss(game, request, opponent_id)
+        return ResponseBuilder.error(
+            f"Opponent {result.opponent_id} board not found "
+            f"for game {request.game_id}",
+            "shoot_result"
+        )
 
     async def _process_hit(
         self,
         hit_data: ProcessHitData
     ) -> StandardResponse:
         """Process a hit on opponent's ship."""
-        await self.repository.save_hit(
-            hit_data.request.game_id,
-            hit_data.opponent_id,
-            hit_data.ship_id,
-            hit_data.request.target
-        )
-        hits = await self.repository.get_player_hits(
-            hit_data.request.game_id,
-            hit_data.opponent_id
-        )
-        is_sunk = set(hits.get(hit_data.ship_id, [])) == set(hit_data.positions)
-
-        # Check if all ships are sunk
-        if await self._check_all_ships_sunk(hit_data.game, hit_data.opponent_id):
-            return await self._process_game_over(hit_data.game, hit_data.request)
-
-        # Regular hit - continue game
-        await self.repository.save_game_to_redis(hit_data.game)
         logger.debug("BEFORE SEND HIT")
 
         notification_data = NotificationData(
             opponent_id=str(hit_data.opponent_id),
             target=hit_data.request.target,
             request_player_id=str(hit_data.request.player_id),
-            current_turn=str(hit_data.game.current_turn),
+            current_turn=str(hit_data.current_turn),
             ship_id=hit_data.ship_id,
-            is_sunk=is_sunk
+            is_sunk=hit_data.is_sunk
         )
         await self.notification_service.notify_opponent_hit(notification_data)
 
@@ -464,26 +548,24 @@ class GameService:
                 "result": "hit",
                 "cell": hit_data.request.target,
                 "ship_id": hit_data.ship_id,
-                "sunk": is_sunk,
-                "player_turn": str(hit_data.game.current_turn),
+                "sunk": hit_data.is_sunk,
+                "player_turn": str(hit_data.current_turn),
             }
         )
 
     async def _process_miss(
         self,
-        game: GameSession,
         request: ShootRequest,
-        opponent_id: uuid.UUID
+        result: ShotResult
     ) -> StandardResponse:
         """Process a miss."""
-        await self.repository.save_game_to_redis(game)
         logger.debug("MISS THE SHOOT")
 
         notification_data = NotificationData(
-            opponent_id=str(opponent_id),
+            opponent_id=str(result.opponent_id),
             target=request.target,
             request_player_id=str(request.player_id),
-            current_turn=str(game.current_turn)
+            current_turn=str(result.current_turn)
         )
         await self.notification_service.notify_opponent_miss(notification_data)
 
@@ -494,43 +576,35 @@ class GameService:
             {
                 "result": "miss",
                 "cell": request.target,
-                "player_turn": str(game.current_turn),
+                "player_turn": str(result.current_turn),
             }
         )
 
-    async def _check_all_ships_sunk(
-        self,
-        game: GameSession,
-        opponent_id: uuid.UUID
-    ) -> bool:
-        """Check if all opponent ships are sunk."""
-        opponent_board = await self.repository.get_player_board(
-            game.game_id,
-            opponent_id
-        )
-        if not opponent_board:
-            return False
-
-        hits = await self.repository.get_player_hits(game.game_id, opponent_id)
-
-        for ship_id, ship_positions in opponent_board.items():
-            ship_hits = set(hits.get(ship_id, []))
-            if ship_hits != set(ship_positions):
-                return False
-        return True
-
     async def _process_game_over(
         self,
-        game: GameSession,
-        request: ShootRequest
+        hit_data: ProcessHitData
     ) -> StandardResponse:
-        """Process game over scenario."""
-        game.status = GameStatus.FINISHED
-        game.end_datetime = int(time.time())
-        await self.repository.save_game_to_redis(game)
-        await self.end_game(game.game_id)
+        """Process game over scenario.
 
-        await self.notification_service.notify_victory(game, str(request.player_id))
+        The repository already marked the game as finished when it resolved
+        the shot, so only cleanup and notifications are left here.
+        """
+        request = hit_data.request
+        game = await self.repository.load_game_session(request.game_id)
+        if game:
+            await self.end_game(game.game_id)
+            await self.deadlines.cancel(TURN_DEADLINE, game.game_id)
+            await self.deadlines.cancel(FORFEIT_DEADLINE, game.game_id)
+            try:
+                await self.repository.archive_finished_game(game, request.player_id)
+            except Exception as e:
+                logger.error(
+                    "Failed to queue game %s for archiving: %s", game.game_id, e
+                )
+            await self.notification_service.notify_victory(
+                game,
+                str(request.player_id)
+            )
 
         return ResponseBuilder.success(
             f"Player {request.player_id} wins! All opponent ships destroyed!",
@@ -538,7 +612,7 @@ class GameService:
             {
                 "result": "hit",
                 "cell": request.target,
-                "ship_id": request.target,
+                "ship_id": hit_data.ship_id,
                 "sunk": True,
                 "game_over": True,
                 "winner": str(request.player_id)
@@ -547,7 +621,7 @@ class GameService:
 
     async def find_game_session(self, player: FindGameRequest) -> StandardResponse:
         """Find or create a game session for the player."""
-        queue_key = "game:queue"
+        queue_key = QUEUE_KEY
 
         if await self.repository.is_player_in_active_game(player.player_id):
             game_id_str = await self.repository.get_active_game(player.player_id)
@@ -555,22 +629,26 @@ class GameService:
                 game = await self.repository.load_game_session(uuid.UUID(game_id_str))
                 if game and game.status != "finished":
                     opponent_id = await self.repository.get_opponent_id(
-                        uuid.UUID(game_id_str),
-                        Player(id=player.player_id)
+                        uuid.UUID(game_id_str), player.player_id
                     )
 
                     # If opponent exists and is connected, resume the game
-                    if opponent_id and self.conn_manager.is_player_connected(
+                    if opponent_id and await self.conn_manager.is_player_connected(
                         opponent_id
                     ):
                         logger.info(
-                            f"Resuming game {game_id_str} for player {player.player_id}"
+                            "Resuming game %s for player %s",
+                            game_id_str,
+                            player.player_id,
                         )
 
                         # Associate player with game in connection manager
                         self.conn_manager.add_player_to_game(
                             player.player_id, uuid.UUID(game_id_str)
                         )
+                        await self.deadlines.cancel_disconnect_forfeit(
+                            uuid.UUID(game_id_str)
+                        )
 
                         return StandardResponse(
                             status="resume_game",
@@ -590,12 +668,16 @@ class GameService:
                     else:
                         # Opponent is not connected - game is dead
                         logger.info(
-                            f"Opponent {opponent_id} is offline. "
-                            f"Clearing dead game for {player.player_id}"
+                            "Opponent %s is offline. Clearing dead game for %s",
+                            opponent_id,
+                            player.player_id,
                         )
                         await self.repository.clear_player_active_game(player.player_id)
                         # Fall through to treat as new player
 
+        if player.opponent == "bot":
+            return await self.start_bot_game(player.player_id)
+
         if await self.repository.is_player_in_queue(queue_key, player.player_id):
             return StandardResponse(
                 status="waiting",
@@ -605,29 +687,19 @@ class GameService:
                     "player_id": str(player.player_id)},
             )
 
-        opponent_player_id = await self.repository.get_opponent_from_queue(
+        # Claims the oldest opponent, or enqueues the player, in one atomic step
+        opponent_player_id = await self.repository.match_from_queue(
             queue_key, player.player_id
         )
-        logger.debug(f"The opponent_player_id {opponent_player_id}")
+        logger.debug("The opponent_player_id %s", opponent_player_id)
 
         if opponent_player_id:
-            await self.repository.pop_from_queue(queue_key, opponent_player_id)
             logger.info(
-                f"Pairing player {player.player_id} with opponent {opponent_player_id}"
+                "Pairing player %s with opponent %s",
+                player.player_id,
+                opponent_player_id,
             )
 
-            if opponent_player_id == player.player_id:
-                logger.warning(
-                    "Opponent is same as current player - returning to queue"
-                )
-                await self.repository.push_to_queue(queue_key, player.player_id)
-                return StandardResponse(
-                    status="error",
-                    message="Invalid opponent found",
-                    action="res_find_game_session",
-                    data="",
-                )
-
             game_id = uuid.uuid4()
             now = int(time.time())
             game_data = GameSession(
@@ -640,22 +712,17 @@ class GameService:
                 },
                 status=GameStatus.PLACE_SHIP,
             )
-            logger.debug(f"AFTER CREATE GAMESESSION {game_data}")
+            logger.debug("AFTER CREATE GAMESESSION %s", game_data)
 
             try:
-                await self.repository.save_game_to_redis(game_data)
-                await self.repository.set_player_active_game(
-                    player.player_id, game_id
-                )
-                await self.repository.set_player_active_game(
-                    opponent_player_id,
-                    game_id
-                )
+                await self.repository.create_match(queue_key, game_data)
+                GAMES_STARTED.inc()
+                await self.deadlines.cancel(QUEUE_DEADLINE, opponent_player_id)
 
                 self.conn_manager.add_player_to_game(player.player_id, game_id)
 
             except Exception as e:
-                logger.error(f"Game not saved ERROR: {e}")
+                logger.error("Game not saved ERROR: %s", e)
                 await self.repository.push_to_queue(queue_key, player.player_id)
                 await self.repository.push_to_queue(queue_key, opponent_player_id)
                 return StandardResponse(
@@ -665,37 +732,29 @@ class GameService:
                     data="",
                 )
 
-            def create_player_game_data(
-                game_session: GameSession, player_id: uuid.UUID
-            ) -> dict[str, Any]:
-                return {
-                    "game_id": str(game_session.game_id),
-                    "start_datetime": game_session.start_datetime,
-                    "end_datetime": game_session.end_datetime,
-                    "players": str(player_id),
-                    "status": game_session.status.value,
-                }
-
-            current_player_payload = StandardResponse(
-                status="ready",
-                message="Game has started",
-                action="res_find_game_session",
-                data=create_player_game_data(game_data, player.player_id),
+            current_player_payload = self._game_ready_response(
+                game_data, player.player_id
             )
-
-            opponent_payload = StandardResponse(
-                status="ready",
-                message="Game has started",
-                action="res_find_game_session",
-                data=create_player_game_data(game_data, opponent_player_id),
+            opponent_payload = self._game_ready_response(
+                game_data, opponent_player_id
             ).to_dict()
 
             # When opponent receives this, they should also call add_player_to_game
             await self.conn_manager.send_to_player(opponent_player_id, opponent_payload)
             return current_player_payload
 
-        # No opponent - add to queue
-        await self.repository.push_to_queue(queue_key, player.player_id)
+        # No opponent - the player is now waiting in the queue
+        await self.deadlines.schedule(
+            QUEUE_DEADLINE,
+            player.player_id,
+            settings.timers.queue_timeout_seconds,
+        )
+        if settings.bots.enabled and settings.bots.fill_queue_after_seconds > 0:
+            await self.deadlines.schedule(
+                BOT_MATCH_DEADLINE,
+                player.player_id,
+                settings.bots.fill_queue_after_seconds,
+            )
         return StandardResponse(
             status="waiting",
             message="Waiting for another player",
@@ -705,7 +764,63 @@ class GameService:
             },
         )
 
-    def _get_next_player(self, game: GameSession, current_id: uuid.UUID) -> uuid.UUID:
+    @staticmethod
+    def _game_ready_response(
+        game_session: GameSession, player_id: uuid.UUID
+    ) -> StandardResponse:
+        """Builds the message telling a player their game was created."""
+        return StandardResponse(
+            status="ready",
+            message="Game has started",
+            action="res_find_game_session",
+            data={
+                "game_id": str(game_session.game_id),
+                "start_datetime": game_session.start_datetime,
+                "end_datetime": game_session.end_datetime,
+                "players": str(player_id),
+                "status": game_session.status.value,
+            },
+        )
+
+    async def start_bot_game(self, player_id: uuid.UUID) -> StandardResponse:
+        """Creates a game between the player and a server-side bot."""
+        if not settings.bots.enabled:
+            return ResponseBuilder.error(
+                "Bot opponents are disabled", "res_find_game_session"
+            )
+
+        game_id = uuid.uuid4()
+        bot = self.bots.create(game_id)
+        game = GameSession(
+            game_id=game_id,
+            start_datetime=int(time.time()),
+            players={player_id: PlayerBoard(), bot.player_id: PlayerBoard()},
+            status=GameStatus.PLACE_SHIP,
+        )
+        try:
+            await self.repository.create_match(QUEUE_KEY, game)
+        except Exception as e:
+            logger.error("Bot game not saved ERROR: %s", e)
+            return ResponseBuilder.error(
+                "Failed to create game", "res_find_game_session"
+            )
+        GAMES_STARTED.inc()
+        await self.deadlines.cancel(QUEUE_DEADLINE, player_id)
+        await self.deadlines.cancel(BOT_MATCH_DEADLINE, player_id)
+        self.conn_manager.add_player_to_game(player_id, game_id)
+        await self.bots.launch(bot)
+        logger.info("Player %s matched with bot %s", player_id, bot.player_id)
+        return self._game_ready_response(game, player_id)
+
+    async def leave_queue(self, player_id: uuid.UUID) -> bool:
+        """Takes a player out of the matchmaking queue.
+
+        Returns:
+            True if the player was still waiting in the queue.
+        """
+        return await self.repository.pop_from_queue(QUEUE_KEY, player_id)
+
+    def get_next_player(self, game: GameSession, current_id: uuid.UUID) -> uuid.UUID:
         """Determines the next player's turn in a game."""
         for pid in game.players:
             if pid != current_id:
@@ -720,9 +835,9 @@ class GameService:
     ) -> bool:
         """Check if both players are ready to start a game."""
         player1_ready = await self.repository.exist_player_on_game(game_id, player1_id)
-        logger.debug(f"player1_ready {player1_ready}")
+        logger.debug("player1_ready %s", player1_ready)
         player2_ready = await self.repository.exist_player_on_game(game_id, player2_id)
-        logger.debug(f"player2_ready {player2_ready}")
+        logger.debug("player2_ready %s", player2_ready)
         if player1_ready and player2_ready:
             return True
         return False
@@ -741,7 +856,7 @@ class GameService:
     async def pass_turn(self, pass_turn: PassTurn) -> StandardResponse:
         """Handles a player's request to pass their turn to the opponent."""
         logger.debug("INSIDE THE FUNCTION PASS TURN")
-        logger.debug(f"INSIDE PASS_TURN FUNCTION {pass_turn}")
+        logger.debug("INSIDE PASS_TURN FUNCTION %s", pass_turn)
 
         # Load the current game
         game = await self.repository.load_game_session(pass_turn.game_id)
@@ -774,8 +889,7 @@ class GameService:
 
         # Get the opponent
         opponent_id = await self.repository.get_opponent_id(
-            pass_turn.game_id,
-            Player(id=pass_turn.player_id)
+            pass_turn.game_id, pass_turn.player_id
         )
         if not opponent_id:
             return StandardResponse(
@@ -787,7 +901,16 @@ class GameService:
 
         # Switch turn to opponent
         game.current_turn = opponent_id
-        await self.repository.save_game_to_redis(game)
+        await self.repository.update_game_session(
+            game,
+            ("current_turn",),
+            GameEvent.turn_passed(pass_turn.player_id, opponent_id),
+        )
+        await self.deadlines.schedule_turn_timeout(game.game_id, opponent_id)
+        await self.spectators.notify(game.game_id, "spectate_turn", {
+            "current_turn": str(opponent_id),
+            "previous_turn": str(pass_turn.player_id),
+        })
 
         # Notify opponent that it's their turn
         turn_notification = StandardResponse(
@@ -804,12 +927,12 @@ class GameService:
         )
 
         # Send notification to opponent
-        if self.conn_manager.is_player_connected(opponent_id):
+        if await self.conn_manager.is_player_connected(opponent_id):
             await self.conn_manager.send_to_player(
                 opponent_id,
                 turn_notification.to_dict()
             )
-            logger.info(f"Turn passed notification sent to opponent {opponent_id}")
+            logger.info("Turn passed notification sent to opponent %s", opponent_id)
 
         # Return confirmation to the player who passed their turn
         return StandardResponse(
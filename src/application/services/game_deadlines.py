@@ -0,0 +1,211 @@
+"""Turn, disconnection and matchmaking deadlines of the games.
+
+The deadlines are kept by the `DeadlineScheduler`, which calls back the
+handlers registered here when one expires on any worker.
+"""
+
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+from src.api.v1.schemas.game_actions import PassTurn
+from src.api.v1.schemas.place_ships import StandardResponse
+from src.config import settings
+from src.domain.game import GameStatus
+from src.domain.game_events import GameEvent
+from src.infrastructure.deadline_scheduler import DeadlineScheduler
+
+if TYPE_CHECKING:
+    from src.application.services.game import GameService
+
+logger = logging.getLogger(__name__)
+
+TURN_DEADLINE = "turn"
+FORFEIT_DEADLINE = "forfeit"
+QUEUE_DEADLINE = "queue"
+BOT_MATCH_DEADLINE = "bot_match"
+
+
+class GameDeadlines:
+    """Schedules the deadlines of the games and acts on them when they expire.
+
+    Without a scheduler the deadlines are not enforced, and scheduling or
+    cancelling one does nothing.
+    """
+
+    def __init__(
+        self, game_service: "GameService", scheduler: DeadlineScheduler | None
+    ) -> None:
+        """Initializes the deadlines and registers their handlers.
+
+        Args:
+            game_service: Service the expired deadlines act on.
+            scheduler: Runs the turn timeouts, disconnect forfeits and queue
+                expiry.
+        """
+        self.game_service = game_service
+        self.scheduler = scheduler
+        if scheduler is not None:
+            scheduler.register(TURN_DEADLINE, self._on_turn_timeout)
+            scheduler.register(FORFEIT_DEADLINE, self._on_disconnect_forfeit)
+            scheduler.register(QUEUE_DEADLINE, self._on_queue_timeout)
+            scheduler.register(BOT_MATCH_DEADLINE, self._on_bot_match)
+
+    async def schedule(
+        self,
+        kind: str,
+        subject: uuid.UUID,
+        delay_seconds: float,
+        payload: str = "",
+    ) -> None:
+        """Schedules a deadline, never failing the action that set it."""
+        if self.scheduler is None:
+            return
+        try:
+            await self.scheduler.schedule(kind, str(subject), delay_seconds, payload)
+        except Exception as e:
+            logger.error("Failed to schedule %s deadline for %s: %s", kind, subject, e)
+
+    async def cancel(self, kind: str, subject: uuid.UUID) -> None:
+        """Cancels a deadline, never failing the action that cleared it."""
+        if self.scheduler is None:
+            return
+        try:
+            await self.scheduler.cancel(kind, str(subject))
+        except Exception as e:
+            logger.error("Failed to cancel %s deadline for %s: %s", kind, subject, e)
+
+    async def schedule_turn_timeout(
+        self, game_id: uuid.UUID, player_id: uuid.UUID
+    ) -> None:
+        """Gives `player_id` a limited time to play before the turn is passed."""
+        await self.schedule(
+            TURN_DEADLINE,
+            game_id,
+            settings.timers.turn_timeout_seconds,
+            str(player_id),
+        )
+
+    async def schedule_disconnect_forfeit(
+        self, game_id: uuid.UUID, player_id: uuid.UUID
+    ) -> None:
+        """Makes a disconnected player lose the game unless they come back."""
+        await self.schedule(
+            FORFEIT_DEADLINE,
+            game_id,
+            settings.timers.disconnect_forfeit_seconds,
+            str(player_id),
+        )
+
+    async def cancel_disconnect_forfeit(self, game_id: uuid.UUID) -> None:
+        """Cancels the forfeit pending on a game after a reconnection."""
+        await self.cancel(FORFEIT_DEADLINE, game_id)
+
+    async def _on_turn_timeout(self, game_id: str, player_id: str) -> None:
+        """Passes the turn of a player who did not play in time."""
+        game_service = self.game_service
+        game_uuid, player_uuid = uuid.UUID(game_id), uuid.UUID(player_id)
+        async with game_service.repository.game_lock(game_uuid):
+            game = await game_service.repository.load_game_session(game_uuid)
+            if (
+                not game
+                or game.status != GameStatus.IN_PROGRESS
+                or game.current_turn != player_uuid
+            ):
+                return
+            logger.info("Turn of player %s timed out in game %s", player_id, game_id)
+            response = await game_service.pass_turn(
+                PassTurn(game_id=game_uuid, player_id=player_uuid)
+            )
+
+        conn_manager = game_service.conn_manager
+        if response.status == "ok" and await conn_manager.is_player_connected(
+            player_uuid
+        ):
+            timeout_msg = StandardResponse(
+                status="turn_timeout",
+                message="Your time is up, the turn passed to your opponent.",
+                action="confirm_pass_turn",
+                data=response.data,
+            )
+            await conn_manager.send_to_player(player_uuid, timeout_msg.to_dict())
+
+    async def _on_disconnect_forfeit(self, game_id: str, player_id: str) -> None:
+        """Ends the game of a player who did not reconnect in time."""
+        game_service = self.game_service
+        repository = game_service.repository
+        conn_manager = game_service.conn_manager
+        game_uuid, player_uuid = uuid.UUID(game_id), uuid.UUID(player_id)
+        async with repository.game_lock(game_uuid):
+            game = await repository.load_game_session(game_uuid)
+            if (
+                not game
+                or game.status == GameStatus.FINISHED
+                or await conn_manager.is_player_connected(player_uuid)
+            ):
+                return
+            winner_id = game_service.get_next_player(game, player_uuid)
+            game.status = GameStatus.FINISHED
+            game.end_datetime = int(time.time())
+            await repository.update_game_session(
+                game,
+                ("status", "end_datetime"),
+                GameEvent.forfeited(player_uuid, winner_id),
+            )
+
+        logger.info("Player %s forfeited game %s", player_id, game_id)
+        await game_service.spectators.notify(game_uuid, "spectate_game_over", {
+            "winner": str(winner_id),
+            "forfeit": True,
+        })
+        await game_service.end_game(game_uuid)
+        await self.cancel(TURN_DEADLINE, game_uuid)
+        try:
+            await repository.archive_finished_game(game, winner_id)
+        except Exception as e:
+            logger.error("Failed to queue game %s for archiving: %s", game_id, e)
+
+        if await conn_manager.is_player_connected(winner_id):
+            forfeit_msg = StandardResponse(
+                status="game_over",
+                message=f"Player {winner_id} wins! The opponent did not come back.",
+                action="game_ended",
+                data={
+                    "winner": str(winner_id),
+                    "game_id": game_id,
+                    "forfeit": True,
+                },
+            )
+            await conn_manager.send_to_player(winner_id, forfeit_msg.to_dict())
+
+    async def _on_queue_timeout(self, player_id: str, _payload: str) -> None:
+        """Takes a player who waited too long for an opponent out of the queue."""
+        player_uuid = uuid.UUID(player_id)
+        if not await self.game_service.leave_queue(player_uuid):
+            return
+        await self.cancel(BOT_MATCH_DEADLINE, player_uuid)
+        logger.info("Player %s left the queue after waiting too long", player_id)
+
+        conn_manager = self.game_service.conn_manager
+        if await conn_manager.is_player_connected(player_uuid):
+            expired_msg = StandardResponse(
+                status="queue_timeout",
+                message="No opponent found, please try again.",
+                action="res_find_game_session",
+                data={"player_id": player_id},
+            )
+            await conn_manager.send_to_player(player_uuid, expired_msg.to_dict())
+
+    async def _on_bot_match(self, player_id: str, _payload: str) -> None:
+        """Gives a player who found no human opponent in time a bot to play."""
+        player_uuid = uuid.UUID(player_id)
+        conn_manager = self.game_service.conn_manager
+        if not await conn_manager.is_player_connected(player_uuid):
+            return
+        # Leaving the queue first means no human can claim the player while
+        # the bot game is being created.
+        if not await self.game_service.leave_queue(player_uuid):
+            return
+        response = await self.game_service.start_bot_game(player_uuid)
+        await conn_manager.send_to_player(player_uuid, response.to_dict())
@@ -1,5 +1,8 @@
 """Provides the core business logic for the game service."""
 
+# The previous GameService, kept for reference: it repeats most of game.py.
+# pylint: disable=duplicate-code
+
 import logging
 import time
 import uuid
@@ -9,8 +12,10 @@ from typing import Any, List
 from pydantic import ValidationError
 
 from src.domain.game import GameSession, PlayerBoard, GameStatus
+from src.domain.placement import validate_placement
 from src.domain.player import Player
 from src.application.repositories.game_repository import GameRepository
+from src.infrastructure.logger import lazy
 from src.infrastructure.manager.connection_manager import ConnectionManager
 from src.api.v1.schemas.game_actions import (
     FindGameRequest,
@@ -25,6 +30,7 @@ from src.api.v1.schemas.place_ships import (
 )
 from src.api.v1.schemas.player_info import PlayerInfoRequest
 from src.application.ship import parse_ships
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +99,7 @@ class GameService:
                 ships=parse_ships(payload["ships"]),
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -112,7 +118,7 @@ class GameService:
                 players=payload["players"],
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -130,7 +136,7 @@ class GameService:
                 player_id=payload["player_id"],
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -142,7 +148,7 @@ class GameService:
     async def _handle_shoot(
         self, action: str, payload: dict[Any, Any], _player: Player
     ) -> StandardResponse:
-        logger.debug(f"ACTION SHOOT {payload}")
+        logger.debug("ACTION SHOOT %s", payload)
         try:
             req_shoot = ShootRequest(
                 game_id=payload["game_id"],
@@ -150,7 +156,7 @@ class GameService:
                 target=payload["target"],
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -167,7 +173,7 @@ class GameService:
                 player_id=uuid.UUID(payload["player_id"]),
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -187,7 +193,7 @@ class GameService:
                 game_id=uuid.UUID(payload["game_id"])
             )
         except (KeyError, ValidationError) as e:
-            logger.error(f"{action} validation error: {e}")
+            logger.error("%s validation error: %s", action, e)
             return StandardResponse(
                 status="error",
                 message=f"Invalid request payload: {e}",
@@ -211,13 +217,19 @@ class GameService:
         game_id: str = request.game_id
         game_id_uuid: uuid.UUID = uuid.UUID(game_id)
         try:
-            await self.repository.save_player_board(game_id, player, request.ships)
+            layout = validate_placement(
+                ((ship.type, ship.positions) for ship in request.ships),
+                settings.fleet.ships,
+            )
+            await self.repository.save_player_board(
+                game_id, uuid.UUID(request.player_id), layout
+            )
         except Exception as ex:
-            logger.debug(f"EXCEPTION ON PLACE SHIPS SAVING PLAYER BOARD {ex}")
+            logger.debug("EXCEPTION ON PLACE SHIPS SAVING PLAYER BOARD %s", ex)
 
         logger.debug("AFTER SAVE PLAYER BOARD")
         game_session = await self.repository.load_game_session(game_id=game_id_uuid)
-        logger.debug(f"LOAD GAME SESSION {game_session}")
+        logger.debug("LOAD GAME SESSION %s", game_session)
 
         if not game_session:
             return StandardResponse(
@@ -237,7 +249,7 @@ class GameService:
                 data="",
             )
         player1_id, player2_id = player_ids[0], player_ids[1]
-        logger.debug(f"PLAYERS {player1_id} AND THE {player2_id}")
+        logger.debug("PLAYERS %s AND THE %s", player1_id, player2_id)
         ready = await self.are_both_player_ready(
             game_id,
             str(player1_id),
@@ -245,14 +257,16 @@ class GameService:
         )
 
         if ready:
-            logger.debug(f"INSIDE READY TRUE {ready}")
+            logger.debug("INSIDE READY TRUE %s", ready)
             first_turn = random.choice(
                     [player1_id, player2_id]
             )
 
             game_session.current_turn = first_turn
             game_session.status = GameStatus.IN_PROGRESS
-            await self.repository.save_game_to_redis(game_session)
+            await self.repository.update_game_session(
+                game_session, ("current_turn", "status")
+            )
 
             battle_msg = StandardResponse(
                 status="battle_start",
@@ -265,8 +279,9 @@ class GameService:
                 },
             )
             logger.debug(
-                f"BATTLE MSG SENT TO THE FRONT END"
-                f"{battle_msg} and {battle_msg.to_dict()}"
+                "BATTLE MSG SENT TO THE FRONT END %s and %s",
+                battle_msg,
+                lazy(battle_msg.to_dict),
             )
             try:
                 await self.conn_manager.send_to_player(
@@ -278,9 +293,9 @@ class GameService:
                     battle_msg.to_dict()
                 )
             except Exception as ep:
-                logger.debug(f"ERROR SENDING MESSAGE TO PLAYERS {ep}")
+                logger.debug("ERROR SENDING MESSAGE TO PLAYERS %s", ep)
 
-            logger.debug(f"BATLLE MSG {battle_msg}")
+            logger.debug("BATLLE MSG %s", battle_msg)
             return StandardResponse(
                 status="battle_start",
                 message="Ships placed. Battle starting!",
@@ -321,7 +336,7 @@ class GameService:
             try:
                 player_id_int = uuid.UUID(player_id_str)
             except ValueError as e:
-                logger.error(f"Valuer error on start_game validation error: {e}")
+                logger.error("Valuer error on start_game validation error: %s", e)
                 return StandardResponse(
                     status="error",
                     message=f"Invalid player ID: {player_id_str}",
@@ -343,7 +358,7 @@ class GameService:
                     for ship_type, positions in raw_ships_dict.items()
                 ]
             except Exception as e:
-                logger.error(f"Error structuring ship data: {e}")
+                logger.error("Error structuring ship data: %s", e)
                 return StandardResponse(
                     status="error",
                     message="Internal error structuring ship data.",
@@ -353,13 +368,16 @@ class GameService:
 
             try:
                 ships: List[ShipDetails] = parse_ships(raw_ship_list)
+                layout = validate_placement(
+                    ((ship.type, ship.positions) for ship in ships),
+                    settings.fleet.ships,
+                )
             except ValueError as e:
                 return StandardResponse(
                     status="error", message=str(e), action="resp_start_game", data=""
                 )
 
-            player = Player(id=player_id_int)
-            await self.repository.save_player_board(game_id, player, ships)
+            await self.repository.save_player_board(game_id, player_id_int, layout)
 
         return StandardResponse(
             status="OK",
@@ -385,19 +403,13 @@ class GameService:
                 data="",
             )
 
-        player = Player(id=request.player_id)
-        if player.id is None:
-            return StandardResponse(
-                status="error",
-                message="Player not found",
-                action="resp_get_game_info",
-                data="",
-            )
         rtn_player_info = StandardResponse(
             status="OK",
             message=f"player: {request.player_id} info for game: {request.game_id}",
             action="resp_get_game_info",
-            data=await self.repository.get_player_board(request.game_id, player.id),
+            data=await self.repository.get_player_board(
+                request.game_id, request.player_id
+            ),
         )
         return rtn_player_info
 
@@ -410,10 +422,10 @@ class GameService:
         Returns:
             A StandardResponse indicating whether the shot was a hit or miss.
         """
-        logger.debug(f"INSIDE THE SHOOT FUNCTION {request}")
+        logger.debug("INSIDE THE SHOOT FUNCTION %s", request)
 
         game = await self.repository.load_game_session(request.game_id)
-        logger.debug(f"INSIDE THE SHOOT {game}")
+        logger.debug("INSIDE THE SHOOT %s", game)
 
         if not game:
             return StandardResponse(
@@ -428,10 +440,11 @@ class GameService:
             return validation_response
 
         # Get opponent info
-        shooter = Player(id=request.player_id)
-        opponent_id = await self.repository.get_opponent_id(request.game_id, shooter)
+        opponent_id = await self.repository.get_opponent_id(
+            request.game_id, request.player_id
+        )
         if opponent_id is None:
-            logger.info(f"No opponent found for game_id: {request.game_id}")
+            logger.info("No opponent found for game_id: %s", request.game_id)
             return StandardResponse(
                 status="error",
                 message="No opponent found",
@@ -517,7 +530,7 @@ class GameService:
             return await self._process_game_over(game, request)
 
         # Regular hit - continue game
-        await self.repository.save_game_to_redis(game)
+        await self.repository.update_game_session(game, ())
         logger.debug("BEFORE SEND HIT")
 
         await self._notify_opponent_of_hit(opponent_id, request, ship_id, is_sunk, game)
@@ -545,7 +558,7 @@ class GameService:
         opponent_id: uuid.UUID
     ) -> StandardResponse:
         """Process a miss."""
-        await self.repository.save_game_to_redis(game)
+        await self.repository.update_game_session(game, ())
         logger.debug("MISS THE SHOOT")
 
         opponent_notification = StandardResponse(
@@ -609,7 +622,9 @@ class GameService:
         """Process game over scenario."""
         game.status = GameStatus.FINISHED
         game.end_datetime = int(time.time())
-        await self.repository.save_game_to_redis(game)
+        await self.repository.update_game_session(
+            game, ("status", "end_datetime")
+        )
         await self.end_game(game.game_id)
 
         victory_msg = StandardResponse(
@@ -670,6 +685,7 @@ class GameService:
             )
 
     async def find_game_session(self, player: FindGameRequest) -> StandardResponse:
+        """Resumes the player's active game or matches them with an opponent."""
         queue_key = "game:queue"
 
         if await self.repository.is_player_in_active_game(player.player_id):
@@ -678,8 +694,7 @@ class GameService:
                 game = await self.repository.load_game_session(uuid.UUID(game_id_str))
                 if game and game.status != "finished":
                     opponent_id = await self.repository.get_opponent_id(
-                        uuid.UUID(game_id_str),
-                        Player(id=player.player_id)
+                        uuid.UUID(game_id_str), player.player_id
                     )
 
                     # If opponent exists and is connected, resume the game
@@ -687,7 +702,9 @@ class GameService:
                         opponent_id
                     ):
                         logger.info(
-                            f"Resuming game {game_id_str} for player {player.player_id}"
+                            "Resuming game %s for player %s",
+                            game_id_str,
+                            player.player_id,
                         )
 
                         # Associate player with game in connection manager
@@ -713,8 +730,9 @@ class GameService:
                     else:
                         # Opponent is not connected - game is dead
                         logger.info(
-                            f"Opponent {opponent_id} is offline. "
-                            f"Clearing dead game for {player.player_id}"
+                            "Opponent %s is offline. Clearing dead game for %s",
+                            opponent_id,
+                            player.player_id,
                         )
                         await self.repository.clear_player_active_game(player.player_id)
                         # Fall through to treat as new player
@@ -731,12 +749,14 @@ class GameService:
         opponent_player_id = await self.repository.get_opponent_from_queue(
             queue_key, player.player_id
         )
-        logger.debug(f"The opponent_player_id {opponent_player_id}")
+        logger.debug("The opponent_player_id %s", opponent_player_id)
 
         if opponent_player_id:
             await self.repository.pop_from_queue(queue_key, opponent_player_id)
             logger.info(
-                f"Pairing player {player.player_id} with opponent {opponent_player_id}"
+                "Pairing player %s with opponent %s",
+                player.player_id,
+                opponent_player_id,
             )
 
             if opponent_player_id == player.player_id:
@@ -763,7 +783,7 @@ class GameService:
                 },
                 status=GameStatus.PLACE_SHIP,
             )
-            logger.debug(f"AFTER CREATE GAMESESSION {game_data}")
+            logger.debug("AFTER CREATE GAMESESSION %s", game_data)
 
             try:
                 await self.repository.save_game_to_redis(game_data)
@@ -778,7 +798,7 @@ class GameService:
                 self.conn_manager.add_player_to_game(player.player_id, game_id)
 
             except Exception as e:
-                logger.error(f"Game not saved ERROR: {e}")
+                logger.error("Game not saved ERROR: %s", e)
                 await self.repository.push_to_queue(queue_key, player.player_id)
                 await self.repository.push_to_queue(queue_key, opponent_player_id)
                 return StandardResponse(
@@ -860,9 +880,9 @@ class GameService:
             bool: if both players has placed the ships they are ready to start a game
         """
         player1_ready = await self.repository.exist_player_on_game(game_id, player1_id)
-        logger.debug(f"player1_ready {player1_ready}")
+        logger.debug("player1_ready %s", player1_ready)
         player2_ready = await self.repository.exist_player_on_game(game_id, player2_id)
-        logger.debug(f"player2_ready {player2_ready}")
+        logger.debug("player2_ready %s", player2_ready)
         if player1_ready and player2_ready:
             return True
         return False
@@ -888,7 +908,7 @@ class GameService:
             A StandardResponse indicating the outcome of the turn pass.
         """
         logger.debug("INSIDE THE FUNCTION PASS TURN")
-        logger.debug(f"INSIDE PASS_TURN FUNCTION {pass_turn}")
+        logger.debug("INSIDE PASS_TURN FUNCTION %s", pass_turn)
 
         # Load the current game
         game = await self.repository.load_game_session(pass_turn.game_id)
@@ -921,8 +941,7 @@ class GameService:
 
         # Get the opponent
         opponent_id = await self.repository.get_opponent_id(
-            pass_turn.game_id,
-            Player(id=pass_turn.player_id)
+            pass_turn.game_id, pass_turn.player_id
         )
         if not opponent_id:
             return StandardResponse(
@@ -934,7 +953,7 @@ class GameService:
 
         # Switch turn to opponent
         game.current_turn = opponent_id
-        await self.repository.save_game_to_redis(game)
+        await self.repository.update_game_session(game, ("current_turn",))
 
         # Notify opponent that it's their turn
         turn_notification = StandardResponse(
@@ -956,7 +975,7 @@ class GameService:
                 opponent_id,
                 turn_notification.to_dict()
             )
-            logger.info(f"Turn passed notification sent to opponent {opponent_id}")
+            logger.info("Turn passed notification sent to opponent %s", opponent_id)
 
         # Return confirmation to the player who passed their turn
         return StandardResponse(
@@ -42,7 +42,7 @@ class NotificationService:
         )
 
         opponent_uuid = uuid.UUID(data.opponent_id)
-        if self.conn_manager.is_player_connected(opponent_uuid):
+        if await self.conn_manager.is_player_connected(opponent_uuid):
             await self.conn_manager.send_to_player(
                 opponent_uuid,
                 notification.to_dict()
@@ -63,7 +63,7 @@ class NotificationService:
         )
 
         opponent_uuid = uuid.UUID(data.opponent_id)
-        if self.conn_manager.is_player_connected(opponent_uuid):
+        if await self.conn_manager.is_player_connected(opponent_uuid):
             await self.conn_manager.send_to_player(
                 opponent_uuid,
                 notification.to_dict()
@@ -82,5 +82,5 @@ class NotificationService:
         )
 
         for player_id in game.players:
-            if self.conn_manager.is_player_connected(player_id):
+            if await self.conn_manager.is_player_connected(player_id):
                 await self.conn_manager.send_to_player(player_id, victory_msg.to_dict())
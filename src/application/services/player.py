@@ -5,6 +5,7 @@ import re
 from passlib.context import CryptContext  # type: ignore
 from src.application.repositories.player_repository import PlayerRegistrationRepository
 from src.domain.player import Player
+from src.infrastructure.password_pool import PasswordHashPool, password_pool
 
 
 logger = logging.getLogger(__name__)
@@ -16,15 +17,39 @@ VALID_USERNAME = re.compile(r"^[a-zA-Z0-9_]{3,32}$")
 class PlayerRegistrationService:
     """Handles the business logic for player registration."""
 
-    def __init__(self, repo: PlayerRegistrationRepository):
-        """Initializes the service with a player repository."""
+    def __init__(
+        self,
+        repo: PlayerRegistrationRepository,
+        hash_pool: PasswordHashPool | None = None,
+    ):
+        """Initializes the service with a player repository.
+
+        Args:
+            repo: The player repository.
+            hash_pool: Pool running bcrypt off the event loop. Defaults to the
+                process-wide pool.
+        """
         self.repo = repo
+        self.hash_pool = hash_pool or password_pool
+
+    async def verify_password(
+        self, plain_password: str, hashed_password: str | None, username: str = ""
+    ) -> bool:
+        """Verifies a plain password against a hashed one on the hash pool.
 
-    def verify_password(self, plain_password: str, hashed_password: str | None) -> bool:
-        """Verifies a plain password against a hashed one."""
-        logger.debug(f"Verifying password for '{plain_password}' against hash")
-        logger.debug(f"Hashed password from DB: {hashed_password}")
-        return pwd_context.verify(plain_password, hashed_password)
+        Args:
+            plain_password: The password sent by the player, never logged.
+            hashed_password: The stored hash, never logged either.
+            username: The player the password belongs to, for the logs.
+
+        Raises:
+            PasswordPoolBusyError: If the hash pool is saturated.
+        """
+        logger.debug("Verifying password for '%s'", username)
+        verified: bool = await self.hash_pool.run(
+            pwd_context.verify, plain_password, hashed_password
+        )
+        return verified
 
     def _hash_password(self, password: str) -> str:
         """Hashes a password using bcrypt."""
@@ -45,7 +70,12 @@ class PlayerRegistrationService:
         password: str,
         confirm_password: str,
     ) -> uuid.UUID:
-        """Registers a new player after validating input."""
+        """Registers a new player after validating input.
+
+        Raises:
+            ValueError: If the input is invalid or the username is taken.
+            PasswordPoolBusyError: If the hash pool is saturated.
+        """
         # Optional: validate input format here
         if not VALID_USERNAME.match(username):
             raise ValueError("Username must be alphanumeric")
@@ -60,7 +90,7 @@ class PlayerRegistrationService:
         if password != confirm_password:
             raise ValueError("Passwords do not match")
 
-        hashed_password = self._hash_password(password)
+        hashed_password = await self.hash_pool.run(self._hash_password, password)
 
         return await self.repo.register_player(username, email, hashed_password)
 
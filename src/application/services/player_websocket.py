@@ -1,13 +1,14 @@
 """Player WebSocket service containing business logic for WebSocket connections."""
 import uuid
 import logging
-import json
 
 from fastapi import WebSocket
 
+from src.config import settings
 from src.domain.player import Player
 from src.domain.game import GameSession
 from src.application.services.game import GameService
+from src.infrastructure import codec
 from src.infrastructure.persistence.game_repo_impl import GameRedisRepository
 from src.infrastructure.manager.connection_manager import ConnectionManager
 from src.infrastructure.connection.websocket import WebSocketConnection
@@ -44,12 +45,7 @@ class PlayerWebSocketService:
         player = await self._create_and_register_player(websocket, player_id, trace_id)
 
         # Handle reconnection logic
-        reconnected = await self._handle_player_reconnection(
-            websocket,
-            player,
-            player_id,
-            trace_id
-        )
+        reconnected = await self._handle_player_reconnection(player_id, trace_id)
         if reconnected:
             return player_id, player
 
@@ -68,7 +64,7 @@ class PlayerWebSocketService:
         """Extract and validate player_id from first message."""
         try:
             data = await websocket.receive_text()
-            payload = json.loads(data)
+            payload = codec.loads(data)
             player_id_str = payload.get("player_id")
 
             if not player_id_str:
@@ -78,7 +74,7 @@ class PlayerWebSocketService:
                     message="player_id is required in first message",
                     data=None
                 )
-                await websocket.send_json(response.to_dict())
+                await websocket.send_text(codec.dumps_str(response))
                 return None
 
             try:
@@ -90,17 +86,17 @@ class PlayerWebSocketService:
                     message="Invalid player_id format. Must be a valid UUID.",
                     data=None
                 )
-                await websocket.send_json(response.to_dict())
+                await websocket.send_text(codec.dumps_str(response))
                 return None
-        except json.JSONDecodeError as e:
-            logger.error(f"[{trace_id}] Invalid JSON ERROR during registration: {e}")
-            await websocket.send_json({
+        except codec.DecodeError as e:
+            logger.error("[%s] Invalid JSON ERROR during registration: %s", trace_id, e)
+            await websocket.send_text(codec.dumps_str({
                 "status": "error",
                 "message": "Invalid JSON format"
-            })
+            }))
             return None
         except Exception as e:
-            logger.error(f"[{trace_id}] Unexpected ERROR during registration: {e}")
+            logger.error("[%s] Unexpected ERROR during registration: %s", trace_id, e)
             return None
 
     async def _create_and_register_player(
@@ -112,25 +108,24 @@ class PlayerWebSocketService:
         """Create and register player connection."""
         conn_websocket = WebSocketConnection(player_id, websocket)
         player = Player(id=player_id)
-        player_conn = PlayerConnection(player=player, connection=conn_websocket)
-        self.conn_manager.add_player(player_conn)
-        logger.info(f"[{trace_id}] Player {player_id} connected and registered")
+        player_conn = PlayerConnection(
+            player=player,
+            connection=conn_websocket,
+            max_queue=settings.ws.send_queue_size,
+            overflow_policy=settings.ws.overflow_policy,
+        )
+        await self.conn_manager.add_player(player_conn)
+        logger.info("[%s] Player %s connected and registered", trace_id, player_id)
         return player
 
     async def _handle_player_reconnection(
-        self,
-        websocket: WebSocket,
-        player: Player,
-        player_id: uuid.UUID,
-        trace_id: str
+        self, player_id: uuid.UUID, trace_id: str
     ) -> bool:
         """Handle game reconnection logic. Returns True if reconnection was handled."""
         if not await self.game_repo.is_player_in_active_game(player_id):
             return False
 
-        game_id_str = await self.game_repo.redis_client.get(
-            f"player:{player_id}:active_game"
-        )
+        game_id_str = await self.game_repo.get_active_game(player_id)
         if not game_id_str:
             return False
 
@@ -139,19 +134,25 @@ class PlayerWebSocketService:
             return False
 
         opponent_id = await self.game_repo.get_opponent_id(
-            uuid.UUID(game_id_str),
-            player
+            uuid.UUID(game_id_str), player_id
         )
-        if not opponent_id or not self.conn_manager.is_player_connected(opponent_id):
+        if not opponent_id or not await self.conn_manager.is_player_connected(
+            opponent_id
+        ):
             # Opponent is not connected - clear dead game
             logger.info(
-                f"Opponent {opponent_id} is offline. Clearing dead game for {player_id}"
+                "[%s] Opponent %s is offline. Clearing dead game for %s",
+                trace_id,
+                opponent_id,
+                player_id,
             )
             await self.game_repo.clear_player_active_game(player_id)
             return False
 
         # Resume the game
-        self.conn_manager.add_player_to_game(player_id, uuid.UUID(game_id_str))
+        game_id = uuid.UUID(game_id_str)
+        self.conn_manager.add_player_to_game(player_id, game_id)
+        await self.game_service.deadlines.cancel_disconnect_forfeit(game_id)
         await self._notify_opponent_reconnection(
             opponent_id,
             player_id,
@@ -159,7 +160,6 @@ class PlayerWebSocketService:
             game_id_str
         )
         await self._send_resume_response(
-            websocket,
             player_id,
             opponent_id,
             game,
@@ -191,13 +191,13 @@ class PlayerWebSocketService:
             reconnection_msg.to_dict()
         )
         logger.info(
-            f"Sent reconnection notification to opponent {opponent_id}"
-            f" for player {player_id}"
+            "Sent reconnection notification to opponent %s for player %s",
+            opponent_id,
+            player_id,
         )
 
     async def _send_resume_response(
         self,
-        websocket: WebSocket,
         player_id: uuid.UUID,
         opponent_id: uuid.UUID,
         game: GameSession,
@@ -217,7 +217,9 @@ class PlayerWebSocketService:
                 "opponent_connected": True
             }
         )
-        await websocket.send_json(resume_response.to_dict())
+        await self.conn_manager.send_to_player(
+            player_id, codec.dumps_str(resume_response)
+        )
 
     async def _handle_initial_action(
         self,
@@ -230,7 +232,7 @@ class PlayerWebSocketService:
         """
         try:
             data = await websocket.receive_text()
-            payload = json.loads(data)
+            payload = codec.loads(data)
             action = payload.get("action")
 
             if action:
@@ -253,12 +255,14 @@ class PlayerWebSocketService:
                             self.conn_manager.add_player_to_game(player_id, game_id)
                         except ValueError:
                             logger.warning(
-                                f"Invalid game_id in response: {game_id_str}"
+                                "Invalid game_id in response: %s", game_id_str
                             )
 
-                await websocket.send_json(initial_response.to_dict())
+                await self.conn_manager.send_to_player(
+                    player_id, codec.dumps_str(initial_response)
+                )
                 return True
-        except json.JSONDecodeError:
+        except codec.DecodeError:
             # If we can't parse the message again, return False
             return False
         except Exception:
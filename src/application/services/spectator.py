@@ -0,0 +1,77 @@
+"""Lets players watch the games of others."""
+
+import logging
+import uuid
+from typing import Any
+
+from src.api.v1.schemas.game_actions import WatchGameRequest
+from src.api.v1.schemas.place_ships import StandardResponse
+from src.application.builders.response import ResponseBuilder
+from src.application.repositories.game_repository import GameRepository
+from src.domain.game import GameStatus
+from src.domain.player import Player
+from src.infrastructure.manager.connection_manager import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+
+class SpectatorService:
+    """Subscribes spectators to games and sends them the redacted events."""
+
+    def __init__(
+        self, repository: GameRepository, conn_manager: ConnectionManager
+    ) -> None:
+        self.repository = repository
+        self.conn_manager = conn_manager
+
+    async def watch_game(
+        self, request: WatchGameRequest, player: Player
+    ) -> StandardResponse:
+        """Subscribes a player to the live, redacted events of another game."""
+        if player.id is None:
+            return ResponseBuilder.error("Player not found", "error_watch_game")
+
+        game = await self.repository.load_game_session(request.game_id)
+        if not game or game.status == GameStatus.FINISHED:
+            return ResponseBuilder.error("Game is not active", "error_watch_game")
+        if player.id in game.players:
+            return ResponseBuilder.error(
+                "Players cannot watch their own game", "error_watch_game"
+            )
+
+        await self.conn_manager.add_spectator(game.game_id, player.id)
+        return ResponseBuilder.success(
+            f"Watching game {game.game_id}",
+            "resp_watch_game",
+            {
+                "game_id": str(game.game_id),
+                "status": game.status.value,
+                "players": [str(player_id) for player_id in game.players],
+                "current_turn": str(game.current_turn),
+            },
+        )
+
+    async def stop_watching(self, player: Player) -> StandardResponse:
+        """Unsubscribes a player from the game they are watching."""
+        if player.id is not None:
+            await self.conn_manager.remove_spectator(player.id)
+        return ResponseBuilder.success("Stopped watching", "resp_stop_watching")
+
+    async def notify(
+        self, game_id: uuid.UUID, action: str, data: dict[str, Any]
+    ) -> None:
+        """Sends a redacted game event to the game's spectators.
+
+        The frame is built once and handed to the connection manager, which
+        serializes it once for every watcher on every worker.
+        """
+        frame = StandardResponse(
+            status="ok",
+            message="",
+            action=action,
+            data={"game_id": str(game_id), **data},
+        )
+        try:
+            await self.conn_manager.publish_to_spectators(game_id, frame.to_dict())
+        except Exception as e:
+            logger.error("Failed to notify spectators of game %s: %s", game_id, e)
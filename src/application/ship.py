@@ -21,7 +21,7 @@ def parse_ships(raw_ships: List[dict[str, Any]]) -> List[ShipDetails]:
         A list of Ship objects.
     """
     ships: List[ShipDetails] = []
-    logger.debug(f"Raw ships: {raw_ships}")
+    logger.debug("Raw ships: %s", raw_ships)
     for raw_ship in raw_ships:
         ship_name = raw_ship.get("type")
         positions = raw_ship.get("positions")
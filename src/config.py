@@ -16,6 +16,8 @@ The settings are validated at startup using Pydantic, ensuring that:
 - Allowed options (like environment name) are valid.
 """
 
+import socket
+import uuid
 from pathlib import Path
 from typing import Any, Literal
 
@@ -60,6 +62,35 @@ class RedisSettings(BaseSettings):
     username: str = "batalha_redis_user"
     password: str = "nosecret"
     db: int = 0
+    # 3 switches the connection to RESP3.
+    protocol: Literal[2, 3] = 2
+    max_connections: int = 256
+    pool_timeout_seconds: float = 2.0
+    # Must stay above the longest blocking read (GAME_ARCHIVE_BLOCK_MS).
+    socket_timeout_seconds: float = 5.0
+    socket_connect_timeout_seconds: float = 2.0
+    socket_keepalive: bool = True
+    connection_health_check_seconds: int = 30
+    retry_attempts: int = 3
+    retry_backoff_base_seconds: float = 0.01
+    retry_backoff_cap_seconds: float = 0.5
+    warm_connections: int = 16
+    health_check_seconds: float = 5.0
+    # Layout new game sessions are written in. "hash" updates single fields;
+    # "binary" and "json" rewrite a string on every change. All three are
+    # always readable, so a rollout can finish before any worker switches.
+    session_encoding: Literal["hash", "binary", "json"] = "hash"
+    # Connects to a Redis Cluster, with host and port as the seed node.
+    # Cluster mode always hash tags the game keys onto one slot per game;
+    # hash_tag_keys does it on a single server too, so new games can move to
+    # the cluster key layout before the cluster does.
+    cluster: bool = False
+    hash_tag_keys: bool = False
+
+    @property
+    def use_hash_tags(self) -> bool:
+        """Whether a game's keys are hash tagged onto one slot."""
+        return self.cluster or self.hash_tag_keys
 
     @property
     def url(self) -> str:
@@ -72,6 +103,112 @@ class RedisSettings(BaseSettings):
     )
 
 
+class GameCacheSettings(BaseSettings):
+    """Configuration settings for the in-process game session cache."""
+
+    enabled: bool = True
+    max_size: int = 10_000
+    ttl_seconds: float = 300.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="GAME_CACHE_",
+        extra="ignore",
+    )
+
+
+class NodeSettings(BaseSettings):
+    """Configuration settings for running several WebSocket workers."""
+
+    distributed: bool = False
+    node_id: str = Field(
+        default_factory=lambda: f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+    )
+    presence_ttl_seconds: int = 30
+    heartbeat_seconds: float = 10.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="NODE_",
+        extra="ignore",
+    )
+
+
+class GameArchiveSettings(BaseSettings):
+    """Configuration settings for archiving finished games into PostgreSQL."""
+
+    enabled: bool = True
+    batch_size: int = 100
+    block_ms: int = 1000
+    claim_idle_ms: int = 60_000
+    max_retry_delay_seconds: float = 30.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="GAME_ARCHIVE_",
+        extra="ignore",
+    )
+
+
+class TimerSettings(BaseSettings):
+    """Configuration settings for turn, disconnection and queue deadlines."""
+
+    enabled: bool = True
+    tick_seconds: float = 0.1
+    sweep_seconds: float = 5.0
+    turn_timeout_seconds: float = 60.0
+    disconnect_forfeit_seconds: float = 300.0
+    queue_timeout_seconds: float = 120.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="TIMERS_",
+        extra="ignore",
+    )
+
+
+class BotSettings(BaseSettings):
+    """Configuration settings for the server-side bot opponents."""
+
+    enabled: bool = True
+    fill_queue_after_seconds: float = 15.0
+    think_seconds: float = 0.5
+    idle_timeout_seconds: float = 900.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="BOT_",
+        extra="ignore",
+    )
+
+
+class FleetSettings(BaseSettings):
+    """Configuration settings for the fleet every player places."""
+
+    # Ship id mapped to its length; FLEET_SHIPS takes a JSON object.
+    ships: dict[str, int] = Field(
+        default_factory=lambda: {
+            "carrier": 5,
+            "battleship": 4,
+            "cruiser": 3,
+            "submarine": 3,
+            "destroyer": 2,
+        }
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="FLEET_",
+        extra="ignore",
+    )
+
+
+class WebSocketSettings(BaseSettings):
+    """Configuration settings for the outbound WebSocket queues."""
+
+    send_queue_size: int = 256
+    overflow_policy: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+
+    model_config = SettingsConfigDict(
+        env_prefix="WS_",
+        extra="ignore",
+    )
+
+
 class LoggingSettings(BaseSettings):
     """Configuration settings for application logging."""
 
@@ -79,6 +216,7 @@ class LoggingSettings(BaseSettings):
     auto_install: bool = False
     log_format: str = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
     log_date_format: str = "%d-%m-%Y %H:%M:%S"
+    queue_handler: bool = True
     level_styles: dict[str, Any] = Field(default_factory=dict[Any, Any])
     field_styles: dict[str, Any] = Field(default_factory=dict[Any, Any])
 
@@ -139,6 +277,19 @@ class JWTSSettings(BaseSettings):
     )
 
 
+class PasswordHashSettings(BaseSettings):
+    """Configuration settings for the bcrypt worker pool."""
+
+    workers: int = 4
+    max_pending: int = 32
+    retry_after_seconds: int = 1
+
+    model_config = SettingsConfigDict(
+        env_prefix="PASSWORD_HASH_",
+        extra="ignore",
+    )
+
+
 class CORSSettings(BaseSettings):
     """Configuration settings for CORS."""
     # Use a comma-separated string in .env and convert to a list here
@@ -161,8 +312,16 @@ class Settings:
     app: AppSettings = AppSettings()
     db: DatabaseSettings = DatabaseSettings()
     redis: RedisSettings = RedisSettings()
+    game_cache: GameCacheSettings = GameCacheSettings()
+    game_archive: GameArchiveSettings = GameArchiveSettings()
+    timers: TimerSettings = TimerSettings()
+    bots: BotSettings = BotSettings()
+    fleet: FleetSettings = FleetSettings()
+    node: NodeSettings = NodeSettings()
+    ws: WebSocketSettings = WebSocketSettings()
     log: LoggingSettings = LoggingSettings()
     jwt: JWTSSettings = JWTSSettings()
+    password_hash: PasswordHashSettings = PasswordHashSettings()
     cors: CORSSettings = CORSSettings()
 
 
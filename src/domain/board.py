@@ -0,0 +1,49 @@
+"""Coordinates and cell bitmasks of a player's board.
+
+The board is 15x15, so every cell maps to an index and to one bit of a 225-bit
+Python int. A set of cells, such as the cells of a ship, is stored as such a
+bitmask by the binary session layout.
+"""
+
+from typing import Iterable
+
+BOARD_SIZE = 15
+LETTERS = [chr(i) for i in range(ord("A"), ord("A") + BOARD_SIZE)]
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+MASK_BYTES = (CELL_COUNT + 7) // 8
+
+# Parse table built once: "A1" -> 0, "A2" -> 1, ..., "O15" -> 224.
+CELL_NAMES: tuple[str, ...] = tuple(
+    f"{letter}{number}" for letter in LETTERS for number in range(1, BOARD_SIZE + 1)
+)
+CELL_INDEX: dict[str, int] = {name: index for index, name in enumerate(CELL_NAMES)}
+
+
+def cell_to_index(cell: str) -> int:
+    """Converts a coordinate like 'B4' into its cell index.
+
+    Raises:
+        ValueError: If the coordinate is not on the board.
+    """
+    try:
+        return CELL_INDEX[cell]
+    except KeyError as exc:
+        raise ValueError(f"Invalid cell coordinate: {cell}") from exc
+
+
+def mask_from_cells(cells: Iterable[str]) -> int:
+    """Builds a bitmask with one bit set per coordinate."""
+    mask = 0
+    for cell in cells:
+        mask |= 1 << cell_to_index(cell)
+    return mask
+
+
+def cells_from_mask(mask: int) -> list[str]:
+    """Lists the coordinates set in a bitmask, in board order."""
+    cells: list[str] = []
+    while mask:
+        lowest = mask & -mask
+        cells.append(CELL_NAMES[lowest.bit_length() - 1])
+        mask ^= lowest
+    return cells
@@ -1,11 +1,20 @@
-"""Domain models for the game state and related entities."""
+"""Domain models for the game state and related entities.
+
+`GameSession` and `PlayerBoard` are built on every action, so they are plain
+slotted dataclasses rather than pydantic models: they are only ever created by
+the service itself or from data this server stored, never from client input.
+Client input is validated by the pydantic request schemas of the API layer,
+and `to_serializable_dict`/`from_serialized_dict` are the explicit converters
+to and from the stored form.
+"""
 
 import time
 import uuid
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class GameStatus(str, Enum):
@@ -17,13 +26,19 @@ class GameStatus(str, Enum):
     PLACE_SHIP = "place_ship"
 
 
-class PlayerBoard(BaseModel):
+@dataclass(slots=True)
+class PlayerBoard:
     """Represents a player's board, containing their ship placements."""
 
-    board: dict[str, list[str]] = Field(default_factory=dict)
+    board: dict[str, list[str]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the board as stored inside a serialized session."""
+        return {"board": self.board}
 
 
-class GameSession(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GameSession:
     """Represents the state of a single game session.
 
     Attributes:
@@ -36,12 +51,28 @@ class GameSession(BaseModel):
     """
 
     game_id: uuid.UUID
-    start_datetime: int = Field(default_factory=lambda: int(time.time()))
+    start_datetime: int = field(default_factory=lambda: int(time.time()))
     end_datetime: int = 0
     players: dict[uuid.UUID, PlayerBoard]
     current_turn: uuid.UUID | None = None
     status: GameStatus = GameStatus.WAITING
 
+    def copy(self) -> "GameSession":
+        """Returns a copy that shares nothing mutable with this session."""
+        return GameSession(
+            game_id=self.game_id,
+            start_datetime=self.start_datetime,
+            end_datetime=self.end_datetime,
+            players={
+                player_id: PlayerBoard(
+                    {ship: list(cells) for ship, cells in player_board.board.items()}
+                )
+                for player_id, player_board in self.players.items()
+            },
+            current_turn=self.current_turn,
+            status=self.status,
+        )
+
     def to_serializable_dict(self) -> dict[str, Any]:
         """Converts the GameSession object to a JSON-serializable dictionary.
 
@@ -53,7 +84,7 @@ class GameSession(BaseModel):
             "start_datetime": self.start_datetime,
             "end_datetime": self.end_datetime,
             "players": {
-                str(player_id): board.model_dump()
+                str(player_id): board.to_dict()
                 for player_id, board in self.players.items()
             },
             "current_turn":
@@ -69,7 +100,9 @@ class GameSession(BaseModel):
             start_datetime=data["start_datetime"],
             end_datetime=data["end_datetime"],
             players={
-                uuid.UUID(pid): PlayerBoard(**board_data)
+                # Lua cjson implementations differ on whether an empty board
+                # comes back as {} or [], so an empty value means no ships.
+                uuid.UUID(pid): PlayerBoard(board=board_data.get("board") or {})
                 for pid, board_data in data["players"].items()
             },
             current_turn=uuid.UUID(
@@ -0,0 +1,141 @@
+"""Domain events appended to a game's event log, and their replay."""
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterable
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.domain.shot import ShotOutcome
+
+
+class GameEventType(str, Enum):
+    """Kinds of events recorded for a game."""
+
+    CREATED = "created"
+    SHIPS_PLACED = "placed"
+    STARTED = "started"
+    SHOT = "shot"
+    TURN_PASSED = "pass"
+    FORFEITED = "forfeit"
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    """One compact entry of a game's event log.
+
+    Events are stored as flat string fields (a Redis Stream entry), so `data`
+    only holds strings. The shot script writes SHOT events with the same
+    field names directly from Lua.
+
+    Attributes:
+        type: What happened.
+        player_id: The player who acted, if any.
+        timestamp: Unix time of the event.
+        data: Event specific fields.
+    """
+
+    type: GameEventType
+    player_id: uuid.UUID | None = None
+    timestamp: int = field(default_factory=lambda: int(time.time()))
+    data: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def created(cls, game: GameSession) -> "GameEvent":
+        """Event for a new game between the session's players."""
+        return cls(
+            GameEventType.CREATED,
+            timestamp=game.start_datetime,
+            data={"players": ",".join(str(pid) for pid in game.players)},
+        )
+
+    @classmethod
+    def ships_placed(cls, player_id: uuid.UUID, ships: str) -> "GameEvent":
+        """Event for a player's placement, `ships` being the stored JSON."""
+        return cls(GameEventType.SHIPS_PLACED, player_id, data={"ships": ships})
+
+    @classmethod
+    def started(cls, first_turn: uuid.UUID) -> "GameEvent":
+        """Event for the battle starting with `first_turn` to play."""
+        return cls(GameEventType.STARTED, data={"turn": str(first_turn)})
+
+    @classmethod
+    def turn_passed(cls, player_id: uuid.UUID, next_turn: uuid.UUID) -> "GameEvent":
+        """Event for a player handing the turn to the opponent."""
+        return cls(GameEventType.TURN_PASSED, player_id, data={"turn": str(next_turn)})
+
+    @classmethod
+    def forfeited(cls, player_id: uuid.UUID, winner_id: uuid.UUID) -> "GameEvent":
+        """Event for a player losing the game by not coming back in time."""
+        return cls(GameEventType.FORFEITED, player_id, data={"winner": str(winner_id)})
+
+    def to_fields(self) -> dict[str, str]:
+        """Returns the flat fields stored in the stream entry."""
+        fields = {"t": self.type.value, "ts": str(self.timestamp)}
+        if self.player_id is not None:
+            fields["p"] = str(self.player_id)
+        fields.update(self.data)
+        return fields
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, str]) -> "GameEvent":
+        """Rebuilds an event from a stream entry."""
+        data = dict(fields)
+        event_type = GameEventType(data.pop("t"))
+        timestamp = int(data.pop("ts", 0))
+        player = data.pop("p", None)
+        return cls(
+            event_type,
+            uuid.UUID(player) if player else None,
+            timestamp,
+            data,
+        )
+
+
+def apply_event(
+    game_id: uuid.UUID, game: GameSession | None, event: GameEvent
+) -> GameSession | None:
+    """Returns the game session after `event`.
+
+    Events that do not change the session (placements, plain shots) return it
+    unchanged; ships and hits are rebuilt from the board keys, not from here.
+    """
+    if event.type == GameEventType.CREATED:
+        return GameSession(
+            game_id=game_id,
+            start_datetime=event.timestamp,
+            players={
+                uuid.UUID(pid): PlayerBoard()
+                for pid in event.data["players"].split(",")
+            },
+            status=GameStatus.PLACE_SHIP,
+        )
+
+    if game is None:
+        return None
+
+    if event.type == GameEventType.STARTED:
+        game.current_turn = uuid.UUID(event.data["turn"])
+        game.status = GameStatus.IN_PROGRESS
+    elif event.type == GameEventType.TURN_PASSED:
+        game.current_turn = uuid.UUID(event.data["turn"])
+    elif event.type == GameEventType.FORFEITED or (
+        event.type == GameEventType.SHOT
+        and event.data.get("r") == ShotOutcome.GAME_OVER.value
+    ):
+        game.status = GameStatus.FINISHED
+        game.end_datetime = event.timestamp
+    return game
+
+
+def replay(
+    game_id: uuid.UUID,
+    snapshot: GameSession | None,
+    events: Iterable[GameEvent],
+) -> GameSession | None:
+    """Rebuilds a game session from an optional snapshot and the events after it."""
+    game = snapshot.copy() if snapshot is not None else None
+    for event in events:
+        game = apply_event(game_id, game, event)
+    return game
@@ -0,0 +1,81 @@
+"""Server-side validation of a player's ship placement.
+
+Coordinates are parsed once through the cached `CELL_INDEX` table into cell
+indexes, and every ship becomes a bitmask. A ship is straight and contiguous
+exactly when its mask is one of the precomputed placements for its length,
+so the shape check is a set lookup, and overlaps are a single AND against the
+cells already taken. The validated index form is what gets stored, so shots
+never parse the layout again.
+"""
+
+import functools
+from typing import Iterable, Mapping, Sequence
+
+from src.domain.board import CELL_INDEX
+from src.domain.targeting import placements
+
+# Ship id mapped to the cell indexes it occupies, in placement order.
+FleetLayout = dict[str, tuple[int, ...]]
+
+
+class PlacementError(ValueError):
+    """Raised when a ship placement breaks the board or fleet rules."""
+
+
+@functools.lru_cache(maxsize=None)
+def _line_masks(length: int) -> frozenset[int]:
+    """Returns the masks of every straight, contiguous ship of `length`."""
+    masks, _ = placements(length)
+    return frozenset(masks)
+
+
+def validate_placement(
+    ships: Iterable[tuple[str, Sequence[str]]], fleet: Mapping[str, int]
+) -> FleetLayout:
+    """Validates a placement and converts it to cell indexes.
+
+    Args:
+        ships: Ship id and coordinates for every placed ship.
+        fleet: The expected fleet, ship id mapped to its length.
+
+    Raises:
+        PlacementError: If a coordinate is off the board, a ship is not a
+            straight contiguous line of the right length, ships overlap, or
+            the ships placed are not exactly the fleet.
+
+    Returns:
+        Ship id mapped to the cell indexes it occupies.
+    """
+    layout: FleetLayout = {}
+    occupied = 0
+    for ship_id, positions in ships:
+        if ship_id in layout:
+            raise PlacementError(f"Ship {ship_id} placed more than once")
+        length = fleet.get(ship_id)
+        if length is None:
+            raise PlacementError(f"Unknown ship: {ship_id}")
+        if len(positions) != length:
+            raise PlacementError(f"Ship {ship_id} must cover {length} cells")
+
+        cells: list[int] = []
+        mask = 0
+        for position in positions:
+            index = CELL_INDEX.get(position)
+            if index is None:
+                raise PlacementError(f"Invalid cell coordinate: {position}")
+            cells.append(index)
+            mask |= 1 << index
+
+        if mask not in _line_masks(length):
+            raise PlacementError(
+                f"Ship {ship_id} must be a straight line of adjacent cells"
+            )
+        if mask & occupied:
+            raise PlacementError(f"Ship {ship_id} overlaps another ship")
+        occupied |= mask
+        layout[ship_id] = tuple(cells)
+
+    missing = fleet.keys() - layout.keys()
+    if missing:
+        raise PlacementError(f"Missing ships: {', '.join(sorted(missing))}")
+    return layout
@@ -1,23 +1,29 @@
 """Domain model for a player."""
 
 import uuid
+from dataclasses import dataclass, field
 from typing import Optional, Self
-from pydantic import BaseModel, Field
 
 
-class Player(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Player:
     """Represents a player in the game.
 
+    A player is built from an id the API layer has already parsed or from a
+    database row, so it is a plain slotted dataclass; registration and login
+    input is validated by the pydantic schemas in `src.api.v1.schemas`.
+
     Attributes:
         id: The unique identifier for the player.
         username: The player's chosen username.
         email: The player's email address.
+        password: The stored password hash, left out of the repr.
     """
 
     id: Optional[uuid.UUID] = None
     username: Optional[str] = None
     email: Optional[str] = None
-    password: Optional[str] = Field(default=None, exclude=True)
+    password: Optional[str] = field(default=None, repr=False)
 
     @property
     def id_str(self) -> str:
@@ -28,7 +34,3 @@ class Player(BaseModel):
     def empty(cls) -> Self:
         """Creates an empty Player instance."""
         return cls()
-
-    model_config = {
-        "extra": "forbid",  # strict mode
-    }
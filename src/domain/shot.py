@@ -0,0 +1,47 @@
+"""Domain model for the outcome of a shot."""
+
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+
+
+class ShotOutcome(str, Enum):
+    """Enumeration of every possible result of resolving a shot."""
+
+    HIT = "hit"
+    MISS = "miss"
+    GAME_OVER = "game_over"
+    GAME_NOT_FOUND = "game_not_found"
+    GAME_NOT_ACTIVE = "game_not_active"
+    NOT_YOUR_TURN = "not_your_turn"
+    NO_OPPONENT = "no_opponent"
+    ALREADY_HIT = "already_hit"
+    BOARD_NOT_FOUND = "board_not_found"
+
+
+@dataclass
+class ShotResult:
+    """Represents the result of a shot resolved by the repository.
+
+    Attributes:
+        outcome: What happened with the shot.
+        opponent_id: The player whose board was targeted, when known.
+        ship_id: The ship that was hit, if any.
+        sunk: Whether the hit sank the ship.
+        current_turn: The player whose turn it is after the shot.
+    """
+
+    outcome: ShotOutcome
+    opponent_id: uuid.UUID | None = None
+    ship_id: str | None = None
+    sunk: bool = False
+    current_turn: uuid.UUID | None = None
+
+    @property
+    def is_error(self) -> bool:
+        """Returns True when the shot was rejected and nothing was recorded."""
+        return self.outcome not in (
+            ShotOutcome.HIT,
+            ShotOutcome.MISS,
+            ShotOutcome.GAME_OVER,
+        )
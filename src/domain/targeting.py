@@ -0,0 +1,225 @@
+"""Probability-density targeting and random fleet placement for bot players.
+
+For every ship still afloat the model counts the placements that are
+consistent with the shots fired so far, and fires at the unshot cell covered
+by the most placements. In hunt mode (no damaged ship) every placement that
+avoids misses and sunk ships counts. In target mode only the placements of a
+damaged ship that cover all of its known hits count, which walks the shots
+along the ship until it sinks. The server reports the ship id of every hit,
+so hits are attributed to their ship exactly.
+
+Placements are precomputed once per ship length and shared by every model.
+NumPy is used when it is installed (the `bots` extra) to score all placements
+with two matrix products; the fallback walks the placements as integer
+bitmasks.
+"""
+
+import functools
+import random
+from typing import Any, Mapping
+
+from src.domain.board import BOARD_SIZE, CELL_COUNT, CELL_NAMES, cell_to_index
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=None)
+def placements(length: int) -> tuple[tuple[int, ...], tuple[tuple[int, ...], ...]]:
+    """Returns every placement of a ship of `length` on the board.
+
+    Returns:
+        The placements as bitmasks, and as the cell indexes they cover.
+    """
+    masks: list[int] = []
+    cells: list[tuple[int, ...]] = []
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE - length + 1):
+            for indexes in (
+                tuple(row * BOARD_SIZE + col + k for k in range(length)),
+                tuple((col + k) * BOARD_SIZE + row for k in range(length)),
+            ):
+                mask = 0
+                for index in indexes:
+                    mask |= 1 << index
+                masks.append(mask)
+                cells.append(indexes)
+    return tuple(masks), tuple(cells)
+
+
+@functools.lru_cache(maxsize=None)
+def _placement_matrix(length: int) -> Any:
+    """Returns the placements of `length` as a (placements x cells) 0/1 matrix."""
+    _, cells = placements(length)
+    matrix = np.zeros((len(cells), CELL_COUNT), dtype=np.int32)
+    for row, indexes in enumerate(cells):
+        matrix[row, list(indexes)] = 1
+    return matrix
+
+
+def random_fleet(
+    fleet: Mapping[str, int], rng: random.Random | None = None
+) -> dict[str, list[str]]:
+    """Places every ship of `fleet` at random, without overlaps.
+
+    Args:
+        fleet: Ship id mapped to its length.
+        rng: Random source, for reproducible placements.
+
+    Returns:
+        Ship id mapped to the coordinates it occupies.
+    """
+    rng = rng or random.Random()
+    occupied = 0
+    layout: dict[str, list[str]] = {}
+    for ship_id, length in sorted(fleet.items(), key=lambda item: -item[1]):
+        masks, cells = placements(length)
+        while True:
+            choice = rng.randrange(len(masks))
+            if not masks[choice] & occupied:
+                break
+        occupied |= masks[choice]
+        layout[ship_id] = [CELL_NAMES[index] for index in cells[choice]]
+    return layout
+
+
+class TargetingModel:
+    """Chooses shots from a probability-density map of the opponent fleet."""
+
+    def __init__(
+        self,
+        fleet: Mapping[str, int],
+        rng: random.Random | None = None,
+        use_numpy: bool | None = None,
+    ) -> None:
+        """Initializes the model for a fresh opponent board.
+
+        Args:
+            fleet: The opponent's ships, id mapped to length.
+            rng: Random source used to break ties between equal cells.
+            use_numpy: Force or disable the NumPy scorer; defaults to using
+                it when available.
+        """
+        self.fleet = dict(fleet)
+        self.rng = rng or random.Random()
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self.shots = 0
+        self.misses = 0
+        self.ship_hits: dict[str, int] = {}
+        self.sunk: set[str] = set()
+
+    @property
+    def mode(self) -> str:
+        """'target' while a hit ship is still afloat, 'hunt' otherwise."""
+        return "target" if self._damaged() else "hunt"
+
+    def _damaged(self) -> list[str]:
+        return [ship for ship in self.ship_hits if ship not in self.sunk]
+
+    def record(
+        self, cell: str, hit: bool, ship_id: str | None = None, sunk: bool = False
+    ) -> None:
+        """Feeds back the result of a shot.
+
+        Args:
+            cell: The coordinate that was fired at.
+            hit: Whether it hit a ship.
+            ship_id: The ship that was hit, as reported by the server.
+            sunk: Whether the hit sank that ship.
+        """
+        bit = 1 << cell_to_index(cell)
+        self.shots |= bit
+        if not hit:
+            self.misses |= bit
+            return
+        ship = ship_id or cell
+        self.ship_hits[ship] = self.ship_hits.get(ship, 0) | bit
+        if sunk:
+            self.sunk.add(ship)
+
+    def density(self) -> list[int]:
+        """Returns, per cell, the number of placements covering it."""
+        sunk_cells = 0
+        for ship in self.sunk:
+            sunk_cells |= self.ship_hits[ship]
+        damaged = self._damaged()
+        hit_cells = 0
+        for ship in damaged:
+            hit_cells |= self.ship_hits[ship]
+
+        # Each entry: (ship length, cells the placement must cover, cells it
+        # must avoid).
+        constraints: list[tuple[int, int, int]] = []
+        if damaged:
+            for ship in damaged:
+                own = self.ship_hits[ship]
+                length = self.fleet.get(ship)
+                lengths = [length] if length else self._afloat_lengths()
+                avoid = self.misses | sunk_cells | (hit_cells & ~own)
+                constraints.extend((size, own, avoid) for size in lengths)
+        else:
+            avoid = self.misses | sunk_cells
+            constraints = [(size, 0, avoid) for size in self._afloat_lengths()]
+
+        if self.use_numpy and np is not None:
+            return self._density_numpy(constraints)
+        return self._density_bitmask(constraints)
+
+    def _afloat_lengths(self) -> list[int]:
+        return [
+            length for ship, length in self.fleet.items()
+            if ship not in self.sunk and ship not in self.ship_hits
+        ] or [min(self.fleet.values())]
+
+    @staticmethod
+    def _density_bitmask(constraints: list[tuple[int, int, int]]) -> list[int]:
+        counts = [0] * CELL_COUNT
+        for length, required, avoid in constraints:
+            masks, cells = placements(length)
+            for mask, indexes in zip(masks, cells):
+                if mask & avoid or mask & required != required:
+                    continue
+                for index in indexes:
+                    counts[index] += 1
+        return counts
+
+    @staticmethod
+    def _density_numpy(constraints: list[tuple[int, int, int]]) -> list[int]:
+        counts = np.zeros(CELL_COUNT, dtype=np.int64)
+        for length, required, avoid in constraints:
+            matrix = _placement_matrix(length)
+            avoid_vec = _mask_vector(avoid)
+            required_vec = _mask_vector(required)
+            valid = (matrix @ avoid_vec == 0) & (
+                matrix @ required_vec == int(required_vec.sum())
+            )
+            counts += valid.astype(np.int64) @ matrix
+        return [int(count) for count in counts]
+
+    def next_target(self) -> str:
+        """Returns the unshot cell most likely to hold a ship."""
+        counts = self.density()
+        best = -1
+        candidates: list[int] = []
+        for index, count in enumerate(counts):
+            if self.shots >> index & 1:
+                continue
+            if count > best:
+                best, candidates = count, [index]
+            elif count == best:
+                candidates.append(index)
+        if not candidates:
+            raise ValueError("Every cell has already been fired at")
+        return CELL_NAMES[self.rng.choice(candidates)]
+
+
+def _mask_vector(mask: int) -> Any:
+    """Converts a cell bitmask into a 0/1 vector."""
+    vector = np.zeros(CELL_COUNT, dtype=np.int32)
+    while mask:
+        lowest = mask & -mask
+        vector[lowest.bit_length() - 1] = 1
+        mask ^= lowest
+    return vector
@@ -0,0 +1,70 @@
+"""JSON codec shared by the WebSocket protocol, notifications and repositories.
+
+orjson is used when it is installed (the `fast` extra) and the standard library
+json module is the fallback. Both backends encode UUIDs, enums and pydantic
+models (such as StandardResponse) without the callers converting them first.
+"""
+
+import json
+import uuid
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+DecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Converts the types neither backend encodes by itself."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes an object to JSON bytes."""
+        # orjson is a compiled extension pylint cannot introspect.
+        return orjson.dumps(  # type: ignore[no-any-return]  # pylint: disable=no-member
+            obj, default=_default
+        )
+
+    def loads(data: str | bytes | bytearray) -> Any:
+        """Deserializes JSON text or bytes.
+
+        Raises:
+            DecodeError: If the data is not valid JSON.
+        """
+        return orjson.loads(data)  # pylint: disable=no-member
+
+else:  # pragma: no cover - depends on the environment
+    BACKEND = "json"
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes an object to JSON bytes."""
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+    def loads(data: str | bytes | bytearray) -> Any:
+        """Deserializes JSON text or bytes.
+
+        Raises:
+            DecodeError: If the data is not valid JSON.
+        """
+        return json.loads(data)
+
+
+def dumps_str(obj: Any) -> str:
+    """Serializes an object to a JSON string, for text frames and Redis."""
+    return dumps(obj).decode("utf-8")
@@ -1,8 +1,20 @@
 """Binds a player domain object to a connection protocol."""
 
+import asyncio
+import logging
+from typing import Literal
+
 from src.domain.player import Player
 from src.application.repositories.connection_protocol import ConnectionProtocol
 
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_oldest", "disconnect"]
+
+
+class OutboundQueueFullError(Exception):
+    """Raised when a slow connection overflows its outbound queue."""
+
 
 class PlayerConnection:
     """Represents an active player's connection.
@@ -11,25 +23,106 @@ class PlayerConnection:
     of the `ConnectionProtocol`, allowing for sending messages and managing
     the connection state for a specific player.
 
+    Outgoing messages go to a bounded queue drained by a writer task owned by
+    the connection, so callers never wait on the network. Every frame for the
+    player, responses included, goes through this queue, so frames are
+    written in the order they were queued.
+
     Attributes:
         player: The domain object representing the player.
         connection: The protocol object for handling the connection.
+        overflow_policy: What to do when the queue is full, either drop the
+            oldest frame or disconnect the player.
     """
 
-    def __init__(self, player: Player, connection: ConnectionProtocol) -> None:
+    def __init__(
+        self,
+        player: Player,
+        connection: ConnectionProtocol,
+        max_queue: int = 256,
+        overflow_policy: OverflowPolicy = "drop_oldest",
+    ) -> None:
         """Initializes the PlayerConnection.
 
         Args:
             player: The player domain object.
             connection: The connection protocol implementation.
+            max_queue: Maximum number of frames waiting to be written.
+            overflow_policy: Behaviour when the queue is full.
         """
         self.player = player
         self.connection = connection
+        self.overflow_policy = overflow_policy
+        self.dropped_messages = 0
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
+        self._writer: asyncio.Task[None] | None = None
+        self._error: Exception | None = None
+
+    @property
+    def pending_messages(self) -> int:
+        """Number of frames waiting to be written."""
+        return self._queue.qsize()
 
     async def send_message(self, message: str) -> None:
-        """Sends a message to the player via the underlying connection."""
-        await self.connection.send_message(message)
+        """Queues a message for the player without waiting on the network.
+
+        Raises:
+            OutboundQueueFullError: If the queue is full and the overflow
+                policy is to disconnect.
+            Exception: The error that stopped the writer, if any.
+        """
+        if self._error is not None:
+            raise self._error
+
+        if self._queue.full():
+            if self.overflow_policy == "disconnect":
+                raise OutboundQueueFullError(
+                    f"Outbound queue full for Player {self.player.id}"
+                )
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped_messages += 1
+
+        self._queue.put_nowait(message)
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        """Drains the outbound queue into the underlying connection."""
+        while True:
+            message = await self._queue.get()
+            try:
+                await self.connection.send_message(message)
+            except Exception as e:
+                logger.error("Writer stopped for Player %s: %s", self.player.id, e)
+                self._error = e
+                return
+            finally:
+                self._queue.task_done()
+
+    async def flush(self, timeout: float) -> None:
+        """Waits up to `timeout` seconds for the queued frames to be written.
+
+        Returns early if the writer has stopped on an error.
+        """
+        if self._writer is None:
+            return
+        join = asyncio.ensure_future(self._queue.join())
+        await asyncio.wait(
+            {join, self._writer},
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        join.cancel()
+
+    async def stop(self) -> None:
+        """Stops the writer task, dropping any frame still queued."""
+        if self._writer is not None:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
 
     async def close_connection(self) -> None:
         """Closes the underlying connection for the player."""
+        await self.stop()
         await self.connection.close_connection()
@@ -0,0 +1,181 @@
+"""Timed game actions (turn timeouts, disconnect forfeits, queue expiry).
+
+Deadlines live in an in-process `TimerWheel`, so waiting on millions of them
+costs one small object each and nothing per tick. Every deadline is also
+written to the `deadlines` sorted set in Redis (`{deadlines}` with hash tags,
+next to its payload hash on one cluster slot), which makes them survive a
+restart: on start the pending deadlines are loaded back into the wheel, and a
+periodic sweep fires overdue ones that no live worker is tracking (for
+example those scheduled by a worker that crashed).
+
+A deadline is named `{kind}:{subject}`. Scheduling the same name again moves
+it, and before acting on an expired deadline a worker claims it with
+CLAIM_DEADLINE_SCRIPT, so each deadline runs its handler at most once across
+workers and stale copies of moved or cancelled deadlines do nothing.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+import redis.asyncio as aioredis
+
+from src.infrastructure.metrics import DEADLINES_FIRED
+from src.infrastructure.persistence.redis_scripts import CLAIM_DEADLINE_SCRIPT
+from src.infrastructure.redis_keys import RedisKeys
+from src.infrastructure.timer_wheel import TimerWheel
+
+logger = logging.getLogger(__name__)
+
+DeadlineHandler = Callable[[str, str], Awaitable[None]]
+
+
+def deadline_key(kind: str, subject: str) -> str:
+    """Returns the name of the deadline of `kind` for `subject`."""
+    return f"{kind}:{subject}"
+
+
+class DeadlineScheduler:
+    """Runs registered handlers when their deadlines expire."""
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        tick_seconds: float = 0.1,
+        sweep_seconds: float = 5.0,
+        sweep_batch: int = 1000,
+        keys: RedisKeys | None = None,
+    ) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            redis_client: Client holding the persisted deadlines.
+            tick_seconds: Resolution of the timer wheel.
+            sweep_seconds: How often Redis is checked for overdue deadlines
+                that are not tracked by any worker.
+            sweep_batch: Maximum number of overdue deadlines fired per sweep.
+            keys: The key layout; untagged keys when omitted.
+        """
+        self.redis_client = redis_client
+        keys = keys or RedisKeys()
+        self.deadlines_key = keys.deadlines
+        self.payloads_key = keys.deadline_payloads
+        self.tick_seconds = tick_seconds
+        self.sweep_seconds = sweep_seconds
+        self.sweep_batch = sweep_batch
+        self.wheel = TimerWheel(tick_seconds, now=time.time())
+        self._handlers: dict[str, DeadlineHandler] = {}
+        self._claim_deadline = redis_client.register_script(CLAIM_DEADLINE_SCRIPT)
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self.wheel)
+
+    def register(self, kind: str, handler: DeadlineHandler) -> None:
+        """Sets the handler called as `handler(subject, payload)` for `kind`."""
+        self._handlers[kind] = handler
+
+    async def schedule(
+        self, kind: str, subject: str, delay_seconds: float, payload: str = ""
+    ) -> None:
+        """Schedules (or moves) the deadline of `kind` for `subject`.
+
+        Args:
+            kind: The registered handler to run.
+            subject: What the deadline is about, e.g. a game id.
+            delay_seconds: Time from now until the deadline.
+            payload: Extra data handed to the handler.
+        """
+        key = deadline_key(kind, subject)
+        deadline_ms = int((time.time() + delay_seconds) * 1000)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.deadlines_key, {key: deadline_ms})
+            pipe.hset(self.payloads_key, key, payload)
+            await pipe.execute()
+        self.wheel.schedule(key, deadline_ms / 1000)
+
+    async def cancel(self, kind: str, subject: str) -> None:
+        """Cancels the deadline of `kind` for `subject`, on every worker."""
+        key = deadline_key(kind, subject)
+        self.wheel.cancel(key)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.deadlines_key, key)
+            pipe.hdel(self.payloads_key, key)
+            await pipe.execute()
+
+    async def start(self) -> None:
+        """Loads the persisted deadlines and starts the clock."""
+        recovered = 0
+        async for key, score in self.redis_client.zscan_iter(self.deadlines_key):
+            self.wheel.schedule(key, int(score) / 1000)
+            recovered += 1
+        if recovered:
+            logger.info("Recovered %d pending deadlines", recovered)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the clock; pending deadlines stay in Redis."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        """Fires the expired timers every tick and sweeps Redis periodically."""
+        next_sweep = time.monotonic() + self.sweep_seconds
+        while True:
+            await asyncio.sleep(self.tick_seconds)
+            expired = self.wheel.advance(time.time())
+            if expired:
+                await asyncio.gather(*(
+                    self._fire(timer.key, round(timer.deadline * 1000))
+                    for timer in expired
+                ))
+            if time.monotonic() >= next_sweep:
+                next_sweep = time.monotonic() + self.sweep_seconds
+                await self._sweep()
+
+    async def _sweep(self) -> None:
+        """Fires deadlines overdue by more than a sweep that nobody fired."""
+        cutoff_ms = int((time.time() - self.sweep_seconds) * 1000)
+        try:
+            overdue = await self.redis_client.zrangebyscore(
+                self.deadlines_key,
+                "-inf",
+                cutoff_ms,
+                start=0,
+                num=self.sweep_batch,
+                withscores=True,
+            )
+        except Exception as e:
+            logger.error("Failed to sweep overdue deadlines: %s", e)
+            return
+        for key, score in overdue:
+            self.wheel.cancel(key)
+        await asyncio.gather(*(self._fire(key, int(score)) for key, score in overdue))
+
+    async def _fire(self, key: str, deadline_ms: int) -> None:
+        """Claims an expired deadline and runs its handler."""
+        try:
+            payload = await self._claim_deadline(
+                keys=[self.deadlines_key, self.payloads_key],
+                args=[key, deadline_ms],
+            )
+        except Exception as e:
+            logger.error("Failed to claim deadline %s: %s", key, e)
+            return
+        if payload is None:
+            return
+
+        kind, _, subject = key.partition(":")
+        handler = self._handlers.get(kind)
+        if handler is None:
+            logger.warning("No handler for deadline %s", key)
+            return
+        DEADLINES_FIRED.inc(kind=kind)
+        try:
+            await handler(subject, payload)
+        except Exception as e:
+            logger.error("Deadline handler for %s failed: %s", key, e)
@@ -1,7 +1,16 @@
-"""Configures and sets up logging for the application."""
+"""Configures and sets up logging for the application.
 
+Log calls should pass their arguments %-style (`logger.debug("Game %s", game)`)
+so nothing is formatted unless the level is enabled; wrap arguments that are
+expensive to build in `lazy`. Records are handed to a background thread that
+formats them and writes to stderr, keeping that work off the event loop.
+"""
+
+import atexit
 import logging
-from typing import Any
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable
 
 import coloredlogs  # type: ignore
 
@@ -31,10 +40,50 @@ def trace(self: logging.Logger, message: str, *args: Any, **kwargs: Any) -> None
 logging.Logger.trace = trace  # type: ignore
 
 
-def setup_logging() -> None:
+class lazy:
+    """Defers building a log argument until the record is emitted.
+
+    Example:
+        logger.debug("Battle message %s", lazy(battle_msg.to_dict))
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self.func = func
+
+    def __str__(self) -> str:
+        return str(self.func())
+
+    def __repr__(self) -> str:
+        return repr(self.func())
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """Queues records for a QueueListener that does the formatting.
+
+    The stdlib QueueHandler formats the whole record in the calling thread.
+    Here only the %-style merge happens on the caller, so the listener never
+    reads objects the event loop may still be changing; timestamps, colours
+    and tracebacks are formatted by the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging() -> QueueListener | None:
     """Sets up the application's logging configuration.
 
     Configures the root logger to use `coloredlogs` for enhanced console output.
+    When `settings.log.queue_handler` is on, the configured handlers are moved
+    behind a queue drained by a background thread, stopped at exit.
+
+    Returns:
+        The QueueListener writing the records, or None when logging is
+        synchronous.
     """
     logger = logging.getLogger()
     log_level = getattr(logging, settings.log.log_level.upper())
@@ -59,3 +108,16 @@ def setup_logging() -> None:
         handler = logging.StreamHandler()
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+
+    if not settings.log.queue_handler:
+        return None
+
+    handlers = list(logger.handlers)
+    for existing in handlers:
+        logger.removeHandler(existing)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(DeferredFormatQueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
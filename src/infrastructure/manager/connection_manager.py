@@ -1,38 +1,61 @@
 """Manages active WebSocket connections for players."""
 
-import json
+import asyncio
 import logging
 import uuid
 from typing import Any
 
 from src.domain.player import Player
+from src.infrastructure import codec
 from src.infrastructure.connection.player_connection import PlayerConnection
 
 logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
-    """Manages WebSocket connections and player state."""
+    """Manages WebSocket connections and player state.
+
+    Besides its two players, a game can have any number of spectators: each
+    game keeps the set of connections watching it, and every spectator frame
+    is serialized once and queued as the same string on all of them.
+    """
 
     def __init__(self, max_players: int = 2) -> None:
         self.connected_players: dict[uuid.UUID, PlayerConnection] = {}
         self.player_game_map: dict[uuid.UUID, uuid.UUID] = {}  # player_id → game_id
+        self.spectators: dict[uuid.UUID, set[uuid.UUID]] = {}  # game_id → watchers
+        self.spectator_game_map: dict[uuid.UUID, uuid.UUID] = {}  # watcher → game_id
         self.max_players = max_players
 
-    def add_player(self, player_conn: PlayerConnection) -> None:
+    async def start(self) -> None:
+        """Starts any background work the manager needs."""
+        pass
+
+    async def stop(self) -> None:
+        """Stops the background work started by start."""
+        pass
+
+    async def add_player(self, player_conn: PlayerConnection) -> None:
         """Add a player connection to the active player list."""
         if player_conn.player.id is not None:
+            previous = self.connected_players.get(player_conn.player.id)
             self.connected_players[player_conn.player.id] = player_conn
-        logger.info(f"Player {player_conn.player.id} connected.")
+            if previous is not None and previous is not player_conn:
+                await previous.stop()
+        logger.info("Player %s connected.", player_conn.player.id)
 
-    def remove_player(self, player_id: uuid.UUID | None) -> None:
+    async def remove_player(self, player_id: uuid.UUID | None) -> None:
         """Remove a player from the connection list by ID."""
         if player_id in self.connected_players and player_id is not None:
-            del self.connected_players[player_id]
+            player_conn = self.connected_players.pop(player_id)
+            await player_conn.stop()
             if player_id in self.player_game_map:
                 del self.player_game_map[player_id]
+            await self.remove_spectator(player_id)
             logger.info(
-                f"Player {player_id} removed. Remaining: {len(self.connected_players)}"
+                "Player %s removed. Remaining: %d",
+                player_id,
+                len(self.connected_players),
             )
 
     def get_player(self, player: Player) -> PlayerConnection | None:
@@ -47,20 +70,37 @@ class ConnectionManager:
         """
         Broadcast a message to all connected players, optionally excluding one.
 
-        Removes disconnected players automatically.
+        Removes disconnected players automatically. Every send only queues the
+        frame on the player's connection, so the fan-out runs concurrently.
         """
-        to_remove: list[uuid.UUID] = []
-        for player_id, player_conn in self.connected_players.items():
-            if player_id == excluded_player_id:
-                continue
-            try:
-                await player_conn.send_message(message)
-            except Exception as e:
-                logger.error(f"Failed to send to Player {player_id}: {e}")
-                to_remove.append(player_id)
-
-        for pid in to_remove:
-            await self._remove_and_close(pid)
+        await self._fan_out(
+            [
+                player_id
+                for player_id in self.connected_players
+                if player_id != excluded_player_id
+            ],
+            message,
+        )
+
+    async def _fan_out(self, player_ids: list[uuid.UUID], message: str) -> None:
+        """Queues one serialized frame on many local connections at once.
+
+        Players whose connection fails are removed and closed.
+        """
+        recipients = [
+            (player_id, self.connected_players[player_id])
+            for player_id in player_ids
+            if player_id in self.connected_players
+        ]
+        results = await asyncio.gather(
+            *(player_conn.send_message(message) for _, player_conn in recipients),
+            return_exceptions=True,
+        )
+
+        for (player_id, _), result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send to Player %s: %s", player_id, result)
+                await self._remove_and_close(player_id)
 
     async def _remove_and_close(self, player_id: uuid.UUID) -> None:
         """Gracefully remove and close a player's connection."""
@@ -69,19 +109,8 @@ class ConnectionManager:
             try:
                 await player.close_connection()
             except Exception as e:
-                logger.error(f"Error closing connection for Player {player_id}: {e}")
-            self.remove_player(player_id)
-
-    def default_encoder(self, obj: uuid.UUID) -> str:
-        """JSON encoder for UUID objects, converting them to strings.
-
-        Args:
-            obj: The object to encode. Expected to be a UUID.
-
-        Returns:
-            The string representation of the UUID.
-        """
-        return str(obj)
+                logger.error("Error closing connection for Player %s: %s", player_id, e)
+            await self.remove_player(player_id)
 
     async def send_to_player(
         self, player_id: uuid.UUID, message: str | dict[str, Any]
@@ -94,26 +123,83 @@ class ConnectionManager:
             message (str): The message to be send
         """
         if isinstance(message, dict):
-            message = json.dumps(message, default=self.default_encoder)
+            message = codec.dumps_str(message)
         player_conn = self.connected_players.get(player_id)
         if player_conn:
             try:
                 await player_conn.send_message(message=message)
             except Exception as e:
                 logger.error(
-                    f"Failed to send message to Player: {player_id} error: {e}"
+                    "Failed to send message to Player: %s error: %s", player_id, e
                 )
                 await self._remove_and_close(player_id)
 
+    async def flush_player(self, player_id: uuid.UUID, timeout: float = 1.0) -> None:
+        """Waits up to `timeout` seconds for a player's queued frames to go out.
+
+        Used before closing a connection, since removing a player drops the
+        frames still queued for it.
+        """
+        player_conn = self.connected_players.get(player_id)
+        if player_conn:
+            await player_conn.flush(timeout)
+
     def add_player_to_game(self, player_id: uuid.UUID, game_id: uuid.UUID) -> None:
         """Associate a connected player with a specific game."""
         self.player_game_map[player_id] = game_id
-        logger.debug(f"Player {player_id} associated with game {game_id}")
+        logger.debug("Player %s associated with game %s", player_id, game_id)
 
-    def is_player_connected(self, player_id: uuid.UUID) -> bool:
+    async def is_player_connected(self, player_id: uuid.UUID) -> bool:
         """Check if a player is currently connected via WebSocket."""
         return player_id in self.connected_players
 
     def get_player_game(self, player_id: uuid.UUID) -> uuid.UUID | None:
         """Get the game ID that a connected player is currently in."""
         return self.player_game_map.get(player_id)
+
+    async def add_spectator(self, game_id: uuid.UUID, player_id: uuid.UUID) -> None:
+        """Makes a connected player watch a game, leaving any game watched before."""
+        if self.spectator_game_map.get(player_id) == game_id:
+            return
+        await self.remove_spectator(player_id)
+        self.spectators.setdefault(game_id, set()).add(player_id)
+        self.spectator_game_map[player_id] = game_id
+        logger.debug("Player %s watching game %s", player_id, game_id)
+
+    async def remove_spectator(self, player_id: uuid.UUID) -> None:
+        """Stops a player from watching the game they are watching, if any."""
+        game_id = self.spectator_game_map.pop(player_id, None)
+        if game_id is None:
+            return
+        watchers = self.spectators.get(game_id)
+        if watchers is not None:
+            watchers.discard(player_id)
+            if not watchers:
+                del self.spectators[game_id]
+
+    def spectator_count(self, game_id: uuid.UUID | None = None) -> int:
+        """Number of local spectators of a game, or of every game."""
+        if game_id is not None:
+            return len(self.spectators.get(game_id, ()))
+        return len(self.spectator_game_map)
+
+    async def publish_to_spectators(
+        self, game_id: uuid.UUID, message: str | dict[str, Any]
+    ) -> None:
+        """Sends a frame to everyone watching a game.
+
+        Args:
+            game_id: The watched game.
+            message: The frame; a dict is serialized once for all watchers.
+        """
+        if game_id not in self.spectators:
+            return
+        if isinstance(message, dict):
+            message = codec.dumps_str(message)
+        await self._deliver_to_spectators(game_id, message)
+
+    async def _deliver_to_spectators(self, game_id: uuid.UUID, message: str) -> None:
+        """Queues a serialized frame on the local spectators of a game."""
+        watchers = self.spectators.get(game_id)
+        if watchers:
+            await self._fan_out(list(watchers), message)
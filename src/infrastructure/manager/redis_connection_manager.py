@@ -0,0 +1,292 @@
+"""Routes WebSocket messages between workers through Redis pub/sub."""
+
+import asyncio
+import functools
+import logging
+import uuid
+from typing import Any, Awaitable, Callable
+
+import redis.asyncio as aioredis
+from redis.asyncio.client import PubSub
+
+from src.infrastructure import codec
+from src.infrastructure.connection.player_connection import PlayerConnection
+from src.infrastructure.manager.connection_manager import ConnectionManager
+from src.infrastructure.persistence.redis_scripts import RELEASE_PRESENCE_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "ws:broadcast"
+LISTEN_TIMEOUT_SECONDS = 1.0
+# Backoff between attempts to re-open a dropped pub/sub connection.
+RESUBSCRIBE_BASE_SECONDS = 0.5
+RESUBSCRIBE_CAP_SECONDS = 10.0
+
+ChannelHandler = Callable[[str], Awaitable[None]]
+
+
+def presence_key(player_id: uuid.UUID) -> str:
+    """Returns the Redis key holding the node a player is connected to."""
+    return f"presence:{player_id}"
+
+
+def node_channel(node_id: str) -> str:
+    """Returns the pub/sub channel a node listens to for direct messages."""
+    return f"ws:node:{node_id}"
+
+
+def spectator_channel(game_id: uuid.UUID) -> str:
+    """Returns the pub/sub channel carrying the spectator frames of a game."""
+    return f"ws:spectate:{game_id}"
+
+
+class RedisConnectionManager(ConnectionManager):
+    """A ConnectionManager that can reach players connected to other workers.
+
+    Every worker (node) subscribes to its own channel and records, for each of
+    its players, a `presence:{player_id} -> node_id` key kept alive by a
+    heartbeat. Messages for a player that lives on another node are published
+    on that node's channel and delivered there.
+
+    Spectator frames are published once per game on `ws:spectate:{game_id}`,
+    which a node subscribes to only while it has local watchers of that game,
+    so the game worker pays one PUBLISH whatever the audience size and each
+    node fans the same frame out to its own watchers.
+
+    On a Redis Cluster, whose client has no pub/sub, publishing and
+    subscribing go through `pubsub_client`, a plain client to one node; the
+    cluster forwards the messages to every node.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        node_id: str,
+        presence_ttl_seconds: int = 30,
+        heartbeat_seconds: float = 10.0,
+        channel_handlers: dict[str, ChannelHandler] | None = None,
+        max_players: int = 2,
+        pubsub_client: aioredis.Redis | None = None,
+    ) -> None:
+        super().__init__(max_players)
+        self.redis_client = redis_client
+        self.pubsub_client = pubsub_client or redis_client
+        self.node_id = node_id
+        self.channel = node_channel(node_id)
+        self.presence_ttl_seconds = presence_ttl_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self._channel_handlers: dict[str, ChannelHandler] = dict(
+            channel_handlers or {}
+        )
+        self._pubsub: PubSub | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._release_presence = redis_client.register_script(RELEASE_PRESENCE_SCRIPT)
+
+    async def start(self) -> None:
+        """Subscribes to the node channels and starts the presence heartbeat."""
+        await self._open_pubsub()
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._heartbeat()),
+        ]
+        logger.info("Node %s listening on %s", self.node_id, self.channel)
+
+    async def stop(self) -> None:
+        """Stops the background tasks and releases the local presences."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        for player_id in list(self.connected_players):
+            await self._release_presence(
+                keys=[presence_key(player_id)], args=[self.node_id]
+            )
+
+        await self._close_pubsub()
+
+    async def _close_pubsub(self) -> None:
+        """Closes the pub/sub connection, ignoring errors of a dead one."""
+        if self._pubsub is None:
+            return
+        pubsub, self._pubsub = self._pubsub, None
+        try:
+            await pubsub.aclose()
+        except Exception as e:
+            logger.debug("Error closing pub/sub on node %s: %s", self.node_id, e)
+
+    async def _open_pubsub(self) -> PubSub:
+        """Opens a pub/sub connection subscribed to every channel of the node.
+
+        That is the node and broadcast channels plus every extra channel
+        registered through `subscribe`, spectator channels included.
+        """
+        pubsub = self.pubsub_client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub = pubsub
+        await pubsub.subscribe(self.channel, BROADCAST_CHANNEL, *self._channel_handlers)
+        return pubsub
+
+    async def subscribe(self, channel: str, handler: ChannelHandler) -> None:
+        """Registers a handler for an extra pub/sub channel."""
+        self._channel_handlers[channel] = handler
+        if self._pubsub is not None:
+            await self._pubsub.subscribe(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        """Removes the handler of an extra pub/sub channel."""
+        self._channel_handlers.pop(channel, None)
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(channel)
+
+    async def add_player(self, player_conn: PlayerConnection) -> None:
+        await super().add_player(player_conn)
+        if player_conn.player.id is not None:
+            await self.redis_client.set(
+                presence_key(player_conn.player.id),
+                self.node_id,
+                ex=self.presence_ttl_seconds,
+            )
+
+    async def remove_player(self, player_id: uuid.UUID | None) -> None:
+        if player_id is None:
+            return
+        is_local = player_id in self.connected_players
+        await super().remove_player(player_id)
+        if is_local:
+            await self._release_presence(
+                keys=[presence_key(player_id)], args=[self.node_id]
+            )
+
+    async def is_player_connected(self, player_id: uuid.UUID) -> bool:
+        if player_id in self.connected_players:
+            return True
+        return bool(await self.redis_client.exists(presence_key(player_id)))
+
+    async def send_to_player(
+        self, player_id: uuid.UUID, message: str | dict[str, Any]
+    ) -> None:
+        if player_id in self.connected_players:
+            await super().send_to_player(player_id, message)
+            return
+
+        node_id = await self.redis_client.get(presence_key(player_id))
+        if not node_id or node_id == self.node_id:
+            logger.debug("Player %s is not connected to any node", player_id)
+            return
+
+        envelope = codec.dumps({"player_id": player_id, "message": message})
+        await self.pubsub_client.publish(node_channel(node_id), envelope)
+
+    async def broadcast(
+        self, message: str, excluded_player_id: uuid.UUID | None = None
+    ) -> None:
+        await super().broadcast(message, excluded_player_id)
+        envelope = codec.dumps({
+            "origin": self.node_id,
+            "excluded": excluded_player_id,
+            "message": message,
+        })
+        await self.pubsub_client.publish(BROADCAST_CHANNEL, envelope)
+
+    async def add_spectator(self, game_id: uuid.UUID, player_id: uuid.UUID) -> None:
+        await super().add_spectator(game_id, player_id)
+        channel = spectator_channel(game_id)
+        if channel not in self._channel_handlers:
+            await self.subscribe(
+                channel, functools.partial(self._deliver_to_spectators, game_id)
+            )
+
+    async def remove_spectator(self, player_id: uuid.UUID) -> None:
+        game_id = self.spectator_game_map.get(player_id)
+        await super().remove_spectator(player_id)
+        if game_id is not None and game_id not in self.spectators:
+            await self.unsubscribe(spectator_channel(game_id))
+
+    async def publish_to_spectators(
+        self, game_id: uuid.UUID, message: str | dict[str, Any]
+    ) -> None:
+        # Local watchers get the frame through this node's own subscription.
+        if isinstance(message, dict):
+            message = codec.dumps_str(message)
+        await self.pubsub_client.publish(spectator_channel(game_id), message)
+
+    async def _listen(self) -> None:
+        """Delivers the messages published for this node.
+
+        Messages are polled with a short timeout rather than a blocking read,
+        so a quiet channel never trips the client's socket timeout. When the
+        pub/sub connection fails, it is reopened and every channel subscribed
+        again, with a capped exponential backoff between attempts. Messages
+        published in the meantime are lost.
+        """
+        backoff = RESUBSCRIBE_BASE_SECONDS
+        while True:
+            try:
+                pubsub = self._pubsub
+                if pubsub is None:
+                    pubsub = await self._open_pubsub()
+                    logger.info("Node %s resubscribed to pub/sub", self.node_id)
+                item = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT_SECONDS
+                )
+            except Exception as e:
+                logger.error(
+                    "Pub/sub connection lost on node %s, retrying in %.1f s: %s",
+                    self.node_id,
+                    backoff,
+                    e,
+                )
+                await self._close_pubsub()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, RESUBSCRIBE_CAP_SECONDS)
+                continue
+            backoff = RESUBSCRIBE_BASE_SECONDS
+            if item is None:
+                continue
+            try:
+                await self._dispatch(item["channel"], item["data"])
+            except Exception as e:
+                logger.error("Failed to dispatch message on %s: %s", item["channel"], e)
+
+    async def _dispatch(self, channel: str, data: str) -> None:
+        """Routes one pub/sub message to the local players or a handler."""
+        if channel == self.channel:
+            envelope = codec.loads(data)
+            await super().send_to_player(
+                uuid.UUID(envelope["player_id"]), envelope["message"]
+            )
+            return
+
+        if channel == BROADCAST_CHANNEL:
+            envelope = codec.loads(data)
+            if envelope["origin"] == self.node_id:
+                return
+            excluded = envelope.get("excluded")
+            await super().broadcast(
+                envelope["message"], uuid.UUID(excluded) if excluded else None
+            )
+            return
+
+        handler = self._channel_handlers.get(channel)
+        if handler is not None:
+            await handler(data)
+
+    async def _heartbeat(self) -> None:
+        """Keeps the presence of the local players from expiring."""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            if not self.connected_players:
+                continue
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for player_id in self.connected_players:
+                        pipe.set(
+                            presence_key(player_id),
+                            self.node_id,
+                            ex=self.presence_ttl_seconds,
+                        )
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(
+                    "Presence heartbeat failed on node %s: %s", self.node_id, e
+                )
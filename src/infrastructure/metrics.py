@@ -0,0 +1,366 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+A deliberately small implementation of counters, gauges and histograms so the
+hot paths only pay for a dictionary lookup and an addition. The application
+metrics are declared at the bottom of this module and rendered by `/metrics`.
+"""
+
+import functools
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, Iterator, ParamSpec, TypeVar
+
+LabelKey = tuple[str, ...]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: LabelKey, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """Base class holding the name, help text and label names of a metric."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+
+    def _key(self, labels: dict[str, str]) -> LabelKey:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def header(self) -> list[str]:
+        """Returns the HELP and TYPE lines of the metric."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def samples(self) -> list[str]:
+        """Returns the sample lines of the metric."""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increments the counter for the given label values."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """Sets the counter to a total kept elsewhere, read at scrape time."""
+        self._values[self._key(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        """Returns the current value for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {value}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """A value that can go up and down, set directly or at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Sets the gauge for the given label values."""
+        self._values[self._key(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        """Returns the current value for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {value}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Counts observations into cumulative buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label key: one (non-cumulative) count per bucket, plus +Inf.
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Records one observation for the given label values."""
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observes the duration of the wrapped block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Returns the number of observations for the given label values."""
+        return sum(self._counts.get(self._key(labels), []))
+
+    def samples(self) -> list[str]:
+        lines = []
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        for key, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(self.labels, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {self._sums[key]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collects metrics and renders them in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        """Adds a metric to the registry.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> Counter:
+        """Creates and registers a counter."""
+        metric = Counter(name, documentation, labels)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> Gauge:
+        """Creates and registers a gauge."""
+        metric = Gauge(name, documentation, labels)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Creates and registers a histogram."""
+        metric = Histogram(name, documentation, labels, buckets)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+ACTION_LATENCY = REGISTRY.histogram(
+    "ws_action_duration_seconds",
+    "Time spent handling a WebSocket action.",
+    ("action",),
+)
+REPOSITORY_LATENCY = REGISTRY.histogram(
+    "repository_operation_duration_seconds",
+    "Time spent in a GameRedisRepository operation, from call to return.",
+    ("operation",),
+)
+REDIS_CALLS = REGISTRY.counter(
+    "redis_calls_total",
+    "Commands sent to Redis, by the WebSocket action sending them.",
+    ("action",),
+)
+REDIS_UP = REGISTRY.gauge(
+    "redis_up", "1 if the last Redis health check succeeded, 0 otherwise."
+)
+REDIS_PING_LATENCY = REGISTRY.gauge(
+    "redis_ping_latency_seconds", "Round-trip time of the last Redis health check."
+)
+REDIS_POOL_CONNECTIONS = REGISTRY.gauge(
+    "redis_pool_connections", "Redis pool connections, by state.", ("state",)
+)
+SESSION_CACHE_EVENTS = REGISTRY.counter(
+    "session_cache_events_total",
+    "Game session cache hits, misses, evictions and expirations.",
+    ("event",),
+)
+SHOTS = REGISTRY.counter(
+    "shots_total", "Shots resolved, by result.", ("result",)
+)
+GAMES_STARTED = REGISTRY.counter("games_started_total", "Games created.")
+GAMES_FINISHED = REGISTRY.counter(
+    "games_finished_total", "Games that ended with a fleet sunk."
+)
+GAMES_ARCHIVED = REGISTRY.counter(
+    "games_archived_total", "Finished games written to casual_games."
+)
+DEADLINES_FIRED = REGISTRY.counter(
+    "deadlines_fired_total", "Expired deadlines acted on, by kind.", ("kind",)
+)
+PENDING_DEADLINES = REGISTRY.gauge(
+    "pending_deadlines", "Deadlines tracked by this worker's timer wheel."
+)
+ACTIVE_BOTS = REGISTRY.gauge(
+    "active_bots", "Bot opponents playing a game on this worker."
+)
+CONNECTED_PLAYERS = REGISTRY.gauge(
+    "connected_players", "Players connected to this worker."
+)
+SPECTATORS = REGISTRY.gauge(
+    "spectators", "Spectators connected to this worker."
+)
+ACTIVE_GAMES = REGISTRY.gauge(
+    "active_games", "Games with at least one player connected to this worker."
+)
+QUEUE_LENGTH = REGISTRY.gauge(
+    "matchmaking_queue_length", "Players waiting in the matchmaking queue."
+)
+DB_POOL_CONNECTIONS = REGISTRY.gauge(
+    "db_pool_connections", "asyncpg pool connections, by state.", ("state",)
+)
+PASSWORD_POOL_IN_FLIGHT = REGISTRY.gauge(
+    "password_pool_in_flight", "Password hashing jobs running or waiting."
+)
+PASSWORD_POOL_QUEUE_DEPTH = REGISTRY.gauge(
+    "password_pool_queue_depth", "Password hashing jobs waiting for a thread."
+)
+PASSWORD_POOL_REJECTED = REGISTRY.counter(
+    "password_pool_rejected_total", "Password hashing jobs rejected as saturated."
+)
+
+# The WebSocket action being handled, "none" outside of one.
+_current_action: ContextVar[str] = ContextVar("current_action", default="none")
+
+
+@contextmanager
+def track_action(action: str) -> Iterator[None]:
+    """Times a WebSocket action and counts the Redis calls made under it."""
+    token = _current_action.set(action)
+    try:
+        with ACTION_LATENCY.time(action=action):
+            yield
+    finally:
+        _current_action.reset(token)
+
+
+def observe_redis(
+    func: Callable[P, Coroutine[Any, Any, T]]
+) -> Callable[P, Coroutine[Any, Any, T]]:
+    """Decorates a repository coroutine to record its latency in REPOSITORY_LATENCY.
+
+    The operation may be answered from the session cache or send several
+    commands, so this is not the latency of a Redis command; those are
+    counted by `count_redis_calls`.
+    """
+    operation = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            REPOSITORY_LATENCY.observe(
+                time.perf_counter() - started, operation=operation
+            )
+
+    return wrapper
+
+
+def count_redis_calls(client: Any) -> None:
+    """Counts every command a Redis client sends in REDIS_CALLS.
+
+    Commands are counted under the current action as they are sent: one for
+    each direct command, including the EVALSHA of a script, and one for each
+    command queued on a pipeline when it is executed. Pub/sub is not counted.
+
+    Args:
+        client: A redis-py asyncio client or cluster client, patched in place.
+    """
+    execute_command = client.execute_command
+    pipeline = client.pipeline
+
+    async def counted_execute_command(*args: Any, **options: Any) -> Any:
+        REDIS_CALLS.inc(action=_current_action.get())
+        return await execute_command(*args, **options)
+
+    def counted_pipeline(*args: Any, **kwargs: Any) -> Any:
+        pipe = pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def counted_execute(*exec_args: Any, **exec_kwargs: Any) -> Any:
+            REDIS_CALLS.inc(len(pipe), action=_current_action.get())
+            return await execute(*exec_args, **exec_kwargs)
+
+        pipe.execute = counted_execute
+        return pipe
+
+    client.execute_command = counted_execute_command
+    client.pipeline = counted_pipeline
@@ -0,0 +1,112 @@
+"""Bounded thread pool for CPU-bound password hashing."""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from src.config import settings
+from src.infrastructure.metrics import PASSWORD_POOL_REJECTED
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordPoolBusyError(Exception):
+    """Raised when the password pool already holds its maximum of pending jobs."""
+
+
+@dataclass
+class PasswordPoolStats:
+    """Counters describing the password pool since it was created."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+
+
+class PasswordHashPool:
+    """Runs bcrypt hashing and verification off the event loop.
+
+    bcrypt releases the GIL while it works, so a small thread pool keeps the
+    event loop (and every WebSocket game on the worker) responsive while
+    logins are processed. Jobs beyond `max_pending` are rejected instead of
+    queued, so a login storm fails fast rather than building an unbounded
+    backlog.
+
+    The threads are started by the first job, and again by the first job
+    after a `shutdown`. The process-wide pool can therefore be shut down by
+    an application lifespan and still serve the next one.
+
+    Attributes:
+        workers: Number of threads hashing passwords.
+        max_pending: Maximum number of jobs running or waiting for a thread.
+        stats: Submitted, completed, failed and rejected job counters.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 32) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.stats = PasswordPoolStats()
+        self._in_flight = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs running or waiting for a thread."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a free thread."""
+        return max(0, self._in_flight - self.workers)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs `func(*args)` on the pool and waits for its result.
+
+        Raises:
+            PasswordPoolBusyError: If `max_pending` jobs are already admitted.
+        """
+        if self._in_flight >= self.max_pending:
+            self.stats.rejected += 1
+            PASSWORD_POOL_REJECTED.inc()
+            logger.warning(
+                "Password pool saturated (%d pending), rejecting request",
+                self._in_flight,
+            )
+            raise PasswordPoolBusyError("Password hashing pool is saturated")
+
+        self._in_flight += 1
+        self.stats.submitted += 1
+        try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            self.stats.failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+        self.stats.completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stops the worker threads once the running jobs finish.
+
+        The next job starts new threads.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+password_pool = PasswordHashPool(
+    workers=settings.password_hash.workers,
+    max_pending=settings.password_hash.max_pending,
+)
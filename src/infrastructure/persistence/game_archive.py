@@ -0,0 +1,231 @@
+"""Write-behind archiving of finished games into the `casual_games` table.
+
+Finished games are appended to the `games:finished` Redis Stream by the game
+path, which never waits on PostgreSQL. A `FinishedGameWriter` per worker reads
+the stream through a consumer group, inserts the games in batches and only
+acknowledges entries once they are committed, so delivery is at-least-once:
+entries of a failed batch stay pending and are retried, and entries left
+pending by a crashed worker are claimed by another one. Inserts are keyed on
+the game id, which makes redelivered entries harmless.
+
+Bots and players without an account are not in `players`, so their ids are
+archived as NULL rather than breaking the foreign keys of `casual_games`.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import asyncpg  # type: ignore
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+
+from src.domain.game import GameSession
+from src.infrastructure.metrics import GAMES_ARCHIVED
+
+logger = logging.getLogger(__name__)
+
+FINISHED_GAMES_STREAM = "games:finished"
+ARCHIVE_GROUP = "casual-games-writer"
+
+# Participants missing from `players` are stored as NULL.
+INSERT_CASUAL_GAME = """
+    INSERT INTO casual_games (id, player1_id, player2_id, winner_id, played_at)
+    VALUES (
+        $1,
+        (SELECT id FROM players WHERE id = $2),
+        (SELECT id FROM players WHERE id = $3),
+        (SELECT id FROM players WHERE id = $4),
+        $5
+    )
+    ON CONFLICT (id) DO NOTHING
+"""
+
+CasualGameRow = tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID, datetime]
+
+
+def finished_game_fields(game: GameSession, winner_id: uuid.UUID) -> dict[str, str]:
+    """Returns the stream entry describing a finished game."""
+    player1, player2 = (str(player_id) for player_id in game.players)
+    return {
+        "game_id": str(game.game_id),
+        "player1": player1,
+        "player2": player2,
+        "winner": str(winner_id),
+        "played_at": str(game.end_datetime or game.start_datetime),
+    }
+
+
+def casual_game_row(fields: dict[str, str]) -> CasualGameRow:
+    """Converts a stream entry into the parameters of INSERT_CASUAL_GAME."""
+    return (
+        uuid.UUID(fields["game_id"]),
+        uuid.UUID(fields["player1"]),
+        uuid.UUID(fields["player2"]),
+        uuid.UUID(fields["winner"]),
+        datetime.fromtimestamp(int(fields["played_at"]), tz=timezone.utc),
+    )
+
+
+class FinishedGameWriter:
+    """Flushes the finished games stream into PostgreSQL in batches."""
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        pool: asyncpg.Pool,
+        consumer: str,
+        batch_size: int = 100,
+        block_ms: int = 1000,
+        claim_idle_ms: int = 60_000,
+        max_retry_delay_seconds: float = 30.0,
+    ) -> None:
+        """Initializes the writer.
+
+        Args:
+            redis_client: Client holding the finished games stream.
+            pool: The asyncpg pool used for the inserts.
+            consumer: Name of this worker in the consumer group.
+            batch_size: Maximum number of games inserted per batch.
+            block_ms: How long a read waits for new entries.
+            claim_idle_ms: Idle time after which another consumer's pending
+                entries are taken over.
+            max_retry_delay_seconds: Upper bound of the backoff between
+                failed flushes.
+        """
+        self.redis_client = redis_client
+        self.pool = pool
+        self.consumer = consumer
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Creates the consumer group if needed and starts flushing."""
+        try:
+            await self.redis_client.xgroup_create(
+                FINISHED_GAMES_STREAM, ARCHIVE_GROUP, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info("Archiving finished games as consumer %s", self.consumer)
+
+    async def stop(self) -> None:
+        """Stops after the batch in progress; unflushed entries stay pending."""
+        self._stopping = True
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._task, timeout=self.block_ms / 1000 + 5)
+        except asyncio.TimeoutError:
+            logger.warning("Finished game writer did not stop in time")
+        self._task = None
+
+    async def _run(self) -> None:
+        """Reads and flushes batches until stopped, backing off on failures."""
+        delay = 0.5
+        # Our own pending entries (left by a failed flush or a restart) are
+        # read from id 0 before asking the group for new ones.
+        backlog = True
+        while not self._stopping:
+            try:
+                entries = await self._read(backlog)
+                if not entries:
+                    # Nothing pending or new: look for entries a crashed
+                    # worker left behind.
+                    backlog = False
+                    entries = await self._claim_stale()
+                if entries:
+                    await self.flush(entries)
+                delay = 0.5
+            except Exception as e:
+                logger.error(
+                    "Failed to archive finished games, retrying in %.1fs: %s",
+                    delay, e,
+                )
+                backlog = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay_seconds)
+
+    async def _read(self, backlog: bool) -> list[tuple[str, dict[str, str]]]:
+        """Reads this consumer's pending entries, or new ones."""
+        response = await self.redis_client.xreadgroup(
+            ARCHIVE_GROUP,
+            self.consumer,
+            {FINISHED_GAMES_STREAM: "0" if backlog else ">"},
+            count=self.batch_size,
+            block=None if backlog else self.block_ms,
+        )
+        if not response:
+            return []
+        if isinstance(response, dict):
+            # RESP3 replies map each stream to a list holding its entries.
+            entries = response.get(FINISHED_GAMES_STREAM, [[]])[0]
+        else:
+            _, entries = response[0]
+        return [(entry_id, fields or {}) for entry_id, fields in entries]
+
+    async def _claim_stale(self) -> list[tuple[str, dict[str, str]]]:
+        """Takes over entries another consumer read but never acknowledged."""
+        response: Any = await self.redis_client.xautoclaim(
+            FINISHED_GAMES_STREAM,
+            ARCHIVE_GROUP,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            count=self.batch_size,
+        )
+        return [(entry_id, fields or {}) for entry_id, fields in response[1]]
+
+    async def flush(self, entries: list[tuple[str, dict[str, str]]]) -> None:
+        """Inserts a batch of stream entries and acknowledges them.
+
+        Raises:
+            Exception: If the batch could not be written; the entries are left
+                pending to be retried.
+        """
+        rows: list[CasualGameRow] = []
+        for entry_id, fields in entries:
+            try:
+                rows.append(casual_game_row(fields))
+            except (KeyError, ValueError) as e:
+                logger.error("Dropping malformed finished game %s: %s", entry_id, e)
+
+        if rows:
+            await self._insert(rows)
+
+        entry_ids = [entry_id for entry_id, _ in entries]
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.xack(FINISHED_GAMES_STREAM, ARCHIVE_GROUP, *entry_ids)
+            pipe.xdel(FINISHED_GAMES_STREAM, *entry_ids)
+            await pipe.execute()
+        GAMES_ARCHIVED.inc(len(rows))
+        logger.debug("Archived %d finished games", len(rows))
+
+    async def _insert(self, rows: list[CasualGameRow]) -> None:
+        """Inserts the rows in one transaction.
+
+        A constraint violation (e.g. a player deleted while the game was
+        queued) fails the whole batch, so the rows are then inserted one by
+        one and only the offending ones are skipped.
+        """
+        async with self.pool.acquire() as conn:  # type: ignore
+            try:
+                async with conn.transaction():  # type: ignore
+                    await conn.executemany(INSERT_CASUAL_GAME, rows)  # type: ignore
+                return
+            except asyncpg.IntegrityConstraintViolationError:
+                pass
+
+            for row in rows:
+                try:
+                    await conn.execute(INSERT_CASUAL_GAME, *row)  # type: ignore
+                except asyncpg.IntegrityConstraintViolationError as e:
+                    logger.error("Skipping finished game %s: %s", row[0], e)
@@ -0,0 +1,102 @@
+"""In-process cache of live game sessions with per-game locking."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from src.domain.game import GameSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how the session cache is behaving.
+
+    Attributes:
+        hits: Lookups served from memory.
+        misses: Lookups that had to go to the backing store.
+        evictions: Entries dropped because the cache was full.
+        expirations: Entries dropped because their TTL elapsed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class GameSessionCache:
+    """A bounded LRU cache of GameSession objects with a TTL.
+
+    The repository writes every saved session through to Redis and then into
+    this cache, so reads on the hot path never leave the process. A per-game
+    asyncio.Lock is also provided so two actions on the same game run one
+    after the other.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 300.0) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._sessions: OrderedDict[uuid.UUID, tuple[float, GameSession]] = (
+            OrderedDict()
+        )
+        self._locks: dict[uuid.UUID, tuple[asyncio.Lock, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, game_id: uuid.UUID) -> GameSession | None:
+        """Returns the cached session, or None if it is missing or expired."""
+        entry = self._sessions.get(game_id)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, session = entry
+        if expires_at < time.monotonic():
+            del self._sessions[game_id]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._sessions.move_to_end(game_id)
+        self.stats.hits += 1
+        return session
+
+    def put(self, session: GameSession) -> None:
+        """Stores a session, evicting the least recently used one if full."""
+        self._sessions[session.game_id] = (
+            time.monotonic() + self.ttl_seconds,
+            session,
+        )
+        self._sessions.move_to_end(session.game_id)
+        while len(self._sessions) > self.max_size:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug("Evicted game %s from session cache", evicted_id)
+
+    def invalidate(self, game_id: uuid.UUID) -> None:
+        """Drops a session so the next read goes to the backing store."""
+        self._sessions.pop(game_id, None)
+
+    @asynccontextmanager
+    async def lock(self, game_id: uuid.UUID) -> AsyncIterator[None]:
+        """Serializes actions on the same game within this process."""
+        lock, users = self._locks.get(game_id, (asyncio.Lock(), 0))
+        self._locks[game_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[game_id]
+            if users <= 1:
+                del self._locks[game_id]
+            else:
+                self._locks[game_id] = (lock, users - 1)
@@ -1,262 +1,738 @@
 """Concrete implementation of the GameRepository interface using Redis."""
 
-import json
 import logging
+import time
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Iterable, Mapping, Sequence
 
 import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ResponseError
 
-from src.domain.game import GameSession, GameInfo
-from src.domain.player import Player
-from src.api.v1.schemas.place_ships import ShipDetails
+from src.domain.board import CELL_INDEX, CELL_NAMES
+from src.domain.game import GameInfo, GameSession, GameStatus
+from src.domain.game_events import GameEvent, replay
+from src.domain.shot import ShotOutcome, ShotResult
 from src.application.repositories.game_repository import GameRepository
+from src.infrastructure import codec
+from src.infrastructure.metrics import observe_redis
+from src.infrastructure.redis_client import create_redis_client
+from src.infrastructure.redis_keys import RedisKeys
+from src.infrastructure.persistence.game_archive import (
+    FINISHED_GAMES_STREAM,
+    finished_game_fields,
+)
+from src.infrastructure.persistence.game_cache import GameSessionCache
+from src.infrastructure.persistence.redis_scripts import (
+    MATCH_FROM_QUEUE_SCRIPT,
+    RECORD_HIT_SCRIPT,
+    RESOLVE_SHOT_SCRIPT,
+)
+from src.infrastructure.persistence.session_codec import (
+    VERSION_FIELD,
+    decode_session,
+    encode_session,
+    session_field_values,
+    session_from_fields,
+    session_to_fields,
+)
 from src.config import settings
 
 
 logger = logging.getLogger(__name__)
 
+GAME_TTL_SECONDS = 3600
+# A snapshot of the session is stored every this many events, so a rebuild
+# only replays a short tail of the event log.
+SNAPSHOT_INTERVAL = 50
+SESSION_INVALIDATION_CHANNEL = "game:sessions:invalidate"
 
-class GameRedisRepository(GameRepository):
+
+def _is_wrong_type(error: ResponseError) -> bool:
+    """Whether a command failed because the key holds another data type."""
+    return str(error).startswith("WRONGTYPE")
+
+
+class GameRedisRepository(GameRepository):  # pylint: disable=too-many-public-methods
     """A game repository that uses Redis for data storage.
 
     This class provides a concrete implementation of the GameRepository abstract
     base class, using an asynchronous Redis client to persist and retrieve
     game state.
+
+    Besides the current state, every placement, shot, turn pass and game over
+    is appended to a per-game Redis Stream in the same atomic step, giving a
+    replayable history the session can be rebuilt from.
     """
 
-    def __init__(self) -> None:
-        # TODO: Move Redis connection details to environment variables/configuration.
-        self.redis_client: aioredis.Redis = aioredis.Redis(
-            host=settings.redis.host,
-            port=settings.redis.port,
-            decode_responses=True,
-            username=settings.redis.username,
-            password=settings.redis.password,
+    def __init__(
+        self,
+        redis_client: aioredis.Redis | None = None,
+        keys: RedisKeys | None = None,
+    ) -> None:
+        """Initializes the repository.
+
+        Args:
+            redis_client: The shared client, owned by the application
+                lifespan; one is built from the settings when omitted.
+            keys: The key layout; the configured one when omitted.
+        """
+        if redis_client is None:
+            redis_client = create_redis_client(settings.redis)
+        self.redis_client: aioredis.Redis = redis_client
+        self.keys = keys or RedisKeys(settings.redis.use_hash_tags)
+        self.cluster = settings.redis.cluster
+        self._resolve_shot_script = self.redis_client.register_script(
+            RESOLVE_SHOT_SCRIPT
+        )
+        self._record_hit_script = self.redis_client.register_script(
+            RECORD_HIT_SCRIPT
         )
+        self._match_from_queue_script = self.redis_client.register_script(
+            MATCH_FROM_QUEUE_SCRIPT
+        )
+        self.session_cache: GameSessionCache | None = None
+        if settings.game_cache.enabled:
+            self.session_cache = GameSessionCache(
+                max_size=settings.game_cache.max_size,
+                ttl_seconds=settings.game_cache.ttl_seconds,
+            )
+        self._invalidation_origin: str | None = None
+        self._pubsub_client = self.redis_client
+        self.session_encoding = settings.redis.session_encoding
+
+    def enable_invalidation_broadcast(
+        self, node_id: str, pubsub_client: aioredis.Redis | None = None
+    ) -> None:
+        """Publishes every session change so other nodes drop their copy.
 
-    async def save_player_board(
-        self, game_id: str, player: Player, ships: List[ShipDetails]
+        Args:
+            node_id: The id of this node, used to ignore its own messages.
+            pubsub_client: The client to publish with when it is not the
+                shared one, as on a Redis Cluster.
+        """
+        self._invalidation_origin = node_id
+        self._pubsub_client = pubsub_client or self.redis_client
+
+    async def handle_invalidation(self, data: str) -> None:
+        """Drops a session changed by another node from the local cache."""
+        origin, _, game_id = data.partition(":")
+        if self.session_cache is None or origin == self._invalidation_origin:
+            return
+        self.session_cache.invalidate(uuid.UUID(game_id))
+
+    async def _publish_invalidation(self, game_id: uuid.UUID) -> None:
+        if self._invalidation_origin is None:
+            return
+        await self._pubsub_client.publish(
+            SESSION_INVALIDATION_CHANNEL, f"{self._invalidation_origin}:{game_id}"
+        )
+
+    def _append_event(
+        self, pipe: Pipeline, game_id: uuid.UUID | str, event: GameEvent
     ) -> None:
-        """Saves a player's board (ship placements) to Redis.
+        """Queues the XADD of an event on a pipeline."""
+        key = self.keys.events(game_id)
+        pipe.xadd(key, event.to_fields())  # type: ignore[arg-type]
+        pipe.expire(key, GAME_TTL_SECONDS)
+
+    def _queue_session_write(
+        self,
+        pipe: Pipeline,
+        game: GameSession,
+        attributes: Iterable[str] | None = None,
+        replace: bool = False,
+    ) -> None:
+        """Queues the write of a session in the configured layout.
 
         Args:
-            game_id: The unique identifier for the game.
-            player: The player object.
-            ships: A list of Ship objects representing the player's board.
+            pipe: The pipeline the commands are queued on.
+            game: The session to write.
+            attributes: The only attributes that changed, so in the hash
+                layout just their fields are written; all when omitted.
+            replace: Whether the key may hold another layout and must be
+                dropped first.
         """
+        key = self.keys.session(game.game_id)
+        if self.session_encoding != "hash":
+            encoded: bytes | str = (
+                codec.dumps_str(game.to_serializable_dict())
+                if self.session_encoding == "json"
+                else encode_session(game)
+            )
+            pipe.set(key, encoded, ex=GAME_TTL_SECONDS)
+            return
+
+        if replace:
+            pipe.delete(key)
+        if attributes is None:
+            fields = session_to_fields(game)
+            if "boards" not in fields:
+                pipe.hdel(key, "boards")
+        else:
+            fields = session_field_values(game, attributes)
+        if fields:
+            pipe.hset(key, mapping=fields)  # type: ignore[arg-type]
+        pipe.hincrby(key, VERSION_FIELD, 1)
+        pipe.expire(key, GAME_TTL_SECONDS)
 
-        key = f"game:{game_id}:player_id:{player.id}:ships"
-        board_data = {ship.type: ship.positions for ship in ships}
+    async def _read_session_fields(
+        self, game_id: uuid.UUID, *fields: str
+    ) -> list[str | None] | None:
+        """Reads some fields of a session stored as a hash.
 
-        await self.redis_client.hset(key, mapping={
-            "ships": json.dumps(board_data),
-            "status": "ships_placed",
-            "placed_at": datetime.utcnow().isoformat()
-        })  # type: ignore[misc]
+        Returns:
+            The field values, or None if the session is missing or stored as
+            a string, in which case the caller loads the whole session.
+        """
+        try:
+            values: list[str | None] = await self.redis_client.hmget(
+                self.keys.session(game_id), list(fields)
+            )  # type: ignore[misc]
+        except ResponseError as e:
+            if not _is_wrong_type(e):
+                raise
+            return None
+        if all(value is None for value in values):
+            return None
+        return values
 
-        await self.redis_client.expire(key, 3600)
+    async def _get_session_bytes(self, key: str) -> bytes | None:
+        """Reads a session key without decoding it as text."""
+        raw: bytes | None = await self.redis_client.execute_command(
+            "GET", key, NEVER_DECODE=True
+        )
+        return raw
 
-    async def get_player_board(
-        self, game_id: uuid.UUID, player_id: uuid.UUID
-    ) -> dict[str, list[str]]:
-        # Match the key format used in save_player_board
-        key = f"game:{game_id}:player_id:{player_id}:ships"
-        logger.debug(f"[get_player_board] Loading key: {key}")
+    @observe_redis
+    async def save_player_board(
+        self,
+        game_id: str,
+        player_id: uuid.UUID,
+        ships: Mapping[str, Sequence[int]],
+    ) -> None:
+        """Saves a player's board (ship placements) to Redis.
 
-        raw = await self.redis_client.hget(key, "ships")  # type: ignore
+        The board is stored in its validated cell index form, so neither the
+        shot script nor the board loads parse coordinates again.
+
+        Args:
+            game_id: The unique identifier for the game.
+            player_id: The player who placed the ships.
+            ships: Ship id mapped to the cell indexes it occupies.
+        """
+
+        key = self.keys.ships(game_id, player_id)
+        board_data = {ship_type: list(cells) for ship_type, cells in ships.items()}
+
+        # Reverse index (cell index -> ship) and afloat counters used by the
+        # shot script, so shots never have to deserialize the board.
+        cell_index = {
+            f"cell:{cell}": ship_type
+            for ship_type, cells in board_data.items()
+            for cell in cells
+        }
+        remaining = {
+            f"remaining:{ship_type}": len(set(cells))
+            for ship_type, cells in board_data.items()
+        }
+
+        ships_json = codec.dumps_str(board_data)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={
+                "ships": ships_json,
+                "status": "ships_placed",
+                "placed_at": datetime.utcnow().isoformat(),
+                "remaining": len(cell_index),
+                **remaining,
+                **cell_index,
+            })
+            pipe.expire(key, GAME_TTL_SECONDS)
+            self._append_event(
+                pipe, game_id, GameEvent.ships_placed(player_id, ships_json)
+            )
+            await pipe.execute()
+
+    async def _load_ships(self, key: str) -> dict[str, list[int]]:
+        """Reads the stored cell indexes of every ship of a board hash."""
+        raw = await self.redis_client.hget(key, "ships")  # type: ignore[misc]
         if raw is None:
             return {}
-
         try:
-            return json.loads(raw)
+            ships: dict[str, list[int]] = codec.loads(raw)
+            return ships
         except Exception as e:
-            logger.error(f"Failed to parse board data: {e}")
+            logger.error("Failed to parse board data: %s", e)
             return {}
 
+    @observe_redis
+    async def get_player_board(
+        self, game_id: uuid.UUID, player_id: uuid.UUID
+    ) -> dict[str, list[str]]:
+        # Match the key format used in save_player_board
+        key = self.keys.ships(game_id, player_id)
+        logger.debug("[get_player_board] Loading key: %s", key)
+
+        ships = await self._load_ships(key)
+        return {
+            ship_id: [CELL_NAMES[cell] for cell in cells]
+            for ship_id, cells in ships.items()
+        }
+
+    @observe_redis
     async def get_game_board(
         self, game_id: uuid.UUID
     ) -> dict[str, dict[str, list[str]]]:
-        key = f"game:{game_id}:board"
-        logger.debug(f"AQUI ESTA A KEY TO REDIS {key}")
+        key = self.keys.board(game_id)
+        logger.debug("AQUI ESTA A KEY TO REDIS %s", key)
         value = await self.redis_client.get(key)
         if value is None or not isinstance(value, (str, bytes, bytearray)):
             return {}
-        return json.loads(value)
+        return codec.loads(value)
 
+    @observe_redis
     async def get_opponent_id(
-        self, game_id: uuid.UUID, player: Player
+        self, game_id: uuid.UUID, player_id: uuid.UUID
     ) -> uuid.UUID | None:
-        redis_key = f"game:{str(game_id)}"
-        data = await self.redis_client.get(redis_key)
-
-        if data is None:
-            return None
-
-        game_data = json.loads(data)
-        player_ids = list(game_data["players"].keys())
-
-        try:
-            return uuid.UUID(next(pid for pid in player_ids if pid != str(player.id)))
-
-        except StopIteration:
-            return None
+        return await self._find_opponent(game_id, player_id)
 
+    async def _find_opponent(
+        self, game_id: uuid.UUID, player_id: uuid.UUID
+    ) -> uuid.UUID | None:
+        """Returns the other player of a game, from the cache when possible."""
+        game = self._cached_session(game_id)
+        if game is None:
+            values = await self._read_session_fields(game_id, "players")
+            if values is not None:
+                player = str(player_id)
+                opponent = next(
+                    (pid for pid in (values[0] or "").split(",") if pid != player),
+                    None,
+                )
+                return uuid.UUID(opponent) if opponent else None
+            game = await self._load_session_from_redis(game_id)
+            if game is None:
+                return None
+
+        return next((pid for pid in game.players if pid != player_id), None)
+
+    @observe_redis
     async def get_player_hits(
         self, game_id: uuid.UUID, player: uuid.UUID
     ) -> dict[str, list[str]]:
-        key = f"game:{game_id}:player_board:{player}:hits"
-        value = await self.redis_client.get(key)
-        if value is None or not isinstance(value, (str, bytes, bytearray)):
-            return {}
-        return json.loads(value)
-
+        key = self.keys.hits(game_id, player)
+        cells = await self.redis_client.hgetall(key)  # type: ignore[misc]
+        hits: dict[str, list[str]] = {}
+        for cell, ship_id in cells.items():
+            hits.setdefault(ship_id, []).append(cell)
+        return hits
+
+    @observe_redis
+    async def count_player_hits(self, game_id: uuid.UUID, player: uuid.UUID) -> int:
+        key = self.keys.hits(game_id, player)
+        count: int = await self.redis_client.hlen(key)  # type: ignore[misc]
+        return count
+
+    @observe_redis
     async def save_hit(
         self, game_id: uuid.UUID, player: uuid.UUID, ship_id: str, position: str
     ) -> None:
-        key = f"game:{game_id}:player_board:{player}:hits"
-        value = await self.redis_client.get(key)
-
-        if value is None or not isinstance(value, (str, bytes, bytearray)):
-            hits: dict[str, list[str]] = {}
-        else:
-            hits = json.loads(value)
+        await self._record_hit_script(
+            keys=[
+                self.keys.ships(game_id, player),
+                self.keys.hits(game_id, player),
+            ],
+            args=[position, ship_id, GAME_TTL_SECONDS],
+        )
 
-        if ship_id not in hits:
-            hits[ship_id] = []
-        if position not in hits[ship_id]:
-            hits[ship_id].append(position)
+    @observe_redis
+    async def resolve_shot(
+        self, game_id: uuid.UUID, player_id: uuid.UUID, target: str
+    ) -> ShotResult:
+        keys = [self.keys.session(game_id), self.keys.events(game_id)]
+        args: list[str | int] = [
+            str(player_id),
+            target,
+            int(time.time()),
+            GAME_TTL_SECONDS,
+            CELL_INDEX[target],
+        ]
+        if self.cluster:
+            # A cluster only runs a script on the keys it declares, so the
+            # opponent's board keys are named up front, which costs a read
+            # before the script when the session is not cached. Elsewhere
+            # the script derives them and the shot stays one round trip.
+            opponent = await self._find_opponent(game_id, player_id) or ""
+            keys += [
+                self.keys.ships(game_id, opponent),
+                self.keys.hits(game_id, opponent),
+            ]
+            args.append(str(opponent))
+        raw = await self._resolve_shot_script(keys=keys, args=args)
+        outcome, opponent_id, ship_id, sunk, current_turn = raw
+        if outcome == ShotOutcome.GAME_OVER:
+            # The script finished the game in Redis, drop the stale copies.
+            if self.session_cache is not None:
+                self.session_cache.invalidate(game_id)
+            await self._publish_invalidation(game_id)
+        return ShotResult(
+            outcome=ShotOutcome(outcome),
+            opponent_id=uuid.UUID(opponent_id) if opponent_id else None,
+            ship_id=ship_id or None,
+            sunk=bool(sunk),
+            current_turn=uuid.UUID(current_turn) if current_turn else None,
+        )
 
-        await self.redis_client.set(key, json.dumps(hits))
+    @asynccontextmanager
+    async def game_lock(self, game_id: uuid.UUID) -> AsyncIterator[None]:
+        if self.session_cache is None:
+            yield
+            return
+        async with self.session_cache.lock(game_id):
+            yield
 
+    @observe_redis
     async def push_to_queue(self, queue_name: str, player: uuid.UUID) -> None:
-        payload = json.dumps({"player_id": str(player)})
-        logger.debug(f"[push_to_queue] Queue payload: {payload}")
-        await self.redis_client.rpush(queue_name, payload)  # type: ignore
+        # The queue is a sorted set scored by enqueue time; NX keeps the
+        # original position of a player that is already waiting.
+        logger.debug("[push_to_queue] Queueing player: %s", player)
+        await self.redis_client.zadd(queue_name, {str(player): time.time()}, nx=True)
+
+    @observe_redis
+    async def pop_from_queue(self, queue_name: str, player: uuid.UUID) -> bool:
+        return bool(await self.redis_client.zrem(queue_name, str(player)))
+
+    @observe_redis
+    async def queue_length(self, queue_name: str) -> int:
+        return int(await self.redis_client.zcard(queue_name))
+
+    @observe_redis
+    async def match_from_queue(
+        self, queue_name: str, player_id: uuid.UUID
+    ) -> uuid.UUID | None:
+        opponent_id = await self._match_from_queue_script(
+            keys=[queue_name],
+            args=[str(player_id), time.time()],
+        )
+        if not opponent_id:
+            return None
+
+        try:
+            return uuid.UUID(opponent_id)
+        except ValueError:
+            logger.warning("Invalid UUID format in queue: %s", opponent_id)
+            return None
 
-    async def pop_from_queue(self, queue_name: str, player: uuid.UUID) -> None:
-        logger.debug("ESTA NA POP FROM QUEUE")
-        payload = json.dumps({"player_id": str(player)})
-        logger.debug(f"ESSE O PAYLOAD {payload}")
-        await self.redis_client.lrem(queue_name, 1, payload)  # type: ignore
+    @observe_redis
+    async def create_match(self, queue_name: str, game: GameSession) -> None:
+        game_id = str(game.game_id)
+        player_ids = [str(player_id) for player_id in game.players]
+
+        if self.cluster:
+            # The queue and the player keys live on other slots than the game,
+            # so only the game's own keys are written in one transaction.
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                self._queue_session_write(pipe, game)
+                self._append_event(pipe, game_id, GameEvent.created(game))
+                await pipe.execute()
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.zrem(queue_name, *player_ids)
+                self._queue_active_games(pipe, game_id, player_ids)
+                await pipe.execute()
+        else:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.zrem(queue_name, *player_ids)
+                self._queue_session_write(pipe, game)
+                self._queue_active_games(pipe, game_id, player_ids)
+                self._append_event(pipe, game_id, GameEvent.created(game))
+                await pipe.execute()
+
+        if self.session_cache is not None:
+            self.session_cache.put(game)
+
+    def _queue_active_games(
+        self, pipe: Pipeline, game_id: str, player_ids: Iterable[str]
+    ) -> None:
+        """Queues the writes pointing each player at their new game."""
+        for player_id in player_ids:
+            pipe.set(self.keys.active_game(player_id), game_id, ex=GAME_TTL_SECONDS)
 
+    @observe_redis
     async def save_game_to_redis(
         self,
         game: GameSession,
+        event: GameEvent | None = None,
+    ) -> None:
+        logger.debug("Saving full game session %s to Redis", game.game_id)
+        await self._write_session(game, None, event)
+
+    @observe_redis
+    async def update_game_session(
+        self,
+        game: GameSession,
+        attributes: Iterable[str],
+        event: GameEvent | None = None,
     ) -> None:
-        key = f"game:{game.game_id}"
-        # Serialize the entire GameSession to JSON
-        game_dict = game.to_serializable_dict()
-        game_json = json.dumps(game_dict)
-        logger.debug(f"Saving full game session to Redis key: {key}")
-        logger.debug(f"Game JSON: {game_json}")
+        await self._write_session(game, attributes, event)
 
+    async def _write_session(
+        self,
+        game: GameSession,
+        attributes: Iterable[str] | None,
+        event: GameEvent | None,
+    ) -> None:
+        """Writes a session, or some of its attributes, and logs the event."""
         try:
-            await self.redis_client.set(key, game_json, ex=3600)  # 1h TTL
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                self._queue_session_write(pipe, game, attributes)
+                if event is not None:
+                    self._append_event(pipe, game.game_id, event)
+                    pipe.xlen(self.keys.events(game.game_id))
+                    pipe.hget(self.keys.snapshot(game.game_id), "length")
+                results = await pipe.execute()
+            if event is not None:
+                # XADD, EXPIRE, XLEN and HGET are the last four replies.
+                event_id, _, length, snapshot_length = results[-4:]
+                if length - int(snapshot_length or 0) >= SNAPSHOT_INTERVAL:
+                    await self._save_snapshot(game, event_id, length)
         except Exception as e:
-            logger.error(f"Failed to save game to Redis: {e}")
+            logger.error("Failed to save game to Redis: %s", e)
+            if self.session_cache is not None:
+                self.session_cache.invalidate(game.game_id)
             raise
 
+        if self.session_cache is not None:
+            self.session_cache.put(game)
+        await self._publish_invalidation(game.game_id)
+
+    async def _save_snapshot(
+        self, game: GameSession, event_id: str, length: int
+    ) -> None:
+        """Stores the session as it was right after the event `event_id`.
+
+        Snapshots are rare and read through a decoding client, so they stay
+        JSON.
+        """
+        key = self.keys.snapshot(game.game_id)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={
+                "state": codec.dumps_str(game.to_serializable_dict()),
+                "event_id": event_id,
+                "length": length,
+            })
+            pipe.expire(key, GAME_TTL_SECONDS)
+            await pipe.execute()
+
+    @observe_redis
+    async def get_game_events(self, game_id: uuid.UUID) -> list[GameEvent]:
+        entries = await self.redis_client.xrange(self.keys.events(game_id))
+        return [GameEvent.from_fields(fields) for _, fields in entries]
+
+    @observe_redis
+    async def rebuild_game_session(self, game_id: uuid.UUID) -> GameSession | None:
+        snapshot_fields = await self.redis_client.hgetall(  # type: ignore[misc]
+            self.keys.snapshot(game_id)
+        )
+        snapshot = None
+        start = "-"
+        if snapshot_fields:
+            snapshot = GameSession.from_serialized_dict(
+                codec.loads(snapshot_fields["state"])
+            )
+            start = f"({snapshot_fields['event_id']}"
+
+        entries = await self.redis_client.xrange(self.keys.events(game_id), min=start)
+        return replay(
+            game_id,
+            snapshot,
+            (GameEvent.from_fields(fields) for _, fields in entries),
+        )
+
+    @observe_redis
+    async def archive_finished_game(
+        self, game: GameSession, winner_id: uuid.UUID
+    ) -> None:
+        await self.redis_client.xadd(
+            FINISHED_GAMES_STREAM,
+            finished_game_fields(game, winner_id),  # type: ignore[arg-type]
+        )
+
+    @observe_redis
     async def load_game_session(self, game_id: uuid.UUID) -> GameSession | None:
-        key = f"game:{game_id}"
-        logger.debug(f"INSIDE THE LOAD GAME SESSION {key}")
-        raw = await self.redis_client.get(key)  # type: ignore
+        cached = self._cached_session(game_id)
+        if cached is not None:
+            return cached
+        return await self._load_session_from_redis(game_id)
+
+    def _cached_session(self, game_id: uuid.UUID) -> GameSession | None:
+        if self.session_cache is None:
+            return None
+        return self.session_cache.get(game_id)
+
+    async def _load_session_from_redis(
+        self, game_id: uuid.UUID
+    ) -> GameSession | None:
+        """Reads a session in whichever layout it is stored and caches it."""
+        logger.debug("INSIDE THE LOAD GAME SESSION game:%s", game_id)
+        try:
+            game = await self._read_session(game_id)
+        except Exception as e:
+            logger.error("Failed to deserialize game session: %s", e)
+            return None
+        if game is None:
+            return await self._recover_game_session(game_id)
+
+        if self.session_cache is not None:
+            self.session_cache.put(game)
+        return game
+
+    async def _read_session(self, game_id: uuid.UUID) -> GameSession | None:
+        """Reads the configured layout first and falls back to the other type.
+
+        In the hash layout, a session still stored as a string is rewritten
+        as a hash, so its later changes can update single fields.
+        """
+        key = self.keys.session(game_id)
+        if self.session_encoding != "hash":
+            try:
+                raw = await self._get_session_bytes(key)
+            except ResponseError as e:
+                if not _is_wrong_type(e):
+                    raise
+                fields = await self.redis_client.hgetall(key)  # type: ignore[misc]
+                return session_from_fields(game_id, fields)
+            return decode_session(raw) if raw else None
+
+        try:
+            fields = await self.redis_client.hgetall(key)  # type: ignore[misc]
+        except ResponseError as e:
+            if not _is_wrong_type(e):
+                raise
+        else:
+            return session_from_fields(game_id, fields) if fields else None
+
+        raw = await self._get_session_bytes(key)
         if not raw:
-            logger.warning(f"No game session found for key: {key}")
             return None
+        game = decode_session(raw)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            self._queue_session_write(pipe, game, replace=True)
+            await pipe.execute()
+        logger.info("Rewrote game session %s as a hash", game_id)
+        return game
+
+    async def _recover_game_session(self, game_id: uuid.UUID) -> GameSession | None:
+        """Rebuilds a lost session from its event log and stores it again."""
         try:
-            data = json.loads(raw)
-            return GameSession.from_serialized_dict(data)
+            game = await self.rebuild_game_session(game_id)
         except Exception as e:
-            logger.error(f"Failed to deserialize game session: {e}")
+            logger.error("Failed to rebuild game %s from its event log: %s", game_id, e)
+            return None
+
+        if game is None:
+            logger.warning("No game session found for key: game:%s", game_id)
             return None
 
+        logger.warning("Rebuilt game session %s from its event log", game_id)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            self._queue_session_write(pipe, game, replace=True)
+            await pipe.execute()
+        if self.session_cache is not None:
+            self.session_cache.put(game)
+        return game
+
+    @observe_redis
     async def save_game_session(self, game: GameSession) -> None:
-        key = f"game:{game.game_id}:session"
-        logger.debug(f"[save_game_session] GameSession JSON {game.model_dump_json()}")
-        await self.redis_client.set(key, game.model_dump_json(), ex=3600)
+        key = self.keys.stored_session(game.game_id)
+        game_json = codec.dumps_str(game.to_serializable_dict())
+        logger.debug("[save_game_session] GameSession JSON %s", game_json)
+        await self.redis_client.set(key, game_json, ex=GAME_TTL_SECONDS)
 
+    @observe_redis
     async def get_opponent_from_queue(
         self, queue_name: str, player_id: uuid.UUID
     ) -> uuid.UUID | None:
         player = str(player_id)
         try:
-            players = await self.redis_client.lrange(queue_name, 0, -1)  # type: ignore
+            # Only the two oldest entries are needed to skip the player itself.
+            oldest = await self.redis_client.zrange(queue_name, 0, 1)
         except Exception as e:
-            logger.error(f"Redis lrange error in get_opponent_from_queue: {e}")
+            logger.error("Redis zrange error in get_opponent_from_queue: %s", e)
             return None
 
-        for raw_data in players:  # type: ignore
-            try:
-                # decode if needed
-                if isinstance(raw_data, bytes):
-                    raw_data = raw_data.decode("utf-8")
-
-                data = json.loads(raw_data)  # type: ignore
-                opponent_id = data.get("player_id")
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                logger.warning(f"Invalid payload in queue: {raw_data} | Error: {e}")
+        for opponent_id in oldest:
+            if opponent_id == player:
                 continue
-
-            if opponent_id and opponent_id != player:
-                try:
-                    return uuid.UUID(opponent_id)
-                except ValueError:
-                    logger.warning(f"Invalid UUID format in queue: {opponent_id}")
-                    continue
+            try:
+                return uuid.UUID(opponent_id)
+            except ValueError:
+                logger.warning("Invalid UUID format in queue: %s", opponent_id)
 
         return None
 
+    @observe_redis
     async def get_game_info(self, game_key: str) -> GameInfo:
-        logger.debug(f"INSIDE GET GAME INFO {game_key}")
-        raw = await self.redis_client.hgetall(f"game:{game_key}")   # type: ignore[misc]
+        logger.debug("INSIDE GET GAME INFO %s", game_key)
+        game_id = uuid.UUID(game_key)
+        values = await self._read_session_fields(
+            game_id, "players", "status", "start"
+        )
+        if values is not None:
+            players, status, start = values
+        else:
+            # A missing session, or one stored as a string.
+            players = status = start = None
+            game = await self._load_session_from_redis(game_id)
+            if game is not None:
+                players = ",".join(str(player_id) for player_id in game.players)
+                status = game.status.value
+                start = str(game.start_datetime)
+        player1, _, player2 = (players or "").partition(",")
         return GameInfo(
             game_id=game_key,
-            player1_id=raw["player1"],
-            player2_id=raw["player2"],
-            status=raw["status"],
-            created_at=raw["created_at"],
+            player1_id=player1,
+            player2_id=player2,
+            status=status or "",
+            created_at=start or "",
         )
 
+    @observe_redis
     async def exist_player_on_game(self, game_id: str, player_id: str) -> bool:
-        key: str = f"game:{game_id}:player_id:{player_id}:ships"
-        logger.debug(f"KEY FOR THE EXIST PLAYER ON GAME {key}")
+        key: str = self.keys.ships(game_id, player_id)
+        logger.debug("KEY FOR THE EXIST PLAYER ON GAME %s", key)
         exist: bool = await self.redis_client.exists(key)
         return exist
 
+    @observe_redis
     async def is_player_in_active_game(self, player_id: uuid.UUID) -> bool:
         """Check if player is in an active (non-finished) game."""
-        game_id_str = await self.redis_client.get(f"player:{player_id}:active_game")
+        game_id_str = await self.redis_client.get(self.keys.active_game(player_id))
         if not game_id_str:
             return False
 
-        game = await self.load_game_session(uuid.UUID(game_id_str))
-        return game is not None and game.status != "finished"
+        game_id = uuid.UUID(game_id_str)
+        game = self._cached_session(game_id)
+        if game is None:
+            values = await self._read_session_fields(game_id, "status")
+            if values is not None:
+                return values[0] != GameStatus.FINISHED
+            game = await self._load_session_from_redis(game_id)
+        return game is not None and game.status != GameStatus.FINISHED
 
+    @observe_redis
     async def is_player_in_queue(self, queue_name: str, player_id: uuid.UUID) -> bool:
         """Check if player is already in the matchmaking queue."""
         try:
-            players = await self.redis_client.lrange(
-                queue_name,
-                0,
-                -1
-            )  # type: ignore[misc]
-            player_str = str(player_id)
-            for raw_data in players:
-                if isinstance(raw_data, bytes):
-                    raw_data = raw_data.decode("utf-8")
-                try:
-                    data = json.loads(raw_data)
-                    if data.get("player_id") == player_str:
-                        return True
-                except (json.JSONDecodeError, ValueError):
-                    continue
-            return False
+            score = await self.redis_client.zscore(queue_name, str(player_id))
+            return score is not None
         except Exception as e:
-            logger.error(f"Error checking queue membership: {e}")
+            logger.error("Error checking queue membership: %s", e)
             return False
 
+    @observe_redis
     async def set_player_active_game(
         self,
         player_id: uuid.UUID,
@@ -264,18 +740,20 @@ class GameRedisRepository(GameRepository):
     ) -> None:
         """Set the active game for a player."""
         logger.debug(
-            f"[DEBUG] set_player_active_game called with {player_id}, {game_id}"
+            "[DEBUG] set_player_active_game called with %s, %s", player_id, game_id
         )
         await self.redis_client.set(
-            f"player:{player_id}:active_game",
+            self.keys.active_game(player_id),
             str(game_id),
-            ex=3600  # 1h TTL
+            ex=GAME_TTL_SECONDS,
         )
 
+    @observe_redis
     async def clear_player_active_game(self, player_id: uuid.UUID) -> None:
         """Clear the active game for a player."""
-        await self.redis_client.delete(f"player:{player_id}:active_game")
+        await self.redis_client.delete(self.keys.active_game(player_id))
 
+    @observe_redis
     async def get_active_game(self, player_id: uuid.UUID) -> str:
         """Get the game id as string from using the active_game key
 
@@ -285,7 +763,7 @@ class GameRedisRepository(GameRepository):
         Returns:
             str: The game id as a string
         """
-        game_id_str = await self.redis_client.get(f"player:{player_id}:active_game")
+        game_id_str = await self.redis_client.get(self.keys.active_game(player_id))
         if not game_id_str:
             return ""
 
@@ -37,12 +37,12 @@ class PostgresPlayerRegistrationRepository(PlayerRegistrationRepository):
                 raise ValueError("Failed to register player, no ID returned.")
             except asyncpg.UniqueViolationError as e:
                 if "username" in str(e).lower():
-                    logger.info(f"Username '{username}' is already taken.")
+                    logger.info("Username '%s' is already taken.", username)
                     raise ValueError(
                         "A player with the given details already exists."
                     ) from e
                 if "email" in str(e).lower():
-                    logger.info(f"Username '{email}' is already taken.")
+                    logger.info("Username '%s' is already taken.", email)
                     raise ValueError(
                         "A player with the given details already exists."
                     ) from e
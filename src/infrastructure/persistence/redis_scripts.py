@@ -0,0 +1,291 @@
+"""Lua scripts executed server side by the Redis backed infrastructure.
+
+Scripts are registered once with ``redis.register_script`` and then invoked
+through EVALSHA, so every call is a single atomic round-trip.
+"""
+
+from src.domain.board import MASK_BYTES
+
+# Records a hit in the hits hash (cell -> ship id) and decrements the
+# remaining counters of the board hash the first time a cell is hit.
+# Returns the cells left afloat for the ship and for the whole fleet, and
+# whether the cell was hit for the first time.
+_RECORD_HIT_FUNCTION = """
+local function record_hit(ships_key, hits_key, cell, ship, ttl)
+    local added = redis.call('HSET', hits_key, cell, ship)
+    redis.call('EXPIRE', hits_key, ttl)
+    if added == 1 then
+        return redis.call('HINCRBY', ships_key, 'remaining:' .. ship, -1),
+            redis.call('HINCRBY', ships_key, 'remaining', -1), true
+    end
+    local left = redis.call('HMGET', ships_key, 'remaining:' .. ship, 'remaining')
+    return tonumber(left[1]), tonumber(left[2]), false
+end
+"""
+
+# Records a hit outside of a shot resolution.
+#
+# KEYS[1]  game:{game_id}:player_id:{player_id}:ships
+# KEYS[2]  game:{game_id}:player_board:{player_id}:hits
+# ARGV[1]  cell, ARGV[2] ship id, ARGV[3] ttl in seconds
+RECORD_HIT_SCRIPT = _RECORD_HIT_FUNCTION + """
+local ship_left, fleet_left = record_hit(
+    KEYS[1], KEYS[2], ARGV[1], ARGV[2], tonumber(ARGV[3])
+)
+return {ship_left, fleet_left}
+"""
+
+# Reads and finishes the game session stored at game:{game_id}: a hash in the
+# default layout of session_codec, or a string in its binary layout (fixed
+# offsets, 16-byte UUIDs, big-endian integers) or as JSON.
+_SESSION_FUNCTIONS = f"""
+local MASK_BYTES = {MASK_BYTES}
+""" + """
+local STATUSES = {'waiting', 'in_progress', 'finished', 'place_ship'}
+local FINISHED = 2
+
+local function uuid_of(bytes)
+    local hex = bytes:gsub('.', function(c)
+        return string.format('%02x', string.byte(c))
+    end)
+    return hex:sub(1, 8) .. '-' .. hex:sub(9, 12) .. '-' .. hex:sub(13, 16)
+        .. '-' .. hex:sub(17, 20) .. '-' .. hex:sub(21, 32)
+end
+
+local function int64_bytes(n)
+    local out = ''
+    for _ = 1, 8 do
+        out = string.char(n % 256) .. out
+        n = math.floor(n / 256)
+    end
+    return out
+end
+
+local function decode_session(raw)
+    if raw:sub(1, 1) == '{' then
+        local game = cjson.decode(raw)
+        local players = {}
+        for pid, _ in pairs(game['players']) do
+            table.insert(players, pid)
+        end
+        local turn = game['current_turn']
+        if type(turn) ~= 'string' then
+            turn = ''
+        end
+        return {status = game['status'], turn = turn, players = players, json = game}
+    end
+
+    local turn = ''
+    if string.byte(raw, 4) % 2 == 1 then
+        turn = uuid_of(raw:sub(37, 52))
+    end
+    local players = {}
+    local pos = 53
+    for _ = 1, string.byte(raw, 3) do
+        table.insert(players, uuid_of(raw:sub(pos, pos + 15)))
+        local ships = string.byte(raw, pos + 16)
+        pos = pos + 17
+        for _ = 1, ships do
+            pos = pos + 1 + string.byte(raw, pos) + MASK_BYTES
+        end
+    end
+    return {status = STATUSES[string.byte(raw, 2) + 1], turn = turn, players = players}
+end
+
+local function finish_session(raw, game, ts)
+    if game.json then
+        game.json['status'] = 'finished'
+        game.json['end_datetime'] = ts
+        return cjson.encode(game.json)
+    end
+    return raw:sub(1, 1) .. string.char(FINISHED) .. raw:sub(3, 28)
+        .. int64_bytes(ts) .. raw:sub(37)
+end
+
+local function read_session(key)
+    if redis.call('TYPE', key)['ok'] == 'hash' then
+        local fields = redis.call('HMGET', key, 'status', 'turn', 'players')
+        local players = {}
+        for pid in string.gmatch(fields[3] or '', '[^,]+') do
+            table.insert(players, pid)
+        end
+        return {status = fields[1], turn = fields[2] or '', players = players,
+            hash = true}
+    end
+    local raw = redis.call('GET', key)
+    if not raw then
+        return nil
+    end
+    local game = decode_session(raw)
+    game.raw = raw
+    return game
+end
+
+-- Only the changed fields of a hash are written; a string is rewritten.
+local function finish_game(key, game, ts, ttl)
+    if game.hash then
+        redis.call('HSET', key, 'status', 'finished', 'end', ts)
+        redis.call('HINCRBY', key, 'version', 1)
+        redis.call('EXPIRE', key, ttl)
+        return
+    end
+    redis.call('SET', key, finish_session(game.raw, game, ts), 'EX', ttl)
+end
+"""
+
+# Resolves a shot against the opponent board in one atomic step.
+#
+# KEYS[1]  game:{game_id}, the session in one of the session_codec layouts
+# KEYS[2]  game:{game_id}:events, the stream the resolved shot is appended to
+# KEYS[3]  game:{game_id}:player_id:{opponent_id}:ships, on Redis Cluster only
+# KEYS[4]  game:{game_id}:player_board:{opponent_id}:hits, on Redis Cluster only
+# ARGV[1]  shooter player id
+# ARGV[2]  target cell (e.g. "B4")
+# ARGV[3]  current unix timestamp, used as end_datetime on game over
+# ARGV[4]  ttl in seconds for the game keys
+# ARGV[5]  target cell index (e.g. 18 for "B4"), parsed once by the caller
+# ARGV[6]  opponent id KEYS[3] and KEYS[4] were built for, on Redis Cluster only
+#
+# Without KEYS[3] and KEYS[4], the opponent's board keys are derived from the
+# session key and the opponent in the session, the same way RedisKeys names
+# them. A cluster only lets a script touch the keys it declares, so there the
+# caller names them up front; if ARGV[6] is no longer the opponent in the
+# session, the shot is refused with 'no_opponent' rather than touching
+# undeclared keys.
+#
+# A cell that was already hit is answered with 'already_hit' and nothing is
+# recorded.
+#
+# Returns {outcome, opponent_id, ship_id, sunk, current_turn}.
+RESOLVE_SHOT_SCRIPT = _RECORD_HIT_FUNCTION + _SESSION_FUNCTIONS + """
+local function log_shot(outcome, ship, ttl)
+    redis.call(
+        'XADD', KEYS[2], '*', 't', 'shot', 'ts', ARGV[3], 'p', ARGV[1],
+        'c', ARGV[2], 'r', outcome, 's', ship
+    )
+    redis.call('EXPIRE', KEYS[2], ttl)
+end
+
+local game = read_session(KEYS[1])
+if not game then
+    return {'game_not_found', '', '', 0, ''}
+end
+
+local turn = game.turn
+
+if game.status ~= 'in_progress' then
+    return {'game_not_active', '', '', 0, turn}
+end
+if turn ~= ARGV[1] then
+    return {'not_your_turn', '', '', 0, turn}
+end
+
+local opponent = nil
+for _, pid in ipairs(game.players) do
+    if pid ~= ARGV[1] then
+        opponent = pid
+    end
+end
+if not opponent then
+    return {'no_opponent', '', '', 0, turn}
+end
+
+local ships_key, hits_key
+if #KEYS == 4 then
+    if opponent ~= ARGV[6] then
+        return {'no_opponent', '', '', 0, turn}
+    end
+    ships_key, hits_key = KEYS[3], KEYS[4]
+else
+    ships_key = KEYS[1] .. ':player_id:' .. opponent .. ':ships'
+    hits_key = KEYS[1] .. ':player_board:' .. opponent .. ':hits'
+end
+
+-- The board hash carries a cell -> ship index ('cell:18') and the number of
+-- ship cells still afloat ('remaining:<ship>' and 'remaining' for the fleet),
+-- all written at placement time, so the lookup needs no deserialization.
+local lookup = redis.call('HMGET', ships_key, 'cell:' .. ARGV[5], 'remaining')
+if not lookup[2] then
+    return {'board_not_found', opponent, '', 0, turn}
+end
+
+local hit_ship = lookup[1]
+local ttl = tonumber(ARGV[4])
+if not hit_ship then
+    redis.call('EXPIRE', KEYS[1], ttl)
+    log_shot('miss', '', ttl)
+    return {'miss', opponent, '', 0, turn}
+end
+
+local ship_left, fleet_left, added = record_hit(
+    ships_key, hits_key, ARGV[2], hit_ship, ttl
+)
+if not added then
+    return {'already_hit', opponent, hit_ship, 0, turn}
+end
+local sunk = ship_left <= 0
+local all_sunk = fleet_left <= 0
+
+if all_sunk then
+    finish_game(KEYS[1], game, tonumber(ARGV[3]), ttl)
+    log_shot('game_over', hit_ship, ttl)
+    return {'game_over', opponent, hit_ship, 1, turn}
+end
+
+redis.call('EXPIRE', KEYS[1], ttl)
+log_shot('hit', hit_ship, ttl)
+return {'hit', opponent, hit_ship, sunk and 1 or 0, turn}
+"""
+
+# Pairs a player with the oldest waiting opponent, or enqueues the player.
+#
+# KEYS[1]  matchmaking queue (sorted set of player ids scored by enqueue time)
+# ARGV[1]  player id looking for a game
+# ARGV[2]  enqueue timestamp used as score when nobody is waiting
+#
+# Returns the claimed opponent id, or nil when the player was enqueued.
+MATCH_FROM_QUEUE_SCRIPT = """
+local candidates = redis.call('ZRANGE', KEYS[1], 0, 1)
+for _, candidate in ipairs(candidates) do
+    if candidate ~= ARGV[1] then
+        redis.call('ZREM', KEYS[1], candidate, ARGV[1])
+        return candidate
+    end
+end
+
+redis.call('ZADD', KEYS[1], 'NX', ARGV[2], ARGV[1])
+return false
+"""
+
+# Deletes a player's presence entry only if it still points to this node, so a
+# late disconnect never erases the presence of a reconnection elsewhere.
+#
+# KEYS[1]  presence:{player_id}
+# ARGV[1]  node id releasing the presence
+RELEASE_PRESENCE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Claims an expired deadline so exactly one worker acts on it: the entry is
+# removed only if it still has the deadline the caller saw, which also makes
+# a deadline that was rescheduled in the meantime a no-op.
+#
+# KEYS[1]  deadlines (sorted set of timer keys scored by deadline in ms)
+# KEYS[2]  deadline payloads (hash of timer key -> payload)
+# ARGV[1]  timer key
+# ARGV[2]  expected deadline in ms
+#
+# Returns the payload of the claimed deadline, or nil if it was not claimed.
+CLAIM_DEADLINE_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not score or tonumber(score) ~= tonumber(ARGV[2]) then
+    return false
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+local payload = redis.call('HGET', KEYS[2], ARGV[1]) or ''
+redis.call('HDEL', KEYS[2], ARGV[1])
+return payload
+"""
@@ -0,0 +1,213 @@
+"""Encodings of the live game session stored at `game:{id}`.
+
+By default the session is a Redis hash with one field per attribute, so a
+turn flip or a status change rewrites only the fields that changed:
+
+    field    value
+    status   GameStatus value
+    turn     id of the player to play, empty when nobody is
+    start    start_datetime
+    end      end_datetime
+    players  comma separated player ids, in seating order
+    boards   JSON of the non-empty player boards, absent when all are empty
+    version  incremented on every write
+
+Sessions can also be stored as a single string, in the binary layout below or
+as JSON; both stay readable so a rollout can move between the layouts.
+
+Binary layout (version 1, big-endian):
+
+    offset  size  field
+    0       1     version
+    1       1     status code, an index into STATUS_CODES
+    2       1     number of players
+    3       1     flags, bit 0 set when current_turn is present
+    4       16    game id
+    20      8     start_datetime
+    28      8     end_datetime
+    36      16    current_turn, zeros when absent
+    52      ...   per player: 16-byte id, ship count, then per ship a
+                  length-prefixed utf-8 id and a board bitmask
+
+UUIDs are stored as their 16 raw bytes and boards as bitmasks, so a two player
+session takes under 100 bytes instead of ~300 bytes of JSON. The fixed
+offsets are also what the resolve-shot Lua script reads. Sessions written as
+JSON before this encoding existed are still decoded.
+"""
+
+import functools
+import struct
+import uuid
+from typing import Iterable, Mapping
+
+from src.domain.board import MASK_BYTES, cells_from_mask, mask_from_cells
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.infrastructure import codec
+
+VERSION = 1
+STATUS_CODES: tuple[GameStatus, ...] = (
+    GameStatus.WAITING,
+    GameStatus.IN_PROGRESS,
+    GameStatus.FINISHED,
+    GameStatus.PLACE_SHIP,
+)
+_STATUS_INDEX = {status: code for code, status in enumerate(STATUS_CODES)}
+_HEADER = struct.Struct(">BBBB16sqq16s")
+_HAS_TURN = 0x01
+_NO_TURN = bytes(16)
+
+# Session attribute mapped to the hash field that stores it.
+HASH_FIELDS = {
+    "status": "status",
+    "current_turn": "turn",
+    "start_datetime": "start",
+    "end_datetime": "end",
+}
+VERSION_FIELD = "version"
+
+
+@functools.lru_cache(maxsize=65_536)
+def _uuid(raw: bytes) -> uuid.UUID:
+    """Returns the UUID of 16 raw bytes.
+
+    A live game is loaded on every action with the same game and player ids,
+    so the UUIDs are interned instead of being rebuilt each time.
+    """
+    return uuid.UUID(bytes=raw)
+
+
+@functools.lru_cache(maxsize=65_536)
+def _uuid_from_str(text: str) -> uuid.UUID:
+    """Returns the UUID of its string form, interned like `_uuid`."""
+    return uuid.UUID(text)
+
+
+def session_field_values(
+    game: GameSession, attributes: Iterable[str]
+) -> dict[str, str | int]:
+    """Returns the hash fields storing the given session attributes.
+
+    Raises:
+        KeyError: If an attribute is not stored in its own hash field.
+    """
+    values: dict[str, str | int] = {}
+    for attribute in attributes:
+        value = getattr(game, attribute)
+        if isinstance(value, GameStatus):
+            value = value.value
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        elif value is None:
+            value = ""
+        values[HASH_FIELDS[attribute]] = value
+    return values
+
+
+def session_to_fields(game: GameSession) -> dict[str, str | int]:
+    """Returns every hash field of a session except the version."""
+    fields = session_field_values(game, HASH_FIELDS)
+    fields["players"] = ",".join(str(player_id) for player_id in game.players)
+    boards = {
+        str(player_id): player_board.board
+        for player_id, player_board in game.players.items()
+        if player_board.board
+    }
+    if boards:
+        fields["boards"] = codec.dumps_str(boards)
+    return fields
+
+
+def session_from_fields(
+    game_id: uuid.UUID, fields: Mapping[str, str]
+) -> GameSession:
+    """Rebuilds a session from the fields of its hash."""
+    boards = codec.loads(fields["boards"]) if fields.get("boards") else {}
+    players = fields["players"]
+    return GameSession(
+        game_id=game_id,
+        start_datetime=int(fields["start"]),
+        end_datetime=int(fields["end"]),
+        players={
+            _uuid_from_str(player_id): PlayerBoard(boards.get(player_id, {}))
+            for player_id in (players.split(",") if players else ())
+        },
+        current_turn=_uuid_from_str(fields["turn"]) if fields.get("turn") else None,
+        status=GameStatus(fields["status"]),
+    )
+
+
+def encode_session(game: GameSession) -> bytes:
+    """Encodes a session in the binary string layout."""
+    flags = _HAS_TURN if game.current_turn is not None else 0
+    parts = [
+        _HEADER.pack(
+            VERSION,
+            _STATUS_INDEX[game.status],
+            len(game.players),
+            flags,
+            game.game_id.bytes,
+            game.start_datetime,
+            game.end_datetime,
+            game.current_turn.bytes if game.current_turn is not None else _NO_TURN,
+        )
+    ]
+    for player_id, player_board in game.players.items():
+        parts.append(player_id.bytes)
+        parts.append(bytes([len(player_board.board)]))
+        for ship_id, cells in player_board.board.items():
+            name = ship_id.encode("utf-8")
+            parts.append(bytes([len(name)]))
+            parts.append(name)
+            parts.append(mask_from_cells(cells).to_bytes(MASK_BYTES, "big"))
+    return b"".join(parts)
+
+
+def _decode_board(data: bytes, offset: int) -> tuple[dict[str, list[str]], int]:
+    """Decodes the ships of one player, starting at their ship count.
+
+    Returns:
+        The board, and the offset of the data following it.
+    """
+    ship_count = data[offset]
+    offset += 1
+    board: dict[str, list[str]] = {}
+    for _ in range(ship_count):
+        size = data[offset]
+        offset += 1
+        ship_id = data[offset:offset + size].decode("utf-8")
+        offset += size
+        mask = int.from_bytes(data[offset:offset + MASK_BYTES], "big")
+        offset += MASK_BYTES
+        board[ship_id] = cells_from_mask(mask)
+    return board, offset
+
+
+def decode_session(data: bytes | str) -> GameSession:
+    """Decodes a session stored as a binary or JSON string.
+
+    Raises:
+        ValueError: If the data is neither a known binary version nor JSON.
+    """
+    if isinstance(data, str) or data[:1] == b"{":
+        return GameSession.from_serialized_dict(codec.loads(data))
+    if data[0] != VERSION:
+        raise ValueError(f"Unknown game session encoding version {data[0]}")
+
+    (
+        _, status, player_count, flags, game_id, start, end, turn
+    ) = _HEADER.unpack_from(data)
+    players: dict[uuid.UUID, PlayerBoard] = {}
+    offset = _HEADER.size
+    for _ in range(player_count):
+        player_id = _uuid(data[offset:offset + 16])
+        board, offset = _decode_board(data, offset + 16)
+        players[player_id] = PlayerBoard(board)
+
+    return GameSession(
+        game_id=_uuid(game_id),
+        start_datetime=start,
+        end_datetime=end,
+        players=players,
+        current_turn=_uuid(turn) if flags & _HAS_TURN else None,
+        status=STATUS_CODES[status],
+    )
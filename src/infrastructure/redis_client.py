@@ -0,0 +1,227 @@
+"""Builds the shared Redis client and keeps an eye on its health.
+
+The client uses a blocking connection pool capped at `max_connections`: under
+a burst, callers wait up to `pool_timeout_seconds` for a free connection
+instead of failing with "Too many connections". Transient connection errors
+and timeouts are retried with jittered exponential backoff. The application
+lifespan creates the client next to the database pool, warms it before serving
+traffic, runs `RedisHealthCheck` in the background for readiness, and closes
+the pool on shutdown.
+
+With `cluster` set, the client is a RedisCluster seeded from host and port.
+It keeps a connection pool per node, capped at `max_connections` each, and
+routes every command to the node owning its key's slot. The asyncio cluster
+client has no pub/sub, so `create_pubsub_client` then opens a plain client to
+the seed node for it. Redis Cluster forwards published messages to every
+node, so any node can serve the subscriptions.
+"""
+
+import asyncio
+import logging
+import time
+from typing import cast
+
+import redis.asyncio as aioredis
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.retry import Retry
+from redis.backoff import EqualJitterBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from src.config import RedisSettings
+from src.infrastructure.metrics import (
+    REDIS_PING_LATENCY,
+    REDIS_POOL_CONNECTIONS,
+    REDIS_UP,
+    count_redis_calls,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _retry(config: RedisSettings) -> Retry:
+    return Retry(
+        EqualJitterBackoff(
+            cap=config.retry_backoff_cap_seconds,
+            base=config.retry_backoff_base_seconds,
+        ),
+        config.retry_attempts,
+    )
+
+
+def create_redis_client(config: RedisSettings) -> aioredis.Redis:
+    """Creates a Redis client from the settings; no connection is opened yet.
+
+    Args:
+        config: Connection, pool, timeout and retry settings.
+
+    Returns:
+        A client on a blocking pool, or a RedisCluster when `cluster` is set.
+        The cluster client has the same command API, so it is returned as a
+        Redis client. Either way its commands are counted in the metrics.
+    """
+    client: aioredis.Redis
+    if config.cluster:
+        client = cast(aioredis.Redis, RedisCluster(
+            host=config.host,
+            port=config.port,
+            max_connections=config.max_connections,
+            username=config.username,
+            password=config.password,
+            decode_responses=config.decode_responses,
+            protocol=config.protocol,
+            socket_timeout=config.socket_timeout_seconds,
+            socket_connect_timeout=config.socket_connect_timeout_seconds,
+            socket_keepalive=config.socket_keepalive,
+            health_check_interval=config.connection_health_check_seconds,
+            retry=_retry(config),
+            retry_on_error=[RedisConnectionError, RedisTimeoutError],
+        ))
+        count_redis_calls(client)
+        return client
+
+    pool = aioredis.BlockingConnectionPool(
+        max_connections=config.max_connections,
+        timeout=config.pool_timeout_seconds,  # type: ignore[arg-type]
+        host=config.host,
+        port=config.port,
+        db=config.db,
+        username=config.username,
+        password=config.password,
+        decode_responses=config.decode_responses,
+        protocol=config.protocol,
+        socket_timeout=config.socket_timeout_seconds,
+        socket_connect_timeout=config.socket_connect_timeout_seconds,
+        socket_keepalive=config.socket_keepalive,
+        health_check_interval=config.connection_health_check_seconds,
+        retry=_retry(config),
+        retry_on_error=[RedisConnectionError, RedisTimeoutError],
+    )
+    client = aioredis.Redis(connection_pool=pool)
+    count_redis_calls(client)
+    return client
+
+
+def create_pubsub_client(
+    config: RedisSettings, redis_client: aioredis.Redis
+) -> aioredis.Redis:
+    """Returns the client pub/sub runs on.
+
+    That is `redis_client` itself, except on a cluster. There it is a plain
+    client to the seed node, which the caller closes along with the shared
+    client.
+
+    Args:
+        config: Connection, timeout and retry settings.
+        redis_client: The shared client.
+    """
+    if not config.cluster:
+        return redis_client
+    return aioredis.Redis(
+        host=config.host,
+        port=config.port,
+        username=config.username,
+        password=config.password,
+        decode_responses=config.decode_responses,
+        protocol=config.protocol,
+        socket_timeout=config.socket_timeout_seconds,
+        socket_connect_timeout=config.socket_connect_timeout_seconds,
+        socket_keepalive=config.socket_keepalive,
+        health_check_interval=config.connection_health_check_seconds,
+        retry=_retry(config),
+        retry_on_error=[RedisConnectionError, RedisTimeoutError],
+    )
+
+
+async def warm_up(redis_client: aioredis.Redis, connections: int) -> None:
+    """Opens `connections` pooled connections so the first requests reuse them.
+
+    The pings run concurrently, so each one checks out its own connection.
+    """
+    if connections <= 0:
+        return
+    started = time.perf_counter()
+    await asyncio.gather(*(redis_client.ping() for _ in range(connections)))
+    logger.info(
+        "Warmed %d Redis connections in %.1f ms",
+        connections,
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+class RedisHealthCheck:
+    """Pings Redis periodically and reports whether it is reachable.
+
+    Attributes:
+        healthy: Whether the last ping succeeded.
+        last_latency: Round-trip time of the last successful ping, in seconds.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        interval_seconds: float = 5.0,
+        timeout_seconds: float = 1.0,
+    ) -> None:
+        """Initializes the health check.
+
+        Args:
+            redis_client: The client to check.
+            interval_seconds: Time between pings.
+            timeout_seconds: How long a ping may take before Redis is
+                considered down.
+        """
+        self.redis_client = redis_client
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.healthy = False
+        self.last_latency: float | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def check(self) -> bool:
+        """Pings Redis once and records the outcome."""
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.redis_client.ping(), self.timeout_seconds)
+        except Exception as e:
+            if self.healthy:
+                logger.error("Redis health check failed: %s", e)
+            self.healthy = False
+        else:
+            if not self.healthy:
+                logger.info("Redis is reachable")
+            self.healthy = True
+            self.last_latency = time.perf_counter() - started
+            REDIS_PING_LATENCY.set(self.last_latency)
+        REDIS_UP.set(1 if self.healthy else 0)
+        self._report_pool()
+        return self.healthy
+
+    def _report_pool(self) -> None:
+        # A cluster client keeps one pool per node rather than a single one.
+        pool = getattr(self.redis_client, "connection_pool", None)
+        if pool is None:
+            return
+        in_use = len(getattr(pool, "_in_use_connections", ()))
+        REDIS_POOL_CONNECTIONS.set(in_use, state="in_use")
+        REDIS_POOL_CONNECTIONS.set(
+            len(getattr(pool, "_available_connections", ())), state="idle"
+        )
+        REDIS_POOL_CONNECTIONS.set(pool.max_connections, state="max")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.check()
+
+    async def start(self) -> None:
+        """Runs a first check and keeps checking in the background."""
+        await self.check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the background checks."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
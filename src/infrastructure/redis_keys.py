@@ -0,0 +1,76 @@
+"""Names of the Redis keys shared by the repositories and the scheduler.
+
+With hash tags off, a game's keys are `game:<game_id>`, `game:<game_id>:events`
+and so on. With hash tags on, the id is wrapped in braces, as in
+`game:{<game_id>}:events`. Redis then hashes only the braced part, so every
+key of a game lands on the same cluster slot. This is what lets the shot script
+and the session transactions, which touch several of a game's keys at once,
+run on a Redis Cluster. The deadline keys are tagged the same way. Player keys
+are only ever used one at a time, so they are never tagged.
+
+Turning hash tags on renames the game keys, so it only applies to games
+created after the switch. Redis Cluster always needs them.
+"""
+
+import uuid
+
+GameId = uuid.UUID | str
+
+
+class RedisKeys:
+    """Builds the Redis key names for one key layout.
+
+    Attributes:
+        hash_tags: Whether a game's keys are hash tagged onto one slot.
+    """
+
+    def __init__(self, hash_tags: bool = False) -> None:
+        self.hash_tags = hash_tags
+
+    def _game(self, game_id: GameId) -> str:
+        if self.hash_tags:
+            return f"game:{{{game_id}}}"
+        return f"game:{game_id}"
+
+    def session(self, game_id: GameId) -> str:
+        """Returns the key of a game's live session."""
+        return self._game(game_id)
+
+    def events(self, game_id: GameId) -> str:
+        """Returns the Redis Stream holding a game's event log."""
+        return f"{self._game(game_id)}:events"
+
+    def snapshot(self, game_id: GameId) -> str:
+        """Returns the Redis hash holding a game's latest session snapshot."""
+        return f"{self._game(game_id)}:snapshot"
+
+    def stored_session(self, game_id: GameId) -> str:
+        """Returns the key save_game_session writes a session to."""
+        return f"{self._game(game_id)}:session"
+
+    def board(self, game_id: GameId) -> str:
+        """Returns the key of a game's combined board."""
+        return f"{self._game(game_id)}:board"
+
+    def ships(self, game_id: GameId, player_id: uuid.UUID | str) -> str:
+        """Returns the hash of a player's ships and their reverse index."""
+        return f"{self._game(game_id)}:player_id:{player_id}:ships"
+
+    def hits(self, game_id: GameId, player_id: uuid.UUID | str) -> str:
+        """Returns the hash of the hits against a player's board."""
+        return f"{self._game(game_id)}:player_board:{player_id}:hits"
+
+    @staticmethod
+    def active_game(player_id: uuid.UUID | str) -> str:
+        """Returns the key holding the game a player is playing."""
+        return f"player:{player_id}:active_game"
+
+    @property
+    def deadlines(self) -> str:
+        """Returns the sorted set of pending deadlines."""
+        return "{deadlines}" if self.hash_tags else "deadlines"
+
+    @property
+    def deadline_payloads(self) -> str:
+        """Returns the hash of the payloads of pending deadlines."""
+        return f"{self.deadlines}:payload"
@@ -0,0 +1,141 @@
+"""A hierarchical timing wheel for large numbers of keyed deadlines.
+
+Scheduling, rescheduling and cancelling a timer are O(1) dictionary
+operations, and advancing the clock only touches the slots that come due, so
+the cost of a tick does not grow with the number of pending timers. Level 0
+holds the timers due within one turn of the wheel at `tick_seconds`
+resolution; each further level covers `wheel_size` times the span of the one
+below, and its slots are cascaded down as the lower level wraps around.
+"""
+
+import math
+from dataclasses import dataclass
+
+SlotIndex = tuple[int, int]
+
+
+@dataclass(slots=True)
+class Timer:
+    """A pending deadline.
+
+    Attributes:
+        key: Unique name of the timer; scheduling the same key again
+            replaces it.
+        deadline: Unix time at which the timer expires.
+        tick: The wheel tick the deadline falls in.
+    """
+
+    key: str
+    deadline: float
+    tick: int
+
+
+class TimerWheel:
+    """Keyed timers bucketed into a hierarchy of wheels."""
+
+    def __init__(
+        self,
+        tick_seconds: float = 0.1,
+        wheel_size: int = 256,
+        levels: int = 4,
+        now: float = 0.0,
+    ) -> None:
+        """Initializes the wheel.
+
+        Args:
+            tick_seconds: Resolution of the wheel.
+            wheel_size: Slots per level, a power of two.
+            levels: Number of levels. Deadlines beyond the span of the last
+                level are parked in it and re-bucketed when their slot
+                comes round.
+            now: Unix time the wheel starts at.
+        """
+        if wheel_size & (wheel_size - 1):
+            raise ValueError("wheel_size must be a power of two")
+        self.tick_seconds = tick_seconds
+        self.wheel_size = wheel_size
+        self.levels = levels
+        self._bits = wheel_size.bit_length() - 1
+        self._mask = wheel_size - 1
+        self._current = self._tick_of(now)
+        self._slots: list[list[dict[str, Timer]]] = [
+            [{} for _ in range(wheel_size)] for _ in range(levels)
+        ]
+        self._index: dict[str, SlotIndex] = {}
+        # Timers that were already due when scheduled.
+        self._due: dict[str, Timer] = {}
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._due)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index or key in self._due
+
+    def _tick_of(self, moment: float) -> int:
+        return math.floor(moment / self.tick_seconds)
+
+    def schedule(self, key: str, deadline: float) -> None:
+        """Adds a timer, replacing any pending timer with the same key."""
+        self.cancel(key)
+        self._place(Timer(key, deadline, math.ceil(deadline / self.tick_seconds)))
+
+    def cancel(self, key: str) -> bool:
+        """Removes a pending timer.
+
+        Returns:
+            True if a timer with that key was pending.
+        """
+        position = self._index.pop(key, None)
+        if position is not None:
+            level, slot = position
+            del self._slots[level][slot][key]
+            return True
+        return self._due.pop(key, None) is not None
+
+    def _place(self, timer: Timer) -> None:
+        delta = timer.tick - self._current
+        if delta <= 0:
+            self._due[timer.key] = timer
+            return
+        level = 0
+        while level < self.levels - 1 and delta >= 1 << (self._bits * (level + 1)):
+            level += 1
+        slot = (timer.tick >> (self._bits * level)) & self._mask
+        self._slots[level][slot][timer.key] = timer
+        self._index[timer.key] = (level, slot)
+
+    def _take(self, level: int, slot: int) -> list[Timer]:
+        bucket = self._slots[level][slot]
+        if not bucket:
+            return []
+        self._slots[level][slot] = {}
+        for key in bucket:
+            del self._index[key]
+        return list(bucket.values())
+
+    def advance(self, now: float) -> list[Timer]:
+        """Moves the clock to `now` and returns the timers that expired."""
+        expired = list(self._due.values())
+        self._due.clear()
+        target = self._tick_of(now)
+        while self._current < target:
+            if not self._index:
+                self._current = target
+                break
+            self._current += 1
+            # Cascade the higher levels whose slot just came round, highest
+            # first so their timers can still land in the lower slots below.
+            level = 1
+            while (
+                level < self.levels
+                and self._current & ((1 << (self._bits * level)) - 1) == 0
+            ):
+                level += 1
+            for upper in range(level - 1, 0, -1):
+                slot = (self._current >> (self._bits * upper)) & self._mask
+                for timer in self._take(upper, slot):
+                    self._place(timer)
+            expired.extend(self._take(0, self._current & self._mask))
+            expired.extend(self._due.values())
+            self._due.clear()
+        return expired
@@ -6,14 +6,24 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import asyncpg  # type: ignore
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from src.api import metrics_router
 from src.api.v1 import auth_router
 from src.api.v1.player_router import v1_router
-from src.api.websocket_handler import router
+from src.api.websocket_handler import build_game_services, router
 from src.config import settings
 from src.infrastructure.logger import setup_logging
+from src.infrastructure.password_pool import password_pool
+from src.infrastructure.persistence.game_archive import FinishedGameWriter
+from src.infrastructure.redis_client import (
+    RedisHealthCheck,
+    create_pubsub_client,
+    create_redis_client,
+    warm_up,
+)
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -29,11 +39,66 @@ async def lifespan(appFast: FastAPI) -> AsyncGenerator[None, None]:
         appFast.state.db_pool = pool
         logger.info("🗄️ Connected to PostgreSQL")
     except Exception as e:
-        logger.error(f"❌ Failed to connect to DB: {e}")
+        logger.error("❌ Failed to connect to DB: %s", e)
+        raise
+
+    redis_client = create_redis_client(settings.redis)
+    # The shared client itself, except on a Redis Cluster.
+    pubsub_client = create_pubsub_client(settings.redis, redis_client)
+    appFast.state.redis_client = redis_client
+    try:
+        await warm_up(redis_client, settings.redis.warm_connections)
+        logger.info("🧰 Connected to Redis")
+    except Exception as e:
+        logger.error("❌ Failed to connect to Redis: %s", e)
         raise
+    redis_health = RedisHealthCheck(
+        redis_client, interval_seconds=settings.redis.health_check_seconds
+    )
+    await redis_health.start()
+    appFast.state.redis_health = redis_health
+
+    services = build_game_services(redis_client, pubsub_client)
+    appFast.state.game_services = services
+    conn_manager = services.conn_manager
+    deadline_scheduler = services.deadline_scheduler
+    await conn_manager.start()
+    if deadline_scheduler is not None:
+        await deadline_scheduler.start()
+
+    archive_writer: FinishedGameWriter | None = None
+    if settings.game_archive.enabled:
+        archive_writer = FinishedGameWriter(
+            redis_client,
+            pool,
+            consumer=settings.node.node_id,
+            batch_size=settings.game_archive.batch_size,
+            block_ms=settings.game_archive.block_ms,
+            claim_idle_ms=settings.game_archive.claim_idle_ms,
+            max_retry_delay_seconds=settings.game_archive.max_retry_delay_seconds,
+        )
+        await archive_writer.start()
 
     yield  # Server runs here
 
+    await services.game_service.bots.stop()
+    if archive_writer is not None:
+        await archive_writer.stop()
+    if deadline_scheduler is not None:
+        await deadline_scheduler.stop()
+    await conn_manager.stop()
+    password_pool.shutdown()
+
+    await redis_health.stop()
+    if pubsub_client is not redis_client:
+        await pubsub_client.aclose(close_connection_pool=True)
+    if settings.redis.cluster:
+        # A cluster client owns one pool per node and closes them all.
+        await redis_client.aclose()
+    else:
+        await redis_client.aclose(close_connection_pool=True)
+    logger.info("🛑 Redis connection closed")
+
     if hasattr(appFast.state, "db_pool"):
         await appFast.state.db_pool.close()
         logger.info("🛑 PostgreSQL connection closed")
@@ -61,6 +126,7 @@ app.add_middleware(
 app.include_router(router)
 app.include_router(v1_router)
 app.include_router(auth_router.router)
+app.include_router(metrics_router.router)
 
 
 @app.get("/")
@@ -69,6 +135,17 @@ def read_root() -> dict[str, str]:
     return {"message": "Welcome to Batalha Naval", "docs": "/docs"}
 
 
+@app.get("/health/ready", include_in_schema=False)
+def readiness(request: Request) -> JSONResponse:
+    """Report whether the server can take traffic, based on the Redis checks."""
+    redis_health: RedisHealthCheck | None = getattr(
+        request.app.state, "redis_health", None
+    )
+    if redis_health is None or not redis_health.healthy:
+        return JSONResponse({"status": "unavailable", "redis": "down"}, 503)
+    return JSONResponse({"status": "ready", "redis": "up"})
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,25 @@
+"""Test file for the board coordinates and cell bitmasks"""
+
+import pytest
+
+from src.domain.board import cell_to_index, cells_from_mask, mask_from_cells
+
+
+def test_cell_to_index_covers_whole_board() -> None:
+    """
+    Test that cell_to_index maps the corners of the 15x15 board and rejects others.
+    """
+    assert cell_to_index("A1") == 0
+    assert cell_to_index("A15") == 14
+    assert cell_to_index("O15") == 224
+
+    with pytest.raises(ValueError):
+        cell_to_index("P1")
+
+
+def test_mask_round_trip() -> None:
+    """
+    Test that mask_from_cells and cells_from_mask are inverse operations.
+    """
+    cells = ["B2", "B3", "B4"]
+    assert cells_from_mask(mask_from_cells(cells)) == cells
@@ -0,0 +1,45 @@
+"""Test file for the bot opponents run by a worker"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.bot import BotOpponents
+
+
+def _bot() -> SimpleNamespace:
+    """Returns a bot stub whose game never ends."""
+    player_id = uuid.uuid4()
+    return SimpleNamespace(
+        player=SimpleNamespace(id=player_id),
+        player_id=player_id,
+        game_id=uuid.uuid4(),
+        connection=MagicMock(),
+        play=AsyncMock(side_effect=asyncio.Event().wait),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_the_bots_and_disconnects_them() -> None:
+    """
+    Test that stopping cancels every bot task and waits for it to disconnect.
+    """
+    conn_manager = MagicMock()
+    conn_manager.add_player = AsyncMock()
+    conn_manager.remove_player = AsyncMock()
+    bots = BotOpponents(SimpleNamespace(conn_manager=conn_manager))  # type: ignore
+    first, second = _bot(), _bot()
+
+    await bots.launch(first)  # type: ignore
+    await bots.launch(second)  # type: ignore
+    await asyncio.sleep(0)
+    assert bots.active == 2
+
+    await bots.stop()
+
+    assert bots.active == 0
+    removed = {call.args[0] for call in conn_manager.remove_player.await_args_list}
+    assert removed == {first.player_id, second.player_id}
@@ -0,0 +1,28 @@
+"""Test file for the WebSocket JSON codec"""
+
+import uuid
+
+from src.api.v1.schemas.place_ships import StandardResponse
+from src.infrastructure import codec
+
+
+def test_codec_encodes_responses_with_uuids() -> None:
+    """
+    Test that codec serializes a StandardResponse holding UUIDs and reads it back.
+    """
+    game_id = uuid.uuid4()
+    response = StandardResponse(
+        status="hit", message="You hit a ship!", action="shoot_result",
+        data={"game_id": game_id, "sunk": False},
+    )
+
+    encoded = codec.dumps(response)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {
+        "status": "hit",
+        "message": "You hit a ship!",
+        "action": "shoot_result",
+        "data": {"game_id": str(game_id), "sunk": False},
+    }
+    assert codec.loads(codec.dumps_str(response)) == codec.loads(encoded)
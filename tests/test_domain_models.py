@@ -0,0 +1,62 @@
+"""Test file for the game session and player domain models"""
+
+import uuid
+
+import pytest
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.domain.player import Player
+
+
+def _session() -> GameSession:
+    first, second = uuid.uuid4(), uuid.uuid4()
+    return GameSession(
+        game_id=uuid.uuid4(),
+        players={
+            first: PlayerBoard({"destroyer": ["O14", "O15"]}),
+            second: PlayerBoard(),
+        },
+        current_turn=first,
+        status=GameStatus.IN_PROGRESS,
+    )
+
+
+def test_session_converts_to_and_from_its_serialized_form() -> None:
+    """
+    Test that from_serialized_dict rebuilds the session to_serializable_dict wrote.
+    """
+    game = _session()
+
+    data = game.to_serializable_dict()
+
+    assert data["status"] == "in_progress"
+    assert data["current_turn"] == str(game.current_turn)
+    assert GameSession.from_serialized_dict(data) == game
+
+
+def test_session_copy_shares_no_boards() -> None:
+    """
+    Test that changing a copied session leaves the original untouched.
+    """
+    game = _session()
+    player_id = next(iter(game.players))
+
+    copied = game.copy()
+    copied.players[player_id].board["destroyer"].append("O16")
+    copied.status = GameStatus.FINISHED
+
+    assert copied != game
+    assert game.players[player_id].board["destroyer"] == ["O14", "O15"]
+    assert game.status == GameStatus.IN_PROGRESS
+
+
+def test_domain_models_are_slotted() -> None:
+    """
+    Test that the per-message domain objects take no instance __dict__.
+    """
+    player = Player(id=uuid.uuid4())
+
+    with pytest.raises(AttributeError):
+        player.nickname = "ghost"  # type: ignore[attr-defined]
+    assert not hasattr(_session(), "__dict__")
+    assert "password" not in repr(Player(password="hash"))
@@ -0,0 +1,216 @@
+"""Test file for the finished games archive entries"""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
+import asyncpg  # type: ignore
+import fakeredis
+import pytest
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.infrastructure.persistence.game_archive import (
+    ARCHIVE_GROUP,
+    FINISHED_GAMES_STREAM,
+    FinishedGameWriter,
+    casual_game_row,
+    finished_game_fields,
+)
+
+
+class _Connection:
+    """Records the inserts of the writer, refusing the games in `bad_ids`.
+
+    A refused game fails the whole `executemany` batch, as a constraint
+    violation does in a transaction, and `down` fails every insert.
+    """
+
+    def __init__(self, bad_ids: set[uuid.UUID] | None = None) -> None:
+        self.bad_ids = bad_ids or set()
+        self.down = False
+        self.batches: list[tuple[str, list[Any]]] = []
+        self.inserted: list[uuid.UUID] = []
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Commits nothing itself, the rows are only kept on success."""
+        yield
+
+    async def executemany(self, query: str, rows: list[Any]) -> None:
+        """Inserts all the rows, or none of them."""
+        self.batches.append((query, list(rows)))
+        if self.down:
+            raise OSError("connection refused")
+        if any(row[0] in self.bad_ids for row in rows):
+            raise asyncpg.ForeignKeyViolationError("player is not present")
+        self.inserted.extend(row[0] for row in rows)
+
+    async def execute(self, _query: str, *row: Any) -> None:
+        """Inserts a single row."""
+        if row[0] in self.bad_ids:
+            raise asyncpg.ForeignKeyViolationError("player is not present")
+        self.inserted.append(row[0])
+
+
+class _Pool:
+    """Hands out the one recording connection."""
+
+    def __init__(self, connection: _Connection) -> None:
+        self.connection = connection
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[_Connection]:
+        """Lends the connection for the duration of the block."""
+        yield self.connection
+
+
+def _finished_game() -> dict[str, str]:
+    """Returns the stream entry of a finished game between two new players."""
+    player1, player2 = uuid.uuid4(), uuid.uuid4()
+    game = GameSession(
+        game_id=uuid.uuid4(),
+        end_datetime=1_700_000_600,
+        players={player1: PlayerBoard(), player2: PlayerBoard()},
+        status=GameStatus.FINISHED,
+    )
+    return finished_game_fields(game, player1)
+
+
+async def _writer(
+    connection: _Connection, consumer: str = "worker-1"
+) -> FinishedGameWriter:
+    """Returns a writer on an empty fake Redis with its consumer group made."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    await client.xgroup_create(
+        FINISHED_GAMES_STREAM, ARCHIVE_GROUP, id="0", mkstream=True
+    )
+    return FinishedGameWriter(
+        client, _Pool(connection), consumer, claim_idle_ms=0  # type: ignore
+    )
+
+
+async def _queue(writer: FinishedGameWriter, *entries: dict[str, str]) -> None:
+    """Appends entries to the finished games stream."""
+    for fields in entries:
+        await writer.redis_client.xadd(FINISHED_GAMES_STREAM, fields)  # type: ignore
+
+
+async def _pending(writer: FinishedGameWriter) -> int:
+    """Returns the number of entries read but not acknowledged."""
+    summary = await writer.redis_client.xpending(FINISHED_GAMES_STREAM, ARCHIVE_GROUP)
+    return int(summary["pending"])
+
+
+def test_finished_game_entry_converts_to_casual_game_row() -> None:
+    """
+    Test that a finished game's stream entry maps onto a casual_games row.
+    """
+    player1, player2 = uuid.uuid4(), uuid.uuid4()
+    game = GameSession(
+        game_id=uuid.uuid4(),
+        start_datetime=1_700_000_000,
+        end_datetime=1_700_000_600,
+        players={player1: PlayerBoard(), player2: PlayerBoard()},
+        status=GameStatus.FINISHED,
+    )
+
+    row = casual_game_row(finished_game_fields(game, player2))
+
+    assert row == (
+        game.game_id,
+        player1,
+        player2,
+        player2,
+        datetime.fromtimestamp(1_700_000_600, tz=timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_flush_inserts_the_batch_then_acknowledges_it() -> None:
+    """
+    Test that a batch is inserted at once, idempotently, before being acked.
+    """
+    connection = _Connection()
+    writer = await _writer(connection)
+    games = [_finished_game() for _ in range(3)]
+    await _queue(writer, *games)
+
+    entries = await writer._read(backlog=False)
+    assert await _pending(writer) == 3
+    await writer.flush(entries)
+
+    assert len(connection.batches) == 1
+    query, rows = connection.batches[0]
+    assert "ON CONFLICT (id) DO NOTHING" in query
+    assert [row[0] for row in rows] == [uuid.UUID(f["game_id"]) for f in games]
+    assert await _pending(writer) == 0
+    assert await writer.redis_client.xlen(FINISHED_GAMES_STREAM) == 0
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_falls_back_to_single_rows() -> None:
+    """
+    Test that a constraint violation only drops the offending games.
+    """
+    games = [_finished_game() for _ in range(3)]
+    bad_id = uuid.UUID(games[1]["game_id"])
+    connection = _Connection({bad_id})
+    writer = await _writer(connection)
+    await _queue(writer, *games)
+
+    await writer.flush(await writer._read(backlog=False))
+
+    assert len(connection.batches) == 1
+    assert connection.inserted == [
+        uuid.UUID(games[0]["game_id"]),
+        uuid.UUID(games[2]["game_id"]),
+    ]
+    assert await _pending(writer) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_leaves_the_entries_pending() -> None:
+    """
+    Test that entries are not acked when the database is unreachable, and
+    are read again from the consumer's backlog once it is back.
+    """
+    connection = _Connection()
+    connection.down = True
+    writer = await _writer(connection)
+    await _queue(writer, _finished_game(), {"game_id": "broken"})
+
+    with pytest.raises(OSError):
+        await writer.flush(await writer._read(backlog=False))
+    assert await _pending(writer) == 2
+    assert await writer._read(backlog=False) == []
+
+    connection.down = False
+    backlog = await writer._read(backlog=True)
+    assert len(backlog) == 2
+    await writer.flush(backlog)
+
+    assert len(connection.inserted) == 1
+    assert await _pending(writer) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_of_another_consumer_are_claimed() -> None:
+    """
+    Test that entries left pending by a crashed worker are taken over.
+    """
+    connection = _Connection()
+    writer = await _writer(connection, consumer="worker-2")
+    fields = _finished_game()
+    await _queue(writer, fields)
+    await writer.redis_client.xreadgroup(
+        ARCHIVE_GROUP, "worker-1", {FINISHED_GAMES_STREAM: ">"}
+    )
+
+    assert await writer._read(backlog=True) == []
+    claimed = await writer._claim_stale()
+    await writer.flush(claimed)
+
+    assert [entry_fields for _, entry_fields in claimed] == [fields]
+    assert connection.inserted == [uuid.UUID(fields["game_id"])]
+    assert await _pending(writer) == 0
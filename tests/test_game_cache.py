@@ -0,0 +1,67 @@
+"""Test file for the in-process game session cache"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from src.domain.game import GameSession, PlayerBoard
+from src.infrastructure.persistence.game_cache import GameSessionCache
+
+
+def _session() -> GameSession:
+    return GameSession(
+        game_id=uuid.uuid4(),
+        players={uuid.uuid4(): PlayerBoard(), uuid.uuid4(): PlayerBoard()},
+    )
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """
+    Test that GameSessionCache keeps at most max_size sessions, dropping the LRU one.
+    """
+    cache = GameSessionCache(max_size=2)
+    first, second, third = _session(), _session(), _session()
+
+    cache.put(first)
+    cache.put(second)
+    assert cache.get(first.game_id) is first
+
+    cache.put(third)
+    assert cache.get(second.game_id) is None
+    assert cache.get(first.game_id) is first
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_cache_expires_entries() -> None:
+    """
+    Test that GameSessionCache treats entries older than the TTL as misses.
+    """
+    cache = GameSessionCache(ttl_seconds=-1)
+    session = _session()
+    cache.put(session)
+
+    assert cache.get(session.game_id) is None
+    assert cache.stats.expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_lock_serializes_same_game() -> None:
+    """
+    Test that GameSessionCache.lock runs actions on the same game one at a time.
+    """
+    cache = GameSessionCache()
+    game_id = uuid.uuid4()
+    events: list[str] = []
+
+    async def action(name: str) -> None:
+        async with cache.lock(game_id):
+            events.append(f"{name}-start")
+            await asyncio.sleep(0)
+            events.append(f"{name}-end")
+
+    await asyncio.gather(action("a"), action("b"))
+
+    assert events == ["a-start", "a-end", "b-start", "b-end"]
+    assert not cache._locks
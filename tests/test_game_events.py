@@ -0,0 +1,36 @@
+"""Test file for the game event log replay"""
+
+import uuid
+
+from src.domain.game import GameStatus
+from src.domain.game_events import GameEvent, replay
+
+
+def test_replay_rebuilds_a_finished_game() -> None:
+    """
+    Test that replaying stream entries restores turn, status and end time.
+    """
+    game_id = uuid.uuid4()
+    player1, player2 = uuid.uuid4(), uuid.uuid4()
+    created = GameEvent.from_fields(
+        {"t": "created", "ts": "100", "players": f"{player1},{player2}"}
+    )
+    events = [
+        created,
+        GameEvent.started(player1),
+        GameEvent.turn_passed(player1, player2),
+        GameEvent.from_fields(
+            {"t": "shot", "ts": "200", "p": str(player2), "c": "A1",
+             "r": "game_over", "s": "carrier"}
+        ),
+    ]
+
+    game = replay(game_id, None, events)
+
+    assert game is not None
+    assert set(game.players) == {player1, player2}
+    assert game.start_datetime == 100
+    assert game.current_turn == player2
+    assert game.status == GameStatus.FINISHED
+    assert game.end_datetime == 200
+    assert GameEvent.from_fields(events[2].to_fields()) == events[2]
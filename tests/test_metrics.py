@@ -0,0 +1,59 @@
+"""Test file for the in-process metrics registry"""
+
+import fakeredis
+import pytest
+
+from src.infrastructure.metrics import (
+    REDIS_CALLS,
+    MetricsRegistry,
+    count_redis_calls,
+    track_action,
+)
+
+
+def test_registry_renders_prometheus_text() -> None:
+    """
+    Test that MetricsRegistry renders counters and cumulative histogram buckets.
+    """
+    registry = MetricsRegistry()
+    shots = registry.counter("shots_total", "Shots resolved.", ("result",))
+    latency = registry.histogram(
+        "action_seconds", "Action latency.", ("action",), buckets=(0.1, 1.0)
+    )
+
+    shots.inc(result="hit")
+    shots.inc(result="hit")
+    latency.observe(0.05, action="shoot")
+    latency.observe(0.5, action="shoot")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE shots_total counter" in lines
+    assert 'shots_total{result="hit"} 2.0' in lines
+    assert 'action_seconds_bucket{action="shoot",le="0.1"} 1' in lines
+    assert 'action_seconds_bucket{action="shoot",le="1.0"} 2' in lines
+    assert 'action_seconds_bucket{action="shoot",le="+Inf"} 2' in lines
+    assert 'action_seconds_count{action="shoot"} 2' in lines
+
+
+@pytest.mark.asyncio
+async def test_redis_calls_are_counted_under_the_current_action() -> None:
+    """
+    Test that every command sent, pipelined ones included, is counted once.
+    """
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    count_redis_calls(client)
+    shoot_calls = REDIS_CALLS.value(action="shoot")
+    untracked_calls = REDIS_CALLS.value(action="none")
+
+    with track_action("shoot"):
+        await client.set("game", "1")
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.get("game")
+            pipe.expire("game", 60)
+            pipe.incr("shots")
+            await pipe.execute()
+    await client.get("game")
+
+    assert REDIS_CALLS.value(action="shoot") == shoot_calls + 4
+    assert REDIS_CALLS.value(action="none") == untracked_calls + 1
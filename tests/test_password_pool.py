@@ -0,0 +1,68 @@
+"""Test file for the bounded password hashing pool"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.password_pool import PasswordHashPool, PasswordPoolBusyError
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_jobs_beyond_max_pending() -> None:
+    """
+    Test that PasswordHashPool admits at most max_pending jobs and rejects the rest.
+    """
+    pool = PasswordHashPool(workers=1, max_pending=2)
+    release = threading.Event()
+
+    first = asyncio.create_task(pool.run(release.wait))
+    second = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0)
+    assert pool.in_flight == 2
+    assert pool.queue_depth == 1
+
+    with pytest.raises(PasswordPoolBusyError):
+        await pool.run(release.wait)
+
+    release.set()
+    assert await asyncio.gather(first, second) == [True, True]
+    assert pool.in_flight == 0
+    assert pool.stats.rejected == 1
+    assert pool.stats.completed == 2
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_failed_jobs_apart_from_completed_ones() -> None:
+    """
+    Test that a job raising an exception is counted as failed, not completed.
+    """
+    pool = PasswordHashPool(workers=1, max_pending=2)
+
+    def broken_hash() -> None:
+        raise ValueError("Invalid salt")
+
+    with pytest.raises(ValueError):
+        await pool.run(broken_hash)
+    assert await pool.run(len, "secret") == 6
+
+    assert pool.in_flight == 0
+    assert pool.stats.failed == 1
+    assert pool.stats.completed == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_jobs_again_after_a_shutdown() -> None:
+    """
+    Test that a shut down pool starts new threads for the next job.
+    """
+    pool = PasswordHashPool(workers=1, max_pending=2)
+    assert await pool.run(len, "first") == 5
+
+    pool.shutdown()
+    assert await pool.run(len, "second") == 6
+
+    assert pool.stats.completed == 2
+    pool.shutdown()
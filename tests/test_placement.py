@@ -0,0 +1,69 @@
+"""Test file for the ship placement validator"""
+
+import random
+
+import pytest
+
+from src.domain.board import CELL_INDEX
+from src.domain.placement import PlacementError, validate_placement
+from src.domain.targeting import random_fleet
+
+FLEET = {"carrier": 5, "battleship": 4, "cruiser": 3, "submarine": 3, "destroyer": 2}
+
+VALID = {
+    "carrier": ["A11", "A12", "A13", "A14", "A15"],
+    "battleship": ["K1", "L1", "M1", "N1"],
+    "cruiser": ["E1", "E2", "E3"],
+    "submarine": ["G1", "G2", "G3"],
+    "destroyer": ["O14", "O15"],
+}
+
+
+def test_validate_placement_returns_cell_indexes() -> None:
+    """
+    Test that a valid placement, including the 10-15 columns, becomes indexes.
+    """
+    layout = validate_placement(VALID.items(), FLEET)
+
+    assert layout["destroyer"] == (CELL_INDEX["O14"], CELL_INDEX["O15"])
+    assert layout["battleship"] == tuple(CELL_INDEX[c] for c in VALID["battleship"])
+    rng = random.Random(3)
+    for _ in range(20):
+        validate_placement(random_fleet(FLEET, rng).items(), FLEET)
+
+
+@pytest.mark.parametrize(
+    "ship_id, positions",
+    [
+        ("destroyer", ["O15", "O16"]),
+        ("destroyer", ["B1", "B3"]),
+        ("destroyer", ["B1", "C2"]),
+        ("destroyer", ["A15", "B1"]),
+        ("destroyer", ["B1", "B1"]),
+        ("destroyer", ["B1", "B2", "B3"]),
+        ("destroyer", ["E2", "E3"]),
+    ],
+)
+def test_validate_placement_rejects_invalid_ships(
+    ship_id: str, positions: list[str]
+) -> None:
+    """
+    Test that off-board, gapped, bent, wrapped, short, long and overlapping ships fail.
+    """
+    ships = {**VALID, ship_id: positions}
+
+    with pytest.raises(PlacementError):
+        validate_placement(ships.items(), FLEET)
+
+
+def test_validate_placement_checks_the_fleet_composition() -> None:
+    """
+    Test that missing, unknown and repeated ships are rejected.
+    """
+    missing = {k: v for k, v in VALID.items() if k != "carrier"}
+    with pytest.raises(PlacementError, match="Missing ships: carrier"):
+        validate_placement(missing.items(), FLEET)
+    with pytest.raises(PlacementError, match="Unknown ship"):
+        validate_placement([*VALID.items(), ("canoe", ["J1"])], FLEET)
+    with pytest.raises(PlacementError, match="more than once"):
+        validate_placement([*VALID.items(), ("destroyer", ["J1", "J2"])], FLEET)
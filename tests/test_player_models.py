@@ -1,10 +1,16 @@
 """Test file for the players basic actions"""
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
+from src.domain.player import Player
+from src.infrastructure.connection.player_connection import (
+    OutboundQueueFullError,
+    PlayerConnection,
+)
 from src.infrastructure.connection.websocket import WebSocketConnection
 
 
@@ -73,3 +79,69 @@ async def test_websocket_connection_send_message_fail(
     out, err = capfd.readouterr()
     assert err == ""
     assert f"Error sending message to Player {player_id}: Simulate send error\n" in out
+
+
+@pytest.mark.asyncio
+async def test_player_connection_send_message_is_queued() -> None:
+    """
+    Test PlayerConnection.send_message queues frames and a writer task delivers them.
+    """
+    mock_conn = AsyncMock()
+    player_conn = PlayerConnection(Player(id=uuid.uuid4()), mock_conn)
+
+    await player_conn.send_message("first")
+    await player_conn.send_message("second")
+    mock_conn.send_message.assert_not_called()
+
+    await asyncio.sleep(0)
+    assert mock_conn.send_message.call_args_list == [call("first"), call("second")]
+
+    await player_conn.close_connection()
+    mock_conn.close_connection.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_player_connection_overflow_policies() -> None:
+    """
+    Test PlayerConnection drops the oldest frame or refuses it when the queue is full.
+    """
+    mock_conn = AsyncMock()
+    dropping = PlayerConnection(Player(id=uuid.uuid4()), mock_conn, max_queue=1)
+    await dropping.send_message("old")
+    await dropping.send_message("new")
+    assert dropping.dropped_messages == 1
+
+    await asyncio.sleep(0)
+    mock_conn.send_message.assert_called_once_with("new")
+    await dropping.stop()
+
+    strict = PlayerConnection(
+        Player(id=uuid.uuid4()), AsyncMock(), max_queue=1, overflow_policy="disconnect"
+    )
+    await strict.send_message("old")
+    with pytest.raises(OutboundQueueFullError):
+        await strict.send_message("new")
+    await strict.stop()
+
+
+@pytest.mark.asyncio
+async def test_player_connection_flush_waits_for_queued_frames() -> None:
+    """
+    Test PlayerConnection.flush returns once every queued frame has been written.
+    """
+    written: list[str] = []
+
+    async def slow_send(message: str) -> None:
+        await asyncio.sleep(0.01)
+        written.append(message)
+
+    mock_conn = AsyncMock()
+    mock_conn.send_message.side_effect = slow_send
+    player_conn = PlayerConnection(Player(id=uuid.uuid4()), mock_conn)
+
+    for message in ("first", "second", "third"):
+        await player_conn.send_message(message)
+    await player_conn.flush(timeout=1.0)
+
+    assert written == ["first", "second", "third"]
+    await player_conn.stop()
@@ -0,0 +1,61 @@
+"""Test file for the pub/sub listener of the Redis connection manager"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.infrastructure.manager import redis_connection_manager
+from src.infrastructure.manager.redis_connection_manager import (
+    BROADCAST_CHANNEL,
+    RedisConnectionManager,
+)
+
+
+def _pubsub(*messages: Any) -> MagicMock:
+    """Returns a pub/sub stub yielding the messages, then nothing."""
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    pubsub.get_message = AsyncMock(side_effect=[*messages, *([None] * 1000)])
+    return pubsub
+
+
+@pytest.mark.asyncio
+async def test_listener_resubscribes_after_the_connection_drops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that a dropped pub/sub connection is reopened on every channel.
+    """
+    monkeypatch.setattr(redis_connection_manager, "RESUBSCRIBE_BASE_SECONDS", 0)
+    received: list[str] = []
+
+    async def on_invalidate(data: str) -> None:
+        received.append(data)
+
+    dropped = _pubsub(RedisConnectionError("Connection reset by peer"))
+    reopened = _pubsub({"channel": "invalidate", "data": "game-1"})
+    client = MagicMock()
+    client.pubsub.side_effect = [dropped, reopened]
+    manager = RedisConnectionManager(
+        client,
+        "node-a",
+        heartbeat_seconds=60,
+        channel_handlers={"invalidate": on_invalidate},
+    )
+
+    await manager.start()
+    for _ in range(50):
+        if received:
+            break
+        await asyncio.sleep(0)
+    await manager.stop()
+
+    assert received == ["game-1"]
+    dropped.aclose.assert_awaited()
+    reopened.subscribe.assert_awaited_once_with(
+        "ws:node:node-a", BROADCAST_CHANNEL, "invalidate"
+    )
@@ -0,0 +1,52 @@
+"""Test file for the Redis key layout"""
+
+import uuid
+
+from redis.crc import key_slot
+
+from src.infrastructure.redis_keys import RedisKeys
+
+
+def _game_keys(keys: RedisKeys, game_id: uuid.UUID) -> list[str]:
+    player_id = uuid.uuid4()
+    return [
+        keys.session(game_id),
+        keys.events(game_id),
+        keys.snapshot(game_id),
+        keys.stored_session(game_id),
+        keys.board(game_id),
+        keys.ships(game_id, player_id),
+        keys.hits(game_id, player_id),
+    ]
+
+
+def test_untagged_keys_keep_the_original_names() -> None:
+    """
+    Test that without hash tags the keys are the ones written before the layout.
+    """
+    keys = RedisKeys()
+    game_id, player_id = uuid.uuid4(), uuid.uuid4()
+
+    assert keys.session(game_id) == f"game:{game_id}"
+    assert keys.ships(game_id, player_id) == (
+        f"game:{game_id}:player_id:{player_id}:ships"
+    )
+    assert keys.hits(game_id, player_id) == (
+        f"game:{game_id}:player_board:{player_id}:hits"
+    )
+    assert keys.deadlines == "deadlines"
+
+
+def test_tagged_keys_of_a_game_share_one_cluster_slot() -> None:
+    """
+    Test that with hash tags every key of a game hashes to the same slot.
+    """
+    keys = RedisKeys(hash_tags=True)
+    game_id = uuid.uuid4()
+
+    slots = {key_slot(key.encode()) for key in _game_keys(keys, game_id)}
+
+    assert len(slots) == 1
+    assert key_slot(keys.deadlines.encode()) == key_slot(
+        keys.deadline_payloads.encode()
+    )
@@ -0,0 +1,230 @@
+"""Test file for the shot script run by the Redis game repository"""
+
+import uuid
+
+import fakeredis
+import pytest
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.domain.placement import validate_placement
+from src.domain.shot import ShotOutcome
+from src.infrastructure.persistence.game_repo_impl import GameRedisRepository
+from src.infrastructure.redis_keys import RedisKeys
+
+FLEET = {"destroyer": 2, "submarine": 3}
+LAYOUTS = ("hash", "binary", "json")
+
+
+def _repository(encoding: str = "hash", hash_tags: bool = False) -> GameRedisRepository:
+    """Returns a repository on an empty fake Redis storing sessions as `encoding`."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    repository = GameRedisRepository(client, RedisKeys(hash_tags))
+    repository.session_encoding = encoding
+    repository.session_cache = None
+    return repository
+
+
+async def _start_game(
+    repository: GameRedisRepository,
+    status: GameStatus = GameStatus.IN_PROGRESS,
+    with_opponent: bool = True,
+) -> tuple[GameSession, uuid.UUID, uuid.UUID]:
+    """Creates a game whose first player shoots at the opponent's fleet.
+
+    The opponent's destroyer is on A1-A2 and the submarine on C1-C3.
+    """
+    shooter, opponent = uuid.uuid4(), uuid.uuid4()
+    players = {shooter: PlayerBoard()}
+    if with_opponent:
+        players[opponent] = PlayerBoard()
+    game = GameSession(
+        game_id=uuid.uuid4(),
+        players=players,
+        current_turn=shooter,
+        status=status,
+    )
+    await repository.create_match("queue", game)
+    ships = validate_placement(
+        (("destroyer", ["A1", "A2"]), ("submarine", ["C1", "C2", "C3"])), FLEET
+    )
+    await repository.save_player_board(str(game.game_id), opponent, ships)
+    return game, shooter, opponent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", LAYOUTS)
+async def test_miss_is_logged_without_a_ship(encoding: str) -> None:
+    """
+    Test that a miss names no ship and leaves the turn to the shooter.
+    """
+    repository = _repository(encoding)
+    game, shooter, opponent = await _start_game(repository)
+
+    result = await repository.resolve_shot(game.game_id, shooter, "J10")
+
+    assert result.outcome == ShotOutcome.MISS
+    assert result.opponent_id == opponent
+    assert result.ship_id is None
+    assert result.current_turn == shooter
+    entries = await repository.redis_client.xrange(
+        repository.keys.events(game.game_id)
+    )
+    assert entries[-1][1]["r"] == "miss"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", LAYOUTS)
+async def test_hit_keeps_the_turn(encoding: str) -> None:
+    """
+    Test that a hit names the ship, does not sink it and keeps the turn.
+    """
+    repository = _repository(encoding)
+    game, shooter, opponent = await _start_game(repository)
+
+    result = await repository.resolve_shot(game.game_id, shooter, "C2")
+
+    assert result.outcome == ShotOutcome.HIT
+    assert result.opponent_id == opponent
+    assert result.ship_id == "submarine"
+    assert not result.sunk
+    assert result.current_turn == shooter
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", LAYOUTS)
+async def test_last_hit_on_a_ship_sinks_it(encoding: str) -> None:
+    """
+    Test that hitting the last afloat cell of a ship reports it sunk.
+    """
+    repository = _repository(encoding)
+    game, shooter, _ = await _start_game(repository)
+
+    first = await repository.resolve_shot(game.game_id, shooter, "A1")
+    second = await repository.resolve_shot(game.game_id, shooter, "A2")
+
+    assert first.outcome == ShotOutcome.HIT and not first.sunk
+    assert second.outcome == ShotOutcome.HIT
+    assert second.ship_id == "destroyer"
+    assert second.sunk
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", LAYOUTS)
+async def test_sinking_the_fleet_finishes_the_game(encoding: str) -> None:
+    """
+    Test that sinking the last ship ends the game in the stored session.
+    """
+    repository = _repository(encoding)
+    game, shooter, _ = await _start_game(repository)
+
+    for target in ("A1", "A2", "C1", "C2"):
+        result = await repository.resolve_shot(game.game_id, shooter, target)
+        assert result.outcome == ShotOutcome.HIT
+    result = await repository.resolve_shot(game.game_id, shooter, "C3")
+
+    assert result.outcome == ShotOutcome.GAME_OVER
+    assert result.ship_id == "submarine"
+    assert result.sunk
+    session = await repository.load_game_session(game.game_id)
+    assert session is not None
+    assert session.status == GameStatus.FINISHED
+    assert session.end_datetime > 0
+
+
+@pytest.mark.asyncio
+async def test_shot_out_of_turn_is_refused() -> None:
+    """
+    Test that the player whose turn it is not cannot shoot.
+    """
+    repository = _repository()
+    game, shooter, opponent = await _start_game(repository)
+
+    result = await repository.resolve_shot(game.game_id, opponent, "A1")
+
+    assert result.outcome == ShotOutcome.NOT_YOUR_TURN
+    assert result.current_turn == shooter
+    assert result.is_error
+
+
+@pytest.mark.asyncio
+async def test_shot_before_the_game_starts_is_refused() -> None:
+    """
+    Test that a game still placing ships does not take shots.
+    """
+    repository = _repository()
+    game, shooter, _ = await _start_game(repository, GameStatus.PLACE_SHIP)
+
+    result = await repository.resolve_shot(game.game_id, shooter, "A1")
+
+    assert result.outcome == ShotOutcome.GAME_NOT_ACTIVE
+
+
+@pytest.mark.asyncio
+async def test_shot_without_an_opponent_is_refused() -> None:
+    """
+    Test that a game with a single player has no board to shoot at.
+    """
+    repository = _repository()
+    game, shooter, _ = await _start_game(repository, with_opponent=False)
+
+    result = await repository.resolve_shot(game.game_id, shooter, "A1")
+
+    assert result.outcome == ShotOutcome.NO_OPPONENT
+
+
+@pytest.mark.asyncio
+async def test_repeat_shot_on_a_hit_cell_records_nothing() -> None:
+    """
+    Test that shooting a cell already hit is refused and logs no event.
+    """
+    repository = _repository()
+    game, shooter, _ = await _start_game(repository)
+    events_key = repository.keys.events(game.game_id)
+
+    await repository.resolve_shot(game.game_id, shooter, "A1")
+    await repository.resolve_shot(game.game_id, shooter, "A2")
+    logged = await repository.redis_client.xlen(events_key)
+    result = await repository.resolve_shot(game.game_id, shooter, "A2")
+
+    assert result.outcome == ShotOutcome.ALREADY_HIT
+    assert not result.sunk
+    assert result.is_error
+    assert await repository.redis_client.xlen(events_key) == logged
+
+
+@pytest.mark.asyncio
+async def test_shot_is_appended_to_the_event_stream() -> None:
+    """
+    Test that a resolved shot is logged with its cell and outcome.
+    """
+    repository = _repository()
+    game, shooter, _ = await _start_game(repository)
+
+    await repository.resolve_shot(game.game_id, shooter, "A1")
+
+    entries = await repository.redis_client.xrange(
+        repository.keys.events(game.game_id)
+    )
+    _, fields = entries[-1]
+    assert fields["t"] == "shot"
+    assert fields["p"] == str(shooter)
+    assert fields["c"] == "A1"
+    assert fields["r"] == "hit"
+    assert fields["s"] == "destroyer"
+
+
+@pytest.mark.asyncio
+async def test_cluster_shot_uses_the_declared_board_keys() -> None:
+    """
+    Test that on a cluster the board keys named by the caller are shot at.
+    """
+    repository = _repository(hash_tags=True)
+    repository.cluster = True
+    game, shooter, opponent = await _start_game(repository)
+
+    hit = await repository.resolve_shot(game.game_id, shooter, "A1")
+    repeat = await repository.resolve_shot(game.game_id, shooter, "A1")
+
+    assert hit.outcome == ShotOutcome.HIT
+    assert hit.opponent_id == opponent
+    assert repeat.outcome == ShotOutcome.ALREADY_HIT
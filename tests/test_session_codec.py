@@ -0,0 +1,75 @@
+"""Test file for the binary game session encoding"""
+
+import uuid
+
+import pytest
+
+from src.domain.game import GameSession, GameStatus, PlayerBoard
+from src.infrastructure import codec
+from src.infrastructure.persistence.session_codec import (
+    decode_session,
+    encode_session,
+    session_field_values,
+    session_from_fields,
+    session_to_fields,
+)
+
+
+def _session() -> GameSession:
+    first, second = uuid.uuid4(), uuid.uuid4()
+    return GameSession(
+        game_id=uuid.uuid4(),
+        start_datetime=1_700_000_000,
+        players={
+            first: PlayerBoard(board={"destroyer": ["O14", "O15"]}),
+            second: PlayerBoard(),
+        },
+        current_turn=second,
+        status=GameStatus.IN_PROGRESS,
+    )
+
+
+def test_session_round_trips_through_the_binary_layout() -> None:
+    """
+    Test that a session decodes to an equal session and fits in far fewer bytes.
+    """
+    game = _session()
+
+    encoded = encode_session(game)
+
+    assert decode_session(encoded) == game
+    assert len(encoded) < len(codec.dumps(game.to_serializable_dict())) / 2
+    game.current_turn = None
+    assert decode_session(encode_session(game)).current_turn is None
+
+
+def test_decode_session_reads_legacy_json_and_rejects_unknown_versions() -> None:
+    """
+    Test that sessions stored as JSON before the binary layout still load.
+    """
+    game = _session()
+    stored = codec.dumps(game.to_serializable_dict())
+
+    assert decode_session(stored) == game
+    assert decode_session(stored.decode()) == game
+    with pytest.raises(ValueError):
+        decode_session(b"\x09" + encode_session(game)[1:])
+
+
+def test_session_round_trips_through_hash_fields() -> None:
+    """
+    Test that a session rebuilds from its hash fields and a turn flip is one field.
+    """
+    game = _session()
+
+    fields = {key: str(value) for key, value in session_to_fields(game).items()}
+
+    assert session_from_fields(game.game_id, fields) == game
+    assert session_field_values(game, ["current_turn"]) == {
+        "turn": str(game.current_turn)
+    }
+    game.players = {player_id: PlayerBoard() for player_id in game.players}
+    game.current_turn = None
+    fields = {key: str(value) for key, value in session_to_fields(game).items()}
+    assert "boards" not in fields
+    assert session_from_fields(game.game_id, fields) == game
@@ -0,0 +1,76 @@
+"""Test file for the spectator fan-out of the connection manager"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from src.application.repositories.connection_protocol import ConnectionProtocol
+from src.domain.player import Player
+from src.infrastructure.connection.player_connection import PlayerConnection
+from src.infrastructure.manager.connection_manager import ConnectionManager
+
+
+class RecordingConnection(ConnectionProtocol):
+    """Keeps every frame written to it."""
+
+    def __init__(self) -> None:
+        self.frames: list[str] = []
+
+    async def send_message(self, message: str) -> None:
+        self.frames.append(message)
+
+    async def close_connection(self) -> None:
+        pass
+
+
+async def _connect(manager: ConnectionManager) -> tuple[uuid.UUID, RecordingConnection]:
+    player_id = uuid.uuid4()
+    connection = RecordingConnection()
+    await manager.add_player(PlayerConnection(Player(id=player_id), connection))
+    return player_id, connection
+
+
+@pytest.mark.asyncio
+async def test_spectator_frames_are_serialized_once_per_game() -> None:
+    """
+    Test that every watcher of a game gets the same frame and other games get none.
+    """
+    manager = ConnectionManager()
+    game_a, game_b = uuid.uuid4(), uuid.uuid4()
+    watchers = [await _connect(manager) for _ in range(3)]
+    other_id, other = await _connect(manager)
+    for player_id, _ in watchers:
+        await manager.add_spectator(game_a, player_id)
+    await manager.add_spectator(game_b, other_id)
+
+    await manager.publish_to_spectators(game_a, {"action": "spectate_shot"})
+    await asyncio.sleep(0)
+
+    frames = [connection.frames for _, connection in watchers]
+    assert all(len(received) == 1 for received in frames)
+    assert all(received[0] is frames[0][0] for received in frames)
+    assert other.frames == []
+    assert manager.spectator_count(game_a) == 3
+
+
+@pytest.mark.asyncio
+async def test_disconnect_and_switch_leave_the_spectator_set() -> None:
+    """
+    Test that a disconnected or switching spectator stops receiving the old game.
+    """
+    manager = ConnectionManager()
+    game_a, game_b = uuid.uuid4(), uuid.uuid4()
+    leaving_id, _ = await _connect(manager)
+    switching_id, switching = await _connect(manager)
+    await manager.add_spectator(game_a, leaving_id)
+    await manager.add_spectator(game_a, switching_id)
+
+    await manager.remove_player(leaving_id)
+    await manager.add_spectator(game_b, switching_id)
+    await manager.publish_to_spectators(game_a, "frame")
+    await asyncio.sleep(0)
+
+    assert game_a not in manager.spectators
+    assert switching.frames == []
+    assert manager.spectator_count() == 1
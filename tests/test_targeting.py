@@ -0,0 +1,73 @@
+"""Test file for the bot targeting model"""
+
+import random
+
+import pytest
+
+from src.domain.board import CELL_INDEX
+from src.domain.targeting import TargetingModel, random_fleet
+
+FLEET = {"carrier": 5, "battleship": 4, "cruiser": 3, "submarine": 3, "destroyer": 2}
+
+
+def test_targeting_model_switches_to_target_mode_after_a_hit() -> None:
+    """
+    Test that after an isolated hit the next shot is a neighbouring cell.
+    """
+    model = TargetingModel(FLEET, random.Random(1))
+    model.record("H8", True, "destroyer")
+
+    assert model.mode == "target"
+    assert model.next_target() in {"G8", "I8", "H7", "H9"}
+
+
+def test_targeting_model_sinks_a_random_fleet() -> None:
+    """
+    Test that the model sinks a randomly placed fleet well before trying every cell.
+    """
+    rng = random.Random(7)
+    layout = random_fleet(FLEET, rng)
+    occupied = [cell for cells in layout.values() for cell in cells]
+    assert len(set(occupied)) == sum(FLEET.values())
+
+    ship_at = {cell: ship for ship, cells in layout.items() for cell in cells}
+    afloat = {ship: len(cells) for ship, cells in layout.items()}
+    model = TargetingModel(FLEET, rng)
+    shots = 0
+    while any(afloat.values()):
+        target = model.next_target()
+        assert target in CELL_INDEX
+        shots += 1
+        ship = ship_at.get(target)
+        if ship is None:
+            model.record(target, False)
+            continue
+        afloat[ship] -= 1
+        model.record(target, True, ship, afloat[ship] == 0)
+
+    assert model.mode == "hunt"
+    assert shots < 150
+
+
+def test_numpy_and_bitmask_scorers_agree() -> None:
+    """
+    Test that the NumPy scorer returns the bitmask scorer's densities on every shot.
+    """
+    pytest.importorskip("numpy")
+    rng = random.Random(11)
+    layout = random_fleet(FLEET, rng)
+    ship_at = {cell: ship for ship, cells in layout.items() for cell in cells}
+    afloat = {ship: len(cells) for ship, cells in layout.items()}
+    bitmask = TargetingModel(FLEET, random.Random(3), use_numpy=False)
+    numpy_model = TargetingModel(FLEET, random.Random(3), use_numpy=True)
+
+    while any(afloat.values()):
+        assert numpy_model.density() == bitmask.density()
+        target = bitmask.next_target()
+        ship = ship_at.get(target)
+        sunk = False
+        if ship is not None:
+            afloat[ship] -= 1
+            sunk = afloat[ship] == 0
+        for model in (bitmask, numpy_model):
+            model.record(target, ship is not None, ship, sunk)
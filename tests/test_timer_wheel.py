@@ -0,0 +1,25 @@
+"""Test file for the hierarchical timer wheel"""
+
+from src.infrastructure.timer_wheel import TimerWheel
+
+
+def test_timer_wheel_fires_due_timers_across_levels() -> None:
+    """
+    Test that TimerWheel expires timers on time, including ones cascaded down
+    from higher levels, and honours rescheduling and cancellation.
+    """
+    wheel = TimerWheel(tick_seconds=1.0, wheel_size=4, levels=3, now=0.0)
+    wheel.schedule("soon", 2.0)
+    wheel.schedule("later", 13.0)
+    wheel.schedule("cancelled", 5.0)
+    wheel.schedule("moved", 3.0)
+    wheel.schedule("moved", 40.0)
+    assert wheel.cancel("cancelled")
+    assert len(wheel) == 3
+
+    assert [timer.key for timer in wheel.advance(1.5)] == []
+    assert [timer.key for timer in wheel.advance(2.0)] == ["soon"]
+    assert [timer.key for timer in wheel.advance(12.9)] == []
+    assert [timer.key for timer in wheel.advance(13.0)] == ["later"]
+    assert [timer.key for timer in wheel.advance(100.0)] == ["moved"]
+    assert len(wheel) == 0